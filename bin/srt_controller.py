@@ -7,9 +7,14 @@ Sends Instructions to the SRT via the Command Line
 
 import zmq
 import argparse
+import csv
 import json
 from pathlib import Path
-from time import sleep
+from time import sleep, time
+from datetime import datetime, timezone
+
+from srt.script_compiler import PlanEstimator, compile_script, ephemeris_locator
+from srt.status_protocol import STATUS_QUERY_PORT, encode_message, decode_message
 
 
 def status(args):
@@ -25,15 +30,17 @@ def status(args):
     None
     """
     context = zmq.Context()
-    socket = context.socket(zmq.SUB)
+    socket = context.socket(zmq.REQ)
+    socket.setsockopt(zmq.LINGER, 0)
     socket.connect(f"tcp://{args.host}:%s" % args.port)
-    socket.subscribe("")
+    socket.send(encode_message({"request": "snapshot"}))
     poller = zmq.Poller()
     poller.register(socket, zmq.POLLIN)
     socks = dict(poller.poll(1000))
     if socket in socks and socks[socket] == zmq.POLLIN:
-        rec = socket.recv()
-        dump = json.loads(rec)
+        snapshot = decode_message(socket.recv())
+        dump = snapshot["status"]
+        dump["time"] = snapshot["time"]
         if args.status_parameter in dump:
             dump = dump[args.status_parameter]
         print(json.dumps(dump, sort_keys=True, indent=4))
@@ -42,6 +49,40 @@ def status(args):
     socket.close()
 
 
+def logs(args):
+    """Displays the SRT Log Entries After a Sequence Number
+
+    Parameters
+    ----------
+    args
+        argparse Arguments to Function
+
+    Returns
+    -------
+    None
+    """
+    context = zmq.Context()
+    socket = context.socket(zmq.REQ)
+    socket.setsockopt(zmq.LINGER, 0)
+    socket.connect(f"tcp://{args.host}:%s" % args.port)
+    socket.send(
+        encode_message({"request": "logs", "since": args.since, "limit": args.limit})
+    )
+    poller = zmq.Poller()
+    poller.register(socket, zmq.POLLIN)
+    socks = dict(poller.poll(1000))
+    if socket in socks and socks[socket] == zmq.POLLIN:
+        reply = decode_message(socket.recv())
+        for entry in reply["entries"]:
+            log_time = datetime.fromtimestamp(entry["time"]).strftime("%Y-%m-%d %H:%M:%S")
+            print(
+                f"{entry['seq']} {log_time} [{entry['level'].upper()}]: {entry['message']}"
+            )
+    else:
+        print("SRT Daemon Not Online")
+    socket.close()
+
+
 def command(args):
     """Sends a Command to the SRT
 
@@ -66,8 +107,91 @@ def command(args):
     socket.close()
 
 
+def load_object_names(config_dir):
+    """Reads the Names of the Objects in a Config Directory's sky_coords.csv
+
+    Parameters
+    ----------
+    config_dir : Path
+        Path to the SRT Config Directory
+
+    Returns
+    -------
+    list(str) or None
+        Object Names, Including the Sun and Moon, or None if There is no Catalog
+    """
+    catalog_path = Path(config_dir, "sky_coords.csv")
+    if not catalog_path.is_file():
+        return None
+    with open(catalog_path, "r") as catalog_file:
+        names = [row["name"] for row in csv.DictReader(catalog_file)]
+    return names + ["Sun", "Moon"]
+
+
+def print_plan(config_dir, config_dict, commands, start_time, slew_rate):
+    """Prints the Predicted Timeline of a Compiled Command File
+
+    Parameters
+    ----------
+    config_dir : Path
+        Path to the SRT Config Directory
+    config_dict : dict
+        Configuration Dictionary (Output of YAML Parser)
+    commands : list(ScriptCommand)
+        Compiled Commands
+    start_time : float
+        Unix Time the Command File Starts
+    slew_rate : float
+        Degrees per Second Each Motor Axis Moves, Without a Learned Slew Model
+
+    Returns
+    -------
+    None
+    """
+    try:
+        from srt.daemon.utilities.object_tracker import EphemerisTracker
+
+        station = config_dict["STATION"]
+        tracker = EphemerisTracker(
+            station["latitude"],
+            station["longitude"],
+            config_file=str(Path(config_dir, "sky_coords.csv").absolute()),
+            auto_download=False,
+        )
+        locate = ephemeris_locator(tracker)
+    except (ModuleNotFoundError, KeyError, FileNotFoundError) as e:
+        print(f"Object Positions Unavailable ({e}), Slews to Objects Not Estimated")
+        locate = None
+    from srt.daemon.rotor_control.slew_model import SlewModel
+
+    slew_model = SlewModel.load(config_dir, config_dict["MOTOR_TYPE"])
+    estimator = PlanEstimator(config_dict, locate, slew_rate, slew_model)
+    steps = estimator.estimate(commands, start_time)
+    totals = {"slew": 0.0, "settle": 0.0, "integration": 0.0, "wait": 0.0}
+    for step in steps:
+        start = datetime.fromtimestamp(step.start, timezone.utc)
+        print(
+            f"{start:%Y-%m-%d %H:%M:%S} {step.duration:9.1f} s  "
+            f"line {step.command.line_number}: {step.command.text}"
+        )
+        for warning in step.warnings:
+            print(f"    WARNING: {warning}")
+        for name in totals:
+            totals[name] += getattr(step, name)
+    end_time = steps[-1].end if steps else start_time
+    end = datetime.fromtimestamp(end_time, timezone.utc)
+    print(
+        f"Ends {end:%Y-%m-%d %H:%M:%S} UTC after {end_time - start_time:.1f} s: "
+        f"{totals['slew']:.1f} s slewing, {totals['settle']:.1f} s settling, "
+        f"{totals['integration']:.1f} s integrating and {totals['wait']:.1f} s waiting"
+    )
+
+
 def command_file(args):
-    """Sends All Commands in a Command File to the SRT
+    """Checks a Command File and Sends its Commands to the SRT
+
+    Every line is compiled first, and nothing is sent if any line is invalid.  With
+    --dry_run, the predicted timeline is printed instead of sending anything.
 
     Parameters
     ----------
@@ -78,13 +202,45 @@ def command_file(args):
     -------
     None
     """
+    config_dir = Path(args.config_dir).expanduser()
+    object_names = load_object_names(config_dir)
+    if object_names is None:
+        print("No sky_coords.csv Found, Object Names Will Not be Checked")
+    with open(Path(args.command_file).expanduser(), "r") as cmd_file:
+        commands, errors = compile_script(cmd_file, object_names)
+    for error in errors:
+        print(error)
+    if errors and not args.force:
+        print("Command File Not Sent, Fix the Lines Above or Use --force")
+        return
+
+    if args.dry_run:
+        # Only Dry Runs Need the Config Loader's Dependencies
+        from srt import config_loader
+
+        config_path = Path(config_dir, args.config_file_name)
+        if not config_path.is_file():
+            print("YAML Configuration File Not Found, Cannot Estimate Timeline")
+            return
+        if args.start is None:
+            start_time = time()
+        else:
+            start = datetime.strptime(args.start, "%Y:%j:%H:%M:%S")
+            start_time = start.replace(tzinfo=timezone.utc).timestamp()
+        print_plan(
+            config_dir,
+            config_loader.load_yaml(config_path),
+            commands,
+            start_time,
+            args.slew_rate,
+        )
+        return
+
     context = zmq.Context()
     socket = context.socket(zmq.PUSH)
     socket.connect(f"tcp://{args.host}:%s" % args.port)
-    with open(Path(args.command_file).expanduser(), "r") as cmd_file:
-        for cmd_line in cmd_file:
-            cmd_line = cmd_line.strip()
-            socket.send_string(cmd_line)
+    for cmd in commands:
+        socket.send_string(cmd.text)
     sleep(0.1)
     socket.close()
 
@@ -107,20 +263,51 @@ if __name__ == "__main__":
         "--host",
         metavar="host",
         type=str,
-        help="The Host of the SRT Status Publisher",
+        help="The Host of the SRT Status Query Socket",
         default="localhost",
     )
     sp_status.add_argument(
         "--port",
         metavar="port",
         type=int,
-        help="The Port of the SRT Status Publisher",
-        default=5555,
+        help="The Port of the SRT Status Query Socket",
+        default=STATUS_QUERY_PORT,
     )
     sp_status.set_defaults(
         func=status,
     )
 
+    sp_logs = sp.add_parser("logs", help="Gets the SRT Log Entries")
+    sp_logs.add_argument(
+        "--since",
+        metavar="since",
+        type=int,
+        help="Only Show Entries After This Sequence Number",
+        default=0,
+    )
+    sp_logs.add_argument(
+        "--limit",
+        metavar="limit",
+        type=int,
+        help="The Maximum Number of Entries to Show",
+        default=100,
+    )
+    sp_logs.add_argument(
+        "--host",
+        metavar="host",
+        type=str,
+        help="The Host of the SRT Status Query Socket",
+        default="localhost",
+    )
+    sp_logs.add_argument(
+        "--port",
+        metavar="port",
+        type=int,
+        help="The Port of the SRT Status Query Socket",
+        default=STATUS_QUERY_PORT,
+    )
+    sp_logs.set_defaults(func=logs)
+
     sp_command = sp.add_parser("command", help="Sends a SRT Command")
     sp_command.add_argument(
         "command",
@@ -168,6 +355,47 @@ if __name__ == "__main__":
         help="The Port of the SRT Command Queue",
         default=5556,
     )
+    sp_command_file.add_argument(
+        "--config_dir",
+        metavar="config_dir",
+        type=str,
+        help="The Path to the SRT Config Directory, for Checking Object Names",
+        default="~/.srt-config",
+    )
+    sp_command_file.add_argument(
+        "--config_file_name",
+        metavar="config_file_name",
+        type=str,
+        help="The filename of the Config File, for Estimating the Timeline",
+        default="config.yaml",
+    )
+    sp_command_file.add_argument(
+        "--dry_run",
+        dest="dry_run",
+        action="store_true",
+        help="Print the Predicted Timeline Instead of Sending the Commands",
+    )
+    sp_command_file.add_argument(
+        "--start",
+        metavar="start",
+        type=str,
+        help="UTC Start of the Dry Run as Year:DayOfYear:H:M:S, Defaulting to Now",
+        default=None,
+    )
+    sp_command_file.add_argument(
+        "--slew_rate",
+        metavar="slew_rate",
+        type=float,
+        help="Degrees per Second Each Motor Axis Moves, for the Dry Run "
+        "Until the Daemon Has Learned slew_model.json",
+        default=1.0,
+    )
+    sp_command_file.add_argument(
+        "--force",
+        dest="force",
+        action="store_true",
+        help="Send the Valid Commands Even if Some Lines are Invalid",
+    )
     sp_command_file.set_defaults(func=command_file)
 
     args = parser.parse_args()
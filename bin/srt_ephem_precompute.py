@@ -0,0 +1,96 @@
+#!python
+"""srt_ephem_precompute.py
+
+Precomputes an On-Disk Ephemeris Table the SRT Daemon Loads at Startup
+
+"""
+
+import argparse
+from pathlib import Path
+from time import time
+
+from srt import config_loader
+
+
+if __name__ == "__main__":
+    # Create the parser
+    my_parser = argparse.ArgumentParser(
+        description="Precomputes the AzEl and vlsr of Every Tracked Object for a Night"
+    )
+
+    # Add the arguments
+    my_parser.add_argument(
+        "--config_dir",
+        metavar="config_dir",
+        type=str,
+        help="The Path to the SRT Config Directory",
+        default="~/.srt-config",
+    )
+    my_parser.add_argument(
+        "--config_file_name",
+        metavar="config_file_name",
+        type=str,
+        help="The filename of the Config File to Load",
+        default="config.yaml",
+    )
+    my_parser.add_argument(
+        "--start",
+        metavar="start",
+        type=float,
+        help="Unix Time of the Start of the Table (Defaults to Now)",
+        default=None,
+    )
+    my_parser.add_argument(
+        "--hours",
+        metavar="hours",
+        type=float,
+        help="Number of Hours Covered by the Table",
+        default=14.0,
+    )
+    my_parser.add_argument(
+        "--cadence",
+        metavar="cadence",
+        type=float,
+        help="Seconds Between Table Samples",
+        default=10.0,
+    )
+    # Execute the parse_args() method
+    args = my_parser.parse_args()
+
+    # Create Path Objects
+    config_dir_path = Path(args.config_dir).expanduser()
+    sky_coords_path = Path(config_dir_path, "sky_coords.csv")
+    schema_path = Path(config_dir_path, "schema.yaml")
+    config_path = Path(config_dir_path, args.config_file_name)
+
+    if not sky_coords_path.is_file():
+        print("Sky Coordinates CSV Not Found")
+        print("Please Refer to the Documentation for Creating a sky_coords.csv File")
+    elif not config_path.is_file() or not schema_path.is_file():
+        print("YAML Configuration or Schema File Not Found")
+    elif not config_loader.validate_yaml_schema(config_path, schema_path):
+        print("YAML Configuration File Invalid")
+        print("YAML did not validate against its schema file")
+    else:
+        from srt.daemon.utilities.object_tracker import EphemerisTracker
+        from srt.daemon.utilities.ephemeris_table import precompute_ephemeris_table
+
+        config_dict = config_loader.load_yaml(config_path)
+        if "STATION" in config_dict:
+            station = config_dict["STATION"]
+        else:
+            station = {"latitude": 0.0, "longitude": 0.0}
+        tracker = EphemerisTracker(
+            station["latitude"],
+            station["longitude"],
+            config_file=str(sky_coords_path.absolute()),
+        )
+        table_path = precompute_ephemeris_table(
+            tracker,
+            sky_coords_path,
+            config_dir_path,
+            time() if args.start is None else args.start,
+            args.hours * 3600.0,
+            args.cadence,
+        )
+        print(f"Wrote Ephemeris Table to {table_path}")
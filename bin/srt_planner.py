@@ -0,0 +1,195 @@
+#!python
+"""srt_planner.py
+
+Writes a Command File Visiting a List of Sources in the Order Needing the Least Slewing
+
+"""
+
+import argparse
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from time import time
+
+import numpy as np
+
+from srt import config_loader
+
+
+if __name__ == "__main__":
+    # Create the parser
+    my_parser = argparse.ArgumentParser(
+        description="Orders Sources to Minimize Slewing and Writes a Command File"
+    )
+
+    # Add the arguments
+    my_parser.add_argument(
+        "sources",
+        nargs="*",
+        metavar="sources",
+        type=str,
+        help="Names of the Sources to Observe, From sky_coords.csv",
+    )
+    my_parser.add_argument(
+        "--source_file",
+        metavar="source_file",
+        type=str,
+        help="File With One Source Name per Line, Used Along With Any Listed Sources",
+        default=None,
+    )
+    my_parser.add_argument(
+        "--config_dir",
+        metavar="config_dir",
+        type=str,
+        help="The Path to the SRT Config Directory",
+        default="~/.srt-config",
+    )
+    my_parser.add_argument(
+        "--config_file_name",
+        metavar="config_file_name",
+        type=str,
+        help="The filename of the Config File to Load",
+        default="config.yaml",
+    )
+    my_parser.add_argument(
+        "--start",
+        metavar="start",
+        type=str,
+        help="UTC Start of the Window as Year:DayOfYear:H:M:S (Defaults to Now)",
+        default=None,
+    )
+    my_parser.add_argument(
+        "--hours",
+        metavar="hours",
+        type=float,
+        help="Length of the Observing Window in Hours",
+        default=8.0,
+    )
+    my_parser.add_argument(
+        "--dwell",
+        metavar="dwell",
+        type=float,
+        help="Seconds Spent Observing Each Source",
+        default=300.0,
+    )
+    my_parser.add_argument(
+        "--record",
+        metavar="record",
+        type=str,
+        help="File Name to Record Each Source Into, With {name} for the Source, "
+        "i.e. '{name}.fits' (Defaults to Not Recording)",
+        default=None,
+    )
+    my_parser.add_argument(
+        "--slew_rate",
+        metavar="slew_rate",
+        type=float,
+        help="Degrees per Second Each Motor Axis Moves, Until the Daemon "
+        "Has Learned slew_model.json",
+        default=1.0,
+    )
+    my_parser.add_argument(
+        "--cadence",
+        metavar="cadence",
+        type=float,
+        help="Seconds Between Computed Source Positions",
+        default=60.0,
+    )
+    my_parser.add_argument(
+        "--output",
+        metavar="output",
+        type=str,
+        help="Command File to Write (Defaults to Printing It)",
+        default=None,
+    )
+    # Execute the parse_args() method
+    args = my_parser.parse_args()
+
+    # Create Path Objects
+    config_dir_path = Path(args.config_dir).expanduser()
+    sky_coords_path = Path(config_dir_path, "sky_coords.csv")
+    config_path = Path(config_dir_path, args.config_file_name)
+
+    names = list(args.sources)
+    if args.source_file is not None:
+        with open(Path(args.source_file).expanduser(), "r") as source_file:
+            names += [line.strip() for line in source_file if line.strip()]
+
+    if not names:
+        print("No Sources Given")
+    elif not sky_coords_path.is_file():
+        print("Sky Coordinates CSV Not Found")
+        print("Please Refer to the Documentation for Creating a sky_coords.csv File")
+    elif not config_path.is_file():
+        print("YAML Configuration File Not Found")
+    else:
+        from astropy.time import Time
+        from srt.daemon.rotor_control.slew_model import SlewModel
+        from srt.daemon.utilities.object_tracker import EphemerisTracker
+        from srt.script_compiler import PlanEstimator
+        from srt.source_planner import SourcePlanner
+
+        config_dict = config_loader.load_yaml(config_path)
+        if "STATION" in config_dict:
+            station = config_dict["STATION"]
+        else:
+            station = {"latitude": 0.0, "longitude": 0.0}
+        tracker = EphemerisTracker(
+            station["latitude"],
+            station["longitude"],
+            config_file=str(sky_coords_path.absolute()),
+        )
+        unknown = [name for name in names if name not in tracker.object_names]
+        if unknown:
+            print(f"Sources Not in sky_coords.csv: {', '.join(unknown)}")
+            sys.exit(1)
+
+        if args.start is None:
+            start_time = time()
+        else:
+            start = datetime.strptime(args.start, "%Y:%j:%H:%M:%S")
+            start_time = start.replace(tzinfo=timezone.utc).timestamp()
+        num_times = int(np.ceil(args.hours * 3600.0 / args.cadence)) + 1
+        unix_times = start_time + np.arange(num_times) * args.cadence
+        az, el, _ = tracker.calculate_all_az_el_vlsr(Time(unix_times, format="unix"))
+        rows = [tracker.object_names.index(name) for name in names]
+
+        slew_model = SlewModel.load(config_dir_path, config_dict["MOTOR_TYPE"])
+        estimator = PlanEstimator(
+            config_dict, slew_rate=args.slew_rate, slew_model=slew_model
+        )
+        horizon_points = [
+            (point["azimuth"], point["elevation"])
+            for point in config_dict["HORIZON_POINTS"]
+        ]
+        planner = SourcePlanner(
+            names,
+            start_time,
+            args.cadence,
+            az[rows],
+            el[rows],
+            estimator,
+            horizon_points,
+            args.dwell,
+        )
+        schedule, total_slew = planner.plan(estimator.stow_location)
+        observed = {names[source] for source, _, _ in schedule}
+        missed = [name for name in names if name not in observed]
+        start_date = datetime.fromtimestamp(start_time, timezone.utc)
+        lines = [
+            f"* Planned by srt_planner.py for {start_date:%Y:%j:%H:%M:%S} UTC, "
+            f"{len(schedule)} Sources With {total_slew:.0f} s of Slewing",
+        ]
+        if missed:
+            lines.append(f"* Not Observable in the Window: {', '.join(missed)}")
+        lines += planner.command_lines(schedule, args.record)
+
+        if args.output is None:
+            print("\n".join(lines))
+        else:
+            with open(Path(args.output).expanduser(), "w") as output_file:
+                output_file.write("\n".join(lines) + "\n")
+            print(
+                f"Wrote {len(schedule)} of {len(names)} Sources to {args.output}, "
+                f"With {total_slew:.0f} s of Slewing"
+            )
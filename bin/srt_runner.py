@@ -12,6 +12,9 @@ from multiprocessing import Process
 from waitress import serve
 from srt import config_loader
 
+# Waitress Threads Left for the Dashboard's Own Requests
+dashboard_threads = 4
+
 
 def run_srt_daemon(configuration_dir, configuration_dict):
     from srt.daemon import daemon as srt_d
@@ -22,12 +25,19 @@ def run_srt_daemon(configuration_dir, configuration_dict):
 
 def run_srt_dashboard(configuration_dir, configuration_dict):
     from srt.dashboard import app as srt_app
+    from srt.dashboard.messaging.spectrum_stream import max_streams
 
     app_server, _ = srt_app.generate_app(configuration_dir, configuration_dict)
+    if "DASHBOARD_STREAM_MS" in configuration_dict:
+        # Each Open Stream Holds a Thread, and the Streams are Capped at max_streams
+        threads = dashboard_threads + max_streams
+    else:
+        threads = dashboard_threads
     serve(
         app_server,
         host=configuration_dict["DASHBOARD_HOST"],
         port=configuration_dict["DASHBOARD_PORT"],
+        threads=threads,
     )
 
 
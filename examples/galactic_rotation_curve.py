@@ -13,13 +13,17 @@ import numpy as np
 import json
 
 for val in range(0, 100, 10):
-    hdul = fits.open(f"./g{str(val).zfill(2)}.fits")
-    averaged = np.zeros(len(hdul[0].data))
-    num = 0
-    for hdu in hdul:
-        averaged += hdu.data
-        num += 1
-    averaged /= num
+    hdul = fits.open(f"./g{str(val).zfill(2)}.fits", memmap=True)
+    if "SPECTRA" in hdul:
+        # Recorded With RECORD_FITS_MODE: table, All Spectra are Rows of One Table
+        averaged = hdul["SPECTRA"].data["SPECTRUM"].mean(axis=0, dtype=np.float64)
+    else:
+        averaged = np.zeros(len(hdul[0].data))
+        num = 0
+        for hdu in hdul:
+            averaged += hdu.data
+            num += 1
+        averaged /= num
 
     metadata = json.loads(hdul[0].header["METADATA"])
     num_bins = metadata["num_bins"]
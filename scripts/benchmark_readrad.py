@@ -0,0 +1,154 @@
+"""benchmark_readrad.py
+
+Times load_radfile Against the Original Line by Line .rad Parser on a Generated File
+
+"""
+from srt.postprocessing.readrad import load_radfile, read_radfile, is_number
+from datetime import datetime
+from tempfile import TemporaryDirectory
+from time import perf_counter
+import pathlib
+import numpy as np
+
+# String Formatting Constants, Matching radio_save_spec_rad/save_rad_file.py
+header_format = (
+    "DATE %4d:%03d:%02d:%02d:%02d obsn %3d az %4.1f el %3.1f freq_MHz "
+    "%10.4f Tsys %6.3f Tant %6.3f vlsr %7.2f glat %6.3f glon %6.3f source %s\n"
+)
+start_format = (
+    "Fstart %8.3f fstop %8.3f spacing %8.6f bw %8.3f fbw %8.3f MHz nfreq "
+    "%d nsam %d npoint %d integ %5.0f sigma %8.3f bsw %d\n"
+)
+integration_format = "Spectrum %6.0f integration periods\n"
+number_format = "%8.3f "
+
+
+def write_test_file(path, target_bytes, nfreq=4096):
+    """Writes a .rad File of Random Spectra, One Record per Second
+
+    Parameters
+    ----------
+    path : pathlib.Path
+        File to Write
+    target_bytes : int
+        Approximate Size of the File
+    nfreq : int
+        Number of Frequency Bins per Spectrum
+
+    Returns
+    -------
+    int
+        Number of Records Written
+    """
+    line_format = number_format * nfreq + "\n"
+    num_records = max(target_bytes // (9 * nfreq), 1)
+    rng = np.random.default_rng(0)
+    with open(path, "w") as file:
+        for obsn in range(num_records):
+            minutes, second = divmod(obsn, 60)
+            hour, minute = divmod(minutes, 60)
+            file.write(
+                header_format
+                % (
+                    2020,
+                    123,
+                    hour % 24,
+                    minute,
+                    second,
+                    obsn % 1000,
+                    180.0,
+                    45.0,
+                    1420.4,
+                    100.0,
+                    5.0,
+                    10.0,
+                    0.0,
+                    30.0,
+                    "Sun",
+                )
+            )
+            file.write(
+                start_format
+                % (
+                    1419.2,
+                    1421.6,
+                    0.000586,
+                    2.4,
+                    2.4,
+                    nfreq,
+                    nfreq,
+                    nfreq,
+                    1000,
+                    0.1,
+                    0,
+                )
+            )
+            file.write(integration_format % 1000)
+            file.write(line_format % tuple(rng.normal(100, 5, nfreq).tolist()))
+    return num_records
+
+
+def read_radfile_original(filename):
+    """The Line by Line Parser That read_radfile Used Before load_radfile"""
+    with open(filename) as fp:
+        lines = fp.read().splitlines()
+
+    outdict = {}
+    for iline in lines:
+        linesp = list(filter(None, iline.split(" ")))
+        if linesp[0] == "DATE":
+            cur_dict = {
+                linesp[i]: (
+                    float(linesp[i + 1]) if is_number(linesp[i + 1]) else linesp[i + 1]
+                )
+                for i in range(0, len(linesp), 2)
+            }
+            cur_dict["DATE"] = datetime.strptime(cur_dict["DATE"], "%Y:%j:%H:%M:%S")
+        elif linesp[0] == "Fstart":
+            linesp.remove("MHz")
+            temp_dict = {
+                linesp[i]: (
+                    float(linesp[i + 1]) if is_number(linesp[i + 1]) else linesp[i + 1]
+                )
+                for i in range(0, len(linesp), 2)
+            }
+            cur_dict.update(temp_dict)
+        elif linesp[0] == "Spectrum":
+            cur_dict["integrations"] = float(linesp[1])
+        elif is_number(linesp[0]):
+            cur_dict["spectrum"] = np.array(linesp).astype(float)
+            tstp = cur_dict["DATE"].timestamp()
+            del cur_dict["DATE"]
+            outdict[int(tstp)] = cur_dict
+    return outdict
+
+
+if __name__ == "__main__":
+    with TemporaryDirectory() as directory:
+        path = pathlib.Path(directory, "benchmark.rad")
+        num_records = write_test_file(path, 100 * 1024 * 1024)
+        print("%d records, %.1f MB" % (num_records, path.stat().st_size / 1024 / 1024))
+
+        start = perf_counter()
+        original = read_radfile_original(path)
+        original_time = perf_counter() - start
+
+        start = perf_counter()
+        metadata, spectra = load_radfile(path)
+        load_time = perf_counter() - start
+
+        legacy = read_radfile(path)
+        assert len(metadata) == num_records and spectra.shape[0] == num_records
+        assert original.keys() == legacy.keys()
+        for key, record in original.items():
+            assert np.array_equal(record["spectrum"], legacy[key]["spectrum"])
+            assert all(
+                record[name] == legacy[key][name]
+                for name in record
+                if name != "spectrum"
+            )
+        print("original parser: %.2f s" % original_time)
+        print(
+            "load_radfile: %.2f s (%.1fx faster)"
+            % (load_time, original_time / load_time)
+        )
@@ -0,0 +1,85 @@
+"""test_fast_transforms.py
+
+Compares the fast_transforms Approximations Against AstroPy Over a Grid of AzEl and Times
+
+"""
+from srt.daemon.utilities import fast_transforms
+from astropy.coordinates import AltAz, EarthLocation, Galactic, SkyCoord
+from astropy.time import Time
+import astropy.units as u
+import numpy as np
+
+
+def check_accuracy(latitude, longitude, unix_times, az, el):
+    """Finds the Worst Case Errors of fast_transforms Over a Grid
+
+    Parameters
+    ----------
+    latitude : float
+        Observer's Latitude in Degrees
+    longitude : float
+        Observer's Longitude in Degrees
+    unix_times : list(float)
+        Unix Times to Check, in Seconds
+    az : (N) ndarray
+        Azimuths to Check, in Degrees
+    el : (N) ndarray
+        Elevations to Check, in Degrees
+
+    Returns
+    -------
+    (float, float, float)
+        Maximum Galactic Position Error (deg), Round Trip AzEl Error (deg) and vlsr Error (km/s)
+    """
+    location = EarthLocation.from_geodetic(lat=latitude * u.deg, lon=longitude * u.deg)
+    max_position_error = 0.0
+    max_round_trip_error = 0.0
+    max_vlsr_error = 0.0
+    for unix_time in unix_times:
+        time = Time(unix_time, format="unix")
+        frame = AltAz(obstime=time, location=location)
+        observed = SkyCoord(az=az * u.deg, alt=el * u.deg, frame=frame)
+        expected = observed.transform_to(Galactic())
+        expected_vlsr = (
+            SkyCoord(expected).transform_to(frame).radial_velocity_correction()
+        ).to_value(u.km / u.s)
+
+        g_lat, g_lon = fast_transforms.azel_to_galactic(
+            az, el, latitude, longitude, unix_time
+        )
+        actual = SkyCoord(l=g_lon * u.deg, b=g_lat * u.deg, frame=Galactic())
+        max_position_error = max(
+            max_position_error, actual.separation(expected).degree.max()
+        )
+
+        new_az, new_el = fast_transforms.galactic_to_azel(
+            g_lat, g_lon, latitude, longitude, unix_time
+        )
+        round_trip = SkyCoord(az=new_az * u.deg, alt=new_el * u.deg, frame=frame)
+        max_round_trip_error = max(
+            max_round_trip_error, round_trip.separation(observed).degree.max()
+        )
+
+        vlsr = fast_transforms.vlsr_azel(az, el, latitude, longitude, unix_time)
+        max_vlsr_error = max(max_vlsr_error, np.abs(vlsr - expected_vlsr).max())
+    return max_position_error, max_round_trip_error, max_vlsr_error
+
+
+if __name__ == "__main__":
+    az_grid, el_grid = np.meshgrid(
+        np.arange(0.0, 360.0, 15.0), np.arange(5.0, 90.0, 10.0)
+    )
+    start = Time("2020-01-01T00:00:00").unix
+    times = [start + day * 86400.0 + day * 3917.0 for day in range(0, 3650, 73)]
+    for lat, lon in [(42.5, -71.5), (-33.9, 18.4), (0.0, 0.0), (69.6, 19.0)]:
+        position_error, round_trip_error, vlsr_error = check_accuracy(
+            lat, lon, times, az_grid.ravel(), el_grid.ravel()
+        )
+        print(
+            "lat %6.1f lon %6.1f: galactic %.4f deg, round trip %.4f deg, vlsr %.4f km/s"
+            % (lat, lon, position_error, round_trip_error, vlsr_error)
+        )
+        assert position_error < fast_transforms.MAX_POSITION_ERROR
+        assert round_trip_error < fast_transforms.MAX_POSITION_ERROR
+        assert vlsr_error < fast_transforms.MAX_VLSR_ERROR
+    print("All errors within the documented budget")
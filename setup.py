@@ -3,7 +3,12 @@ from pathlib import Path
 import versioneer
 
 
-scripts = ["bin/srt_controller.py", "bin/srt_runner.py"]
+scripts = [
+    "bin/srt_controller.py",
+    "bin/srt_runner.py",
+    "bin/srt_ephem_precompute.py",
+    "bin/srt_planner.py",
+]
 
 with open("README.md", "r") as fh:
     long_description = fh.read()
@@ -5,10 +5,9 @@ Main Control and Orchestration Class for the Small Radio Telescope
 """
 
 from time import sleep, time
-from datetime import timedelta, datetime
-from threading import Thread
-from queue import Queue
-from xmlrpc.client import ServerProxy
+from threading import Thread, Condition
+from queue import Queue, Empty
+from xmlrpc.client import MultiCall, ServerProxy
 from pathlib import Path
 from operator import add
 
@@ -17,15 +16,35 @@ import json
 import numpy as np
 
 from .rotor_control.rotors import Rotor
+from .rotor_control.slew_model import SlewModel
 from .radio_control.radio_task_starter import (
     RadioProcessTask,
     RadioSaveRawTask,
     RadioCalibrateTask,
     RadioSaveSpecRadTask,
     RadioSaveSpecFitsTask,
+    RadioSaveSpecArchiveTask,
+)
+from .utilities.ephemeris_table import TableEphemerisTracker
+from .utilities.command_scheduler import CommandScheduler
+from .utilities.functions import azel_within_range
+from .utilities.log_store import LogStore
+from .utilities.scan_engine import ScanEngine
+from .utilities.spectrum_cache import SpectrumCache
+from .utilities.tracking_controller import TrackingController, sky_separation
+from ..script_compiler import (
+    CommandKind,
+    parse_command,
+    seconds_until_date,
+    seconds_until_time_of_day,
+)
+from ..status_protocol import (
+    STATUS_PORT,
+    STATUS_QUERY_PORT,
+    StatusPublisherState,
+    encode_message,
+    decode_message,
 )
-from .utilities.object_tracker import EphemerisTracker
-from .utilities.functions import azel_within_range, get_spectrum
 
 
 class SmallRadioTelescopeDaemon:
@@ -88,6 +107,26 @@ class SmallRadioTelescopeDaemon:
         self.temp_sys = config_dict["TSYS"]
         self.temp_cal = config_dict["TCAL"]
         self.save_dir = config_dict["SAVE_DIRECTORY"]
+        if "SCAN_DWELL" in config_dict:
+            self.scan_dwell = config_dict["SCAN_DWELL"]
+        else:
+            self.scan_dwell = 0.0
+        if "SCAN_SETTLE" in config_dict:
+            self.scan_settle = config_dict["SCAN_SETTLE"]
+        else:
+            self.scan_settle = 0.5
+        if "TRACKING_TOLERANCE" in config_dict:
+            self.tracking_tolerance = config_dict["TRACKING_TOLERANCE"]
+        else:
+            self.tracking_tolerance = 0.05
+        if "RECORD_FITS_MODE" in config_dict:
+            self.record_fits_mode = config_dict["RECORD_FITS_MODE"]
+        else:
+            self.record_fits_mode = "hdu"
+        if "EPHEMERIS" in config_dict:
+            self.ephemeris_settings = config_dict["EPHEMERIS"]
+        else:
+            self.ephemeris_settings = {"fast_transforms": False, "refraction": False}
 
         # Generate Default Calibration Values
         # Values are Set Up so that Uncalibrated and Calibrated Spectra are the Same Values
@@ -107,33 +146,47 @@ class SmallRadioTelescopeDaemon:
                     pass
 
         # Create Helper Object Which Tracks Celestial Objects
-        self.ephemeris_tracker = EphemerisTracker(
+        # A Precomputed Table from srt_ephem_precompute.py is Used When it is Current
+        self.ephemeris_tracker = TableEphemerisTracker.load(
+            config_directory,
             self.station["latitude"],
             self.station["longitude"],
-            config_file=str(
-                Path(config_directory, "sky_coords.csv").absolute()),
+            Path(config_directory, "sky_coords.csv"),
+            use_fast_transforms=self.ephemeris_settings["fast_transforms"],
+            use_refraction=self.ephemeris_settings.get("refraction", False),
         )
+        if self.ephemeris_tracker is None:
+            self.ephemeris_tracker = self.create_ephemeris_tracker()
         self.ephemeris_locations = self.ephemeris_tracker.get_all_azimuth_elevation()
         self.ephemeris_vlsr = self.ephemeris_tracker.get_all_vlsr()
         self.ephemeris_time_locs = self.ephemeris_tracker.get_all_azel_time()
         self.current_vlsr = 0.0
         self.ephemeris_cmd_location = None
 
-        # Create Rotor Command Helper Object
+        # Create Rotor Command Helper Object, Which Refines the Saved Slew Model
+        # From Every Move it Finishes
+        self.slew_model = SlewModel.load(config_directory, self.motor_type)
         self.rotor = Rotor(
             self.motor_type,
             self.motor_port,
             self.motor_baudrate,
             self.az_limits,
             self.el_limits,
+            slew_model=self.slew_model,
         )
         print("test", self.stow_location)
+        # Notified Whenever the Rotor Location or Commanded Location Changes
+        self.rotor_condition = Condition()
         self.rotor_location = self.stow_location
         self.rotor_destination = self.stow_location
         self.rotor_offsets = (0.0, 0.0)
         self.rotor_cmd_location = tuple(
             map(add, self.rotor_destination, self.rotor_offsets)
         )
+        # Leads Tracked Objects, With an Error of Up to a Fraction of the Beamwidth
+        self.tracking_controller = TrackingController(
+            self.tracking_tolerance * self.beamwidth
+        )
 
         # Create Radio Processing Task (Wrapper for GNU Radio Script)
         self.radio_process_task = RadioProcessTask(
@@ -142,31 +195,70 @@ class SmallRadioTelescopeDaemon:
         self.radio_queue = Queue()
         self.radio_save_task = None
 
+        # Create a Long-Lived Cache of the Raw Spectra for Measurements
+        self.raw_spectrum_cache = SpectrumCache(
+            5561, lambda: self.rotor_location, name="Raw-Spectrum-Cache"
+        )
+
         # Create Object for Keeping Track of What Commands Are Running or Have Failed
         self.current_queue_item = "None"
-        self.command_queue = Queue()
-        self.command_error_logs = []
+        self.command_scheduler = CommandScheduler()
+        self.log_store = LogStore()
         self.keep_running = True
 
         # List for data that will be plotted in the app
         self.n_point_data = []
         self.beam_switch_data = []
 
-    def log_message(self, message):
-        """Writes Contents to a Logging List and Prints
+    def log_message(self, message, level="info"):
+        """Writes Contents to the Log Store and Prints
 
         Parameters
         ----------
         message : str
             Message to Log and Print
+        level : str
+            Severity Level of the Message ('debug', 'info', 'warning' or 'error')
 
         Returns
         -------
         None
         """
-        self.command_error_logs.append((time(), message))
+        self.log_store.append(message, level)
         print(message)
 
+    def get_integration_time(self):
+        """Calculates the Seconds of Samples Integrated Into Each Spectrum
+
+        Returns
+        -------
+        float
+            Integration Time in Seconds
+        """
+        return (
+            self.radio_num_bins * self.radio_integ_cycles / self.radio_sample_frequency
+        )
+
+    def calculate_power(self, spectrum):
+        """Converts a Raw Spectrum Into a Calibrated Total Power
+
+        Parameters
+        ----------
+        spectrum : (N) ndarray or None
+            Raw Spectrum, or None if None Was Received
+
+        Returns
+        -------
+        float
+            Power in Kelvin, or NaN Without a Spectrum
+        """
+        if spectrum is None:
+            self.log_message("No Settled Spectrum Received", "warning")
+            return float("nan")
+        p = np.sum(spectrum)
+        a = len(spectrum)
+        return float((self.temp_sys + self.temp_cal) * p / (a * self.cal_power))
+
     def n_point_scan(self, object_id):
         """Runs an N-Point (25) Scan About an Object
 
@@ -189,8 +281,12 @@ class SmallRadioTelescopeDaemon:
         rotor_loc = []
         pwr_list = []
         #
-        scan_center = self.ephemeris_locations[object_id]
+        scan_center = self.ephemeris_tracker.get_azimuth_elevation(object_id)
         np_sides = [5, 5]
+        # Spectra Arriving While Slewing are Timestamped so Only Settled Ones are Used
+        scan_engine = ScanEngine(
+            self.raw_spectrum_cache, self.get_integration_time(), self.scan_dwell
+        )
         for scan in range(N_pnt_default):
             self.log_message(
                 "{0} of {1} point scan.".format(scan, N_pnt_default))
@@ -206,16 +302,16 @@ class SmallRadioTelescopeDaemon:
 
             new_rotor_offsets = (az_dif, el_dif)
 
+            start_location = self.rotor_location
+            command_time = time()
             if self.rotor.angles_within_bounds(*scan_center):
                 self.rotor_destination = scan_center
                 self.point_at_offset(*new_rotor_offsets)
             rotor_loc.append(self.rotor_location)
-            sleep(5)
-            raw_spec = get_spectrum(port=5561)
-            p = np.sum(raw_spec)
-            a = len(raw_spec)
-            pwr = (self.temp_sys + self.temp_cal) * p / (a * self.cal_power)
-            pwr_list.append(pwr)
+            raw_spec = scan_engine.measure(
+                self.predict_settled_time(start_location, command_time)
+            )
+            pwr_list.append(self.calculate_power(raw_spec))
         maxdiff = (az_dif, el_dif)
         self.n_point_data = [scan_center, maxdiff,
                              rotor_loc, pwr_list, np_sides]
@@ -242,24 +338,27 @@ class SmallRadioTelescopeDaemon:
         cur_vlsr = self.ephemeris_vlsr[object_id]
         self.radio_queue.put(("vlsr", float(cur_vlsr)))
         self.current_vlsr = cur_vlsr
-        new_rotor_destination = self.ephemeris_locations[object_id]
+        new_rotor_destination = self.ephemeris_tracker.get_azimuth_elevation(object_id)
         rotor_loc = []
         pwr_list = []
+        scan_engine = ScanEngine(
+            self.raw_spectrum_cache, self.get_integration_time(), self.scan_dwell
+        )
         for j in range(0, 3 * self.num_beamswitches):
             self.radio_queue.put(("beam_switch", j + 1))
             az_dif_scalar = np.cos(new_rotor_destination[1] * np.pi / 180.0)
             az_dif = (j % 3 - 1) * self.beamwidth / az_dif_scalar
             new_rotor_offsets = (az_dif, 0)
+            start_location = self.rotor_location
+            command_time = time()
             if self.rotor.angles_within_bounds(*new_rotor_destination):
                 self.rotor_destination = new_rotor_destination
                 self.point_at_offset(*new_rotor_offsets)
             rotor_loc.append(self.rotor_location)
-            sleep(5)
-            raw_spec = get_spectrum(port=5561)
-            p = np.sum(raw_spec)
-            a = len(raw_spec)
-            pwr = (self.temp_sys + self.temp_cal) * p / (a * self.cal_power)
-            pwr_list.append(pwr)
+            raw_spec = scan_engine.measure(
+                self.predict_settled_time(start_location, command_time)
+            )
+            pwr_list.append(self.calculate_power(raw_spec))
         self.rotor_offsets = (0.0, 0.0)
         self.radio_queue.put(("beam_switch", 0))
         self.ephemeris_cmd_location = object_id
@@ -283,15 +382,15 @@ class SmallRadioTelescopeDaemon:
         cur_vlsr = self.ephemeris_vlsr[object_id]
         self.radio_queue.put(("vlsr", float(cur_vlsr)))
         self.current_vlsr = cur_vlsr
-        new_rotor_cmd_location = self.ephemeris_locations[object_id]
+        new_rotor_cmd_location = self.ephemeris_tracker.get_azimuth_elevation(
+            object_id
+        )
         if self.rotor.angles_within_bounds(*new_rotor_cmd_location):
             self.ephemeris_cmd_location = object_id
-            self.rotor_destination = new_rotor_cmd_location
-            self.rotor_cmd_location = new_rotor_cmd_location
-            while not azel_within_range(self.rotor_location, self.rotor_cmd_location):
-                sleep(0.1)
+            self.set_rotor_cmd_location(new_rotor_cmd_location, new_rotor_cmd_location)
+            self.wait_for_rotor()
         else:
-            self.log_message(f"Object {object_id} Not in Motor Bounds")
+            self.log_message(f"Object {object_id} Not in Motor Bounds", "warning")
             self.ephemeris_cmd_location = None
 
     def point_at_azel(self, az, el):
@@ -323,13 +422,11 @@ class SmallRadioTelescopeDaemon:
         new_rotor_destination = (az, el)
         new_rotor_cmd_location = new_rotor_destination
         if self.rotor.angles_within_bounds(*new_rotor_cmd_location):
-            self.rotor_destination = new_rotor_destination
-            self.rotor_cmd_location = new_rotor_cmd_location
-            while not azel_within_range(self.rotor_location, self.rotor_cmd_location):
-                sleep(0.1)
+            self.set_rotor_cmd_location(new_rotor_cmd_location, new_rotor_destination)
+            self.wait_for_rotor()
         else:
             self.log_message(
-                f"Object at {new_rotor_cmd_location} Not in Motor Bounds")
+                f"Object at {new_rotor_cmd_location} Not in Motor Bounds", "warning")
 
     def point_at_offset(self, az_off, el_off):
         """From the Current Object or Position Pointed At, Move to an Offset of That Location
@@ -351,11 +448,10 @@ class SmallRadioTelescopeDaemon:
         )
         if self.rotor.angles_within_bounds(*new_rotor_cmd_location):
             self.rotor_offsets = new_rotor_offsets
-            self.rotor_cmd_location = new_rotor_cmd_location
-            while not azel_within_range(self.rotor_location, self.rotor_cmd_location):
-                sleep(0.1)
+            self.set_rotor_cmd_location(new_rotor_cmd_location)
+            self.wait_for_rotor()
         else:
-            self.log_message(f"Offset {new_rotor_offsets} Out of Bounds")
+            self.log_message(f"Offset {new_rotor_offsets} Out of Bounds", "warning")
 
     def stow(self):
         """Moves the Antenna Back to Its Stow Location
@@ -367,10 +463,8 @@ class SmallRadioTelescopeDaemon:
         self.ephemeris_cmd_location = None
         self.radio_queue.put(("soutrack", "at_stow"))
         self.rotor_offsets = (0.0, 0.0)
-        self.rotor_destination = self.stow_location
-        self.rotor_cmd_location = self.stow_location
-        while not azel_within_range(self.rotor_location, self.rotor_cmd_location):
-            sleep(0.1)
+        self.set_rotor_cmd_location(self.stow_location, self.stow_location)
+        self.wait_for_rotor()
 
     def calibrate(self):
         """Runs Calibration Processing and Pushes New Values to Processing Script
@@ -379,8 +473,10 @@ class SmallRadioTelescopeDaemon:
         -------
         None
         """
-        sleep(
-            self.radio_num_bins * self.radio_integ_cycles / self.radio_sample_frequency
+        # Wait for a Spectrum Integrated Entirely After the Command Started
+        integration_time = self.get_integration_time()
+        self.raw_spectrum_cache.wait_since(
+            time() + integration_time, timeout=2 * integration_time + 5.0
         )
         radio_cal_task = RadioCalibrateTask(
             self.radio_num_bins,
@@ -424,11 +520,32 @@ class SmallRadioTelescopeDaemon:
                 )
             elif name.endswith(".fits"):
                 name = None if name == "*.fits" else name
+                if (
+                    name is not None
+                    and self.record_fits_mode == "table"
+                    and Path(self.save_dir, name).expanduser().exists()
+                ):
+                    # Table Mode Writes a New File, and Cannot Add to an Old One
+                    self.log_message(
+                        f"Cannot Start Recording - {name} Already Exists", "warning"
+                    )
+                    return
                 self.radio_save_task = RadioSaveSpecFitsTask(
                     self.radio_sample_frequency,
                     self.radio_num_bins,
                     self.save_dir,
                     name,
+                    self.record_fits_mode,
+                )
+            elif name.endswith(".h5") or name.endswith(".zarr"):
+                file_format = "zarr" if name.endswith(".zarr") else "h5"
+                name = None if name in ("*.h5", "*.zarr") else name
+                self.radio_save_task = RadioSaveSpecArchiveTask(
+                    self.radio_sample_frequency,
+                    self.radio_num_bins,
+                    self.save_dir,
+                    name,
+                    file_format,
                 )
             else:
                 self.radio_save_task = RadioSaveRawTask(
@@ -436,7 +553,7 @@ class SmallRadioTelescopeDaemon:
                 )
             self.radio_save_task.start()
         else:
-            self.log_message("Cannot Start Recording - Already Recording")
+            self.log_message("Cannot Start Recording - Already Recording", "warning")
 
     def stop_recording(self):
         """Stops Any Current Recording, if Running
@@ -466,6 +583,26 @@ class SmallRadioTelescopeDaemon:
             ("freq", self.radio_center_frequency + self.radio_frequency_correction)
         )  # Push Update to GNU Radio
 
+    def create_ephemeris_tracker(self):
+        """Creates an AstroPy Based EphemerisTracker for the Station and sky_coords.csv
+
+        Returns
+        -------
+        EphemerisTracker
+            Tracker Calculating Object Positions Using AstroPy
+        """
+        # Imported Here so AstroPy is Only Loaded if There is no Ephemeris Table
+        from .utilities.object_tracker import EphemerisTracker
+
+        return EphemerisTracker(
+            self.station["latitude"],
+            self.station["longitude"],
+            config_file=str(
+                Path(self.config_directory, "sky_coords.csv").absolute()),
+            use_fast_transforms=self.ephemeris_settings["fast_transforms"],
+            use_refraction=self.ephemeris_settings.get("refraction", False),
+        )
+
     def set_coords(self, lat, long, config_directory="config/sky_coords.csv", name=None):
         """Set the lat/long coordinates of observer location
 
@@ -487,11 +624,15 @@ class SmallRadioTelescopeDaemon:
         self.station = {"latitude": lat,
                         "longitude": long,
                         "name": name}
+        from .utilities.object_tracker import EphemerisTracker
+
         self.ephemeris_tracker = EphemerisTracker(
             self.station["latitude"],
             self.station["longitude"],
             # config_file=str(
             #     Path(config_directory, "sky_coords.csv").absolute()),
+            use_fast_transforms=self.ephemeris_settings["fast_transforms"],
+            use_refraction=self.ephemeris_settings.get("refraction", False),
         )
         # self.radio_queue.put((""))
 
@@ -535,19 +676,17 @@ class SmallRadioTelescopeDaemon:
             az, el = self.ephemeris_tracker.az_el_dict[name][0], self.ephemeris_tracker.az_el_dict[name][1]
             self.log_message(f"here {az,el}")
 
-        self.rotor_location = (az, el)
+        self.set_rotor_location((az, el))
 
         self.rotor_offsets = (0.0, 0.0)
 
         new_rotor_cmd_location = (az, el)
         if self.rotor.angles_within_bounds(*new_rotor_cmd_location):
             self.ephemeris_cmd_location = name
-            self.rotor_destination = new_rotor_cmd_location
-            self.rotor_cmd_location = new_rotor_cmd_location
-            while not azel_within_range(self.rotor_location, self.rotor_cmd_location):
-                sleep(0.1)
+            self.set_rotor_cmd_location(new_rotor_cmd_location, new_rotor_cmd_location)
+            self.wait_for_rotor()
         else:
-            self.log_message(f"Object {name} Not in Motor Bounds")
+            self.log_message(f"Object {name} Not in Motor Bounds", "warning")
             self.ephemeris_cmd_location = None
 
     def update_ephemeris_location(self):
@@ -563,6 +702,13 @@ class SmallRadioTelescopeDaemon:
         while True:
             if last_updated_time is None or time() - last_updated_time > 10:
                 last_updated_time = time()
+                if isinstance(
+                    self.ephemeris_tracker, TableEphemerisTracker
+                ) and not self.ephemeris_tracker.covers(last_updated_time):
+                    self.log_message(
+                        "Ephemeris table expired, switching to AstroPy", "warning"
+                    )
+                    self.ephemeris_tracker = self.create_ephemeris_tracker()
                 self.ephemeris_tracker.update_all_az_el()
             self.ephemeris_locations = (
                 self.ephemeris_tracker.get_all_azimuth_elevation()
@@ -571,28 +717,173 @@ class SmallRadioTelescopeDaemon:
             self.ephemeris_time_locs = (
                 self.ephemeris_tracker.get_all_azel_time()
             )
-            if self.ephemeris_cmd_location is not None:
-                new_rotor_destination = self.ephemeris_locations[
-                    self.ephemeris_cmd_location
-                ]
-                self.current_vlsr = self.ephemeris_vlsr[self.ephemeris_cmd_location]
-                new_rotor_cmd_location = tuple(
-                    map(add, new_rotor_destination, self.rotor_offsets)
+            tracked_object = self.ephemeris_cmd_location
+            if tracked_object is not None:
+                object_location = self.ephemeris_tracker.get_azimuth_elevation(
+                    tracked_object
                 )
+                self.current_vlsr = self.ephemeris_tracker.get_vlsr(tracked_object)
+                offset_location = tuple(map(add, object_location, self.rotor_offsets))
                 if self.rotor.angles_within_bounds(
-                    *new_rotor_destination
-                ) and self.rotor.angles_within_bounds(*new_rotor_cmd_location):
-                    self.rotor_destination = new_rotor_destination
-                    self.rotor_cmd_location = new_rotor_cmd_location
+                    *object_location
+                ) and self.rotor.angles_within_bounds(*offset_location):
+                    # Errors are Only Counted Once the Rotor Has Reached its Setpoint
+                    if (
+                        sky_separation(self.rotor_location, self.rotor_cmd_location)
+                        < self.tracking_controller.tolerance
+                    ):
+                        self.tracking_controller.record_error(
+                            offset_location, self.rotor_location
+                        )
+                    # Only Command a Lead Position When the Error Would Grow Too Large
+                    move_time = self.slew_model.predict(
+                        self.rotor_location, offset_location
+                    )
+                    new_rotor_destination = self.tracking_controller.update(
+                        tracked_object,
+                        object_location,
+                        self.ephemeris_tracker.get_azimuth_elevation_rate(
+                            tracked_object
+                        ),
+                        self.rotor_destination,
+                        move_time or 0.0,
+                    )
+                    if new_rotor_destination is not None:
+                        new_rotor_cmd_location = tuple(
+                            map(add, new_rotor_destination, self.rotor_offsets)
+                        )
+                        # Near the Limits, Follow the Object Itself Instead of Leading
+                        if not self.rotor.angles_within_bounds(
+                            *new_rotor_destination
+                        ) or not self.rotor.angles_within_bounds(
+                            *new_rotor_cmd_location
+                        ):
+                            new_rotor_destination = object_location
+                            new_rotor_cmd_location = offset_location
+                        self.set_rotor_cmd_location(
+                            new_rotor_cmd_location, new_rotor_destination
+                        )
                 else:
                     self.log_message(
-                        f"Object {self.ephemeris_cmd_location} moved out of motor bounds"
+                        f"Object {tracked_object} moved out of motor bounds",
+                        "warning",
                     )
                     self.ephemeris_cmd_location = None
-            sleep(1)
+            elif self.tracking_controller.name is not None:
+                self.tracking_controller.reset()
+            sleep(0.25)
+
+    def set_rotor_cmd_location(self, rotor_cmd_location, rotor_destination=None):
+        """Sets the Location the Rotor is Commanded to and Wakes the Rotor Thread
+
+        Parameters
+        ----------
+        rotor_cmd_location : (float, float)
+            Azimuth and Elevation to Send to the Rotor, Including Offsets
+        rotor_destination : (float, float)
+            Azimuth and Elevation of the Target Without Offsets, if it Changed
+
+        Returns
+        -------
+        None
+        """
+        with self.rotor_condition:
+            if rotor_destination is not None:
+                self.rotor_destination = rotor_destination
+            self.rotor_cmd_location = rotor_cmd_location
+            self.rotor_condition.notify_all()
+
+    def set_rotor_location(self, rotor_location):
+        """Sets the Current Rotor Location and Wakes Anything Waiting on the Rotor
+
+        Parameters
+        ----------
+        rotor_location : (float, float)
+            Current Azimuth and Elevation of the Rotor
+
+        Returns
+        -------
+        None
+        """
+        with self.rotor_condition:
+            self.rotor_location = rotor_location
+            self.rotor_condition.notify_all()
+
+    def predict_settled_time(self, start_location, command_time):
+        """Predicts When the Antenna Stops After a Move, Using the Slew Model
+
+        Parameters
+        ----------
+        start_location : (float, float)
+            Rotor Location When the Move was Commanded
+        command_time : float
+            Unix Time the Move was Commanded
+
+        Returns
+        -------
+        float
+            Unix Time, Falling Back to SCAN_SETTLE Seconds From Now Without a Model
+        """
+        predicted = self.slew_model.predict(start_location, self.rotor_cmd_location)
+        if predicted is None:
+            return time() + self.scan_settle
+        return max(command_time + predicted, time())
+
+    def wait_for_rotor(self, timeout=None):
+        """Blocks Until the Rotor Reaches its Commanded Location
+
+        Parameters
+        ----------
+        timeout : float
+            Maximum Number of Seconds to Wait, or None for a Margin Over the Slew
+            Model's Predicted Time (Waiting Indefinitely Without a Model)
+
+        Returns
+        -------
+        bool
+            Whether the Rotor Arrived Before the Timeout
+        """
+        if timeout is None:
+            timeout = self.slew_model.timeout(
+                self.rotor_location, self.rotor_cmd_location
+            )
+        with self.rotor_condition:
+            arrived = self.rotor_condition.wait_for(
+                lambda: azel_within_range(self.rotor_location, self.rotor_cmd_location),
+                timeout,
+            )
+        if not arrived:
+            self.log_message(
+                f"Rotor Did Not Reach {self.rotor_cmd_location} Within {timeout}s",
+                "warning",
+            )
+        return arrived
+
+    def read_rotor_location(self):
+        """Reads the Rotor Location and Sends Any Change to the Radio Metadata
+
+        Returns
+        -------
+        None
+        """
+        past_rotor_location = self.rotor_location
+        rotor_location = self.rotor.get_azimuth_elevation()
+        print(past_rotor_location, rotor_location)
+        if not rotor_location == past_rotor_location:
+            self.set_rotor_location(rotor_location)
+            g_lat, g_lon = self.ephemeris_tracker.convert_to_gal_coord(rotor_location)
+            self.radio_queue.put(("motor_az", float(rotor_location[0])))
+            self.radio_queue.put(("motor_el", float(rotor_location[1])))
+            self.radio_queue.put(("glat", g_lat))
+            self.radio_queue.put(("glon", g_lon))
 
     def update_rotor_status(self):
-        """Periodically Sets Rotor Azimuth and Elevation and Fetches New Antenna Position
+        """Sets Rotor Azimuth and Elevation and Fetches New Antenna Position
+
+        Rather than sleeping between reads, the thread waits on the rotor condition,
+        so a new command location is sent to the rotor as soon as it is set, however
+        close it is to the antenna.  A command is sent again if the move runs well
+        past its prediction, or if the antenna later drifts away from it.
 
         Is Operated as an Infinite Looping Thread Function
 
@@ -600,62 +891,121 @@ class SmallRadioTelescopeDaemon:
         -------
         None
         """
+        sent_rotor_cmd_location = self.rotor_cmd_location
         while True:
             try:
                 current_rotor_cmd_location = self.rotor_cmd_location
-                if not azel_within_range(
-                    self.rotor_location, current_rotor_cmd_location
-                ):
-                    self.rotor.set_azimuth_elevation(
-                        *current_rotor_cmd_location)
-                    sleep(1)
+                if current_rotor_cmd_location != sent_rotor_cmd_location:
+                    # Resend the Command if the Move Runs Well Past its Prediction
+                    move_timeout = self.slew_model.timeout(
+                        self.rotor_location, current_rotor_cmd_location, default=10
+                    )
+                    self.rotor.set_azimuth_elevation(*current_rotor_cmd_location)
+                    sent_rotor_cmd_location = current_rotor_cmd_location
                     start_time = time()
                     while (
                         not azel_within_range(
                             self.rotor_location, current_rotor_cmd_location
                         )
-                    ) and (time() - start_time) < 10:
-                        past_rotor_location = self.rotor_location
-                        self.rotor_location = self.rotor.get_azimuth_elevation()
-                        print(past_rotor_location, self.rotor_location)
-                        if not self.rotor_location == past_rotor_location:
-                            g_lat, g_lon = self.ephemeris_tracker.convert_to_gal_coord(
-                                self.rotor_location
-                            )
-                            self.radio_queue.put(
-                                ("motor_az", float(self.rotor_location[0]))
-                            )
-                            self.radio_queue.put(
-                                ("motor_el", float(self.rotor_location[1]))
-                            )
-                            self.radio_queue.put(("glat", g_lat))
-                            self.radio_queue.put(("glon", g_lon))
-                        sleep(0.5)
+                    ) and (time() - start_time) < move_timeout:
+                        # Stop Reading Early if the Command Changes Mid-Move
+                        with self.rotor_condition:
+                            if self.rotor_condition.wait_for(
+                                lambda: self.rotor_cmd_location
+                                != current_rotor_cmd_location,
+                                0.5,
+                            ):
+                                break
+                        self.read_rotor_location()
                 else:
-                    past_rotor_location = self.rotor_location
-                    self.rotor_location = self.rotor.get_azimuth_elevation()
-                    print(self.rotor_location)
-                    if not self.rotor_location == past_rotor_location:
-                        g_lat, g_lon = self.ephemeris_tracker.convert_to_gal_coord(
-                            self.rotor_location
-                        )
-                        self.radio_queue.put(
-                            ("motor_az", float(self.rotor_location[0]))
+                    self.read_rotor_location()
+                    if not azel_within_range(
+                        self.rotor_location, current_rotor_cmd_location
+                    ):
+                        sent_rotor_cmd_location = None
+                        continue
+                    # Sleep Until the Next Read, Unless There is a New Command to Send
+                    with self.rotor_condition:
+                        self.rotor_condition.wait_for(
+                            lambda: self.rotor_cmd_location != sent_rotor_cmd_location,
+                            1,
                         )
-                        self.radio_queue.put(
-                            ("motor_el", float(self.rotor_location[1]))
-                        )
-                        self.radio_queue.put(("glat", g_lat))
-                        self.radio_queue.put(("glon", g_lon))
-
-                    sleep(1)
             except AssertionError as e:
-                self.log_message(str(e))
+                self.log_message(str(e), "error")
             except ValueError as e:
-                self.log_message(str(e))
+                self.log_message(str(e), "error")
+
+    def get_status(self):
+        """Builds the Status Dictionary Published to the Dashboard
+
+        Returns
+        -------
+        dict
+            Status Dictionary (Without the Time, Which is Part of Each Message)
+        """
+        return {
+            "beam_width": self.beamwidth,
+            "location": self.station,
+            "motor_azel": self.rotor_location,
+            "motor_cmd_azel": self.rotor_cmd_location,
+            "vlsr": self.current_vlsr,
+            "object_locs": self.ephemeris_locations,
+            "object_time_locs": {
+                str(offset): locations
+                for offset, locations in self.ephemeris_time_locs.items()
+            },
+            "az_limits": self.az_limits,
+            "el_limits": self.el_limits,
+            "stow_loc": self.stow_location,
+            "cal_loc": self.cal_location,
+            "horizon_points": self.horizon_points,
+            "center_frequency": self.radio_center_frequency,
+            "frequency_correction": self.radio_frequency_correction,
+            "bandwidth": self.radio_sample_frequency,
+            "motor_offsets": self.rotor_offsets,
+            "tracking": self.tracking_controller.get_status(),
+            "queued_item": self.current_queue_item,
+            "queue_size": self.command_scheduler.qsize(),
+            "queue_timeline": self.command_scheduler.timeline(),
+            "emergency_contact": self.contact,
+            "log_seq": self.log_store.latest_seq,
+            "temp_cal": self.temp_cal,
+            "temp_sys": self.temp_sys,
+            "cal_power": self.cal_power,
+            "n_point_data": self.n_point_data,
+            "beam_switch_data": self.beam_switch_data,
+        }
+
+    def handle_status_query(self, request, publisher):
+        """Answers a Request Sent to the Status Query Port
+
+        Parameters
+        ----------
+        request : dict
+            Decoded Request, Either {"request": "snapshot"} or
+            {"request": "logs", "since": int, "limit": int}
+        publisher : StatusPublisherState
+            State of the Status Publisher
+
+        Returns
+        -------
+        dict
+            Reply Message
+        """
+        if request.get("request") == "snapshot":
+            return publisher.snapshot(time())
+        if request.get("request") == "logs":
+            return self.log_store.since(
+                int(request.get("since", 0)), int(request.get("limit", 100))
+            )
+        return {"type": "error", "message": f"Unknown Request {request}"}
 
     def update_status(self):
-        """Periodically Publishes Daemon Status for Dashboard (or any other subscriber)
+        """Publishes Daemon Status Changes for Dashboard (or any other subscriber)
+
+        Every new subscriber is sent a full snapshot, after which only deltas of the
+        fields that changed are published, along with a heartbeat each second while
+        nothing changes.  Snapshots can also be requested on the status query port.
 
         Is Operated as an Infinite Looping Thread Function
 
@@ -664,40 +1014,39 @@ class SmallRadioTelescopeDaemon:
         None
         """
         context = zmq.Context()
-        status_port = 5555
-        status_socket = context.socket(zmq.PUB)
-        status_socket.bind("tcp://*:%s" % status_port)
+        status_socket = context.socket(zmq.XPUB)
+        status_socket.setsockopt(zmq.XPUB_VERBOSE, 1)
+        status_socket.bind("tcp://*:%s" % STATUS_PORT)
+        query_socket = context.socket(zmq.REP)
+        query_socket.bind("tcp://*:%s" % STATUS_QUERY_PORT)
+        poller = zmq.Poller()
+        poller.register(status_socket, zmq.POLLIN)
+        poller.register(query_socket, zmq.POLLIN)
+
+        publisher = StatusPublisherState()
+        publisher.update(self.get_status(), time())
+        last_sent_time = 0
         while True:
-            status = {
-                "beam_width": self.beamwidth,
-                "location": self.station,
-                "motor_azel": self.rotor_location,
-                "motor_cmd_azel": self.rotor_cmd_location,
-                "vlsr": self.current_vlsr,
-                "object_locs": self.ephemeris_locations,
-                "object_time_locs": self.ephemeris_time_locs,
-                "az_limits": self.az_limits,
-                "el_limits": self.el_limits,
-                "stow_loc": self.stow_location,
-                "cal_loc": self.cal_location,
-                "horizon_points": self.horizon_points,
-                "center_frequency": self.radio_center_frequency,
-                "frequency_correction": self.radio_frequency_correction,
-                "bandwidth": self.radio_sample_frequency,
-                "motor_offsets": self.rotor_offsets,
-                "queued_item": self.current_queue_item,
-                "queue_size": self.command_queue.qsize(),
-                "emergency_contact": self.contact,
-                "error_logs": self.command_error_logs,
-                "temp_cal": self.temp_cal,
-                "temp_sys": self.temp_sys,
-                "cal_power": self.cal_power,
-                "n_point_data": self.n_point_data,
-                "beam_switch_data": self.beam_switch_data,
-                "time": time(),
-            }
-            status_socket.send_json(status)
-            sleep(0.5)
+            socks = dict(poller.poll(250))
+            if status_socket in socks:
+                # Subscription Messages Start With a 1 Byte, Unsubscriptions With a 0
+                if status_socket.recv()[:1] == b"\x01":
+                    status_socket.send(encode_message(publisher.snapshot(time())))
+            if query_socket in socks:
+                try:
+                    request = decode_message(query_socket.recv())
+                    reply = self.handle_status_query(request, publisher)
+                except (ValueError, TypeError, AttributeError) as e:
+                    reply = {"type": "error", "message": str(e)}
+                query_socket.send(encode_message(reply))
+            current_time = time()
+            delta = publisher.update(self.get_status(), current_time)
+            if delta is not None:
+                status_socket.send(encode_message(delta))
+                last_sent_time = current_time
+            elif current_time - last_sent_time >= 1.0:
+                status_socket.send(encode_message(publisher.heartbeat(current_time)))
+                last_sent_time = current_time
 
     def update_radio_settings(self):
         """Coordinates Sending XMLRPC Commands to the GNU Radio Script
@@ -708,16 +1057,32 @@ class SmallRadioTelescopeDaemon:
         -------
         None
         """
-        rpc_server = ServerProxy("http://localhost:5557/")
+        rpc_server = ServerProxy("http://localhost:5557/", allow_none=True)
         while True:
+            # Wait for a Setting, Then Coalesce Everything Else Already Queued by Name
             method, value = self.radio_queue.get()
-            call = getattr(rpc_server, f"set_{method}")
-            call(value)
-            sleep(0.1)
+            settings = {method: value}
+            while True:
+                try:
+                    method, value = self.radio_queue.get_nowait()
+                except Empty:
+                    break
+                # Superseded Values are Dropped, and the Name Moves to its Latest Position
+                settings.pop(method, None)
+                settings[method] = value
+            # Send the Whole Batch in One Round Trip, Through the Generated Setters
+            multicall = MultiCall(rpc_server)
+            for method, value in settings.items():
+                getattr(multicall, f"set_{method}")(value)
+            for _ in multicall():
+                pass  # Raises Any Fault From the Radio Script
 
     def update_command_queue(self):
         """Waits for New Commands Coming in Over ZMQ PUSH/PULL
 
+        Commands starting with '!' are urgent, and run ahead of every queued
+        command, even while a wait is holding the rest back.
+
         Is Operated as an Infinite Looping Thread Function
 
         Returns
@@ -730,7 +1095,10 @@ class SmallRadioTelescopeDaemon:
         command_socket.bind("tcp://*:%s" % command_port)
         while True:
             cmd = command_socket.recv_string()
-            self.command_queue.put(cmd)
+            if cmd.startswith("!"):
+                self.command_scheduler.put(cmd[1:].strip(), CommandScheduler.URGENT)
+            else:
+                self.command_scheduler.put(cmd)
 
     def srt_daemon_main(self):
         """Starts and Processes Commands for the SRT
@@ -756,7 +1124,7 @@ class SmallRadioTelescopeDaemon:
             try:
                 self.radio_process_task.start()
             except RuntimeError as e:
-                self.log_message(str(e))
+                self.log_message(str(e), "error")
             sleep(5)
 
         # Send Settings to the GNU Radio Script
@@ -795,101 +1163,72 @@ class SmallRadioTelescopeDaemon:
         command_queueing_thread.start()
         status_thread.start()
         radio_thread.start()
+        self.raw_spectrum_cache.start()
 
         while self.keep_running:
             try:
                 # Await Command for the SRT
                 self.current_queue_item = "None"
-                command = self.command_queue.get()
+                _, command, _ = self.command_scheduler.get()
                 self.log_message(f"Running Command '{command}'")
                 self.current_queue_item = command
-                if len(command) < 2 or command[0] == "*":
+                parsed = parse_command(command, self.ephemeris_locations)
+                if parsed is None:
                     continue
-                elif command[0] == ":":
-                    command = command[1:].strip()
-                command_parts = command.split(" ")
-                command_parts = [x for x in command_parts if x]
-                command_name = command_parts[0].lower()
-
-                # If Command Starts With a Valid Object Name
-                if command_parts[0] in self.ephemeris_locations:
-                    if command_parts[-1] == "n":  # N-Point Scan About Object
-                        self.n_point_scan(object_id=command_parts[0])
-                    elif command_parts[-1] == "b":  # Beam-Switch Away From Object
-                        self.beam_switch(object_id=command_parts[0])
-                    else:  # Point Directly At Object
-                        self.point_at_object(object_id=command_parts[0])
-                elif command_name == "stow":
+                kind = parsed.kind
+                args = parsed.args
+
+                if kind == CommandKind.NPOINT:  # N-Point Scan About Object
+                    self.n_point_scan(object_id=args[0])
+                elif kind == CommandKind.BEAMSWITCH:  # Beam-Switch Away From Object
+                    self.beam_switch(object_id=args[0])
+                elif kind == CommandKind.POINT:  # Point Directly At Object
+                    self.point_at_object(object_id=args[0])
+                elif kind == CommandKind.STOW:
                     self.stow()
-                elif command_name == "cal":
+                elif kind == CommandKind.CAL:
                     self.point_at_azel(*self.cal_location)
-                elif command_name == "calibrate":
+                elif kind == CommandKind.CALIBRATE:
                     self.calibrate()
-                elif command_name == "quit":
+                elif kind == CommandKind.QUIT:
                     self.quit()
-                elif command_name == "record":
-                    self.start_recording(
-                        name=(None if len(command_parts)
-                              <= 1 else command_parts[1])
-                    )
-                elif command_name == "roff":
+                elif kind == CommandKind.RECORD:
+                    self.start_recording(name=args[0])
+                elif kind == CommandKind.ROFF:
                     self.stop_recording()
-                elif command_name == "freq":
-                    self.set_freq(frequency=float(
-                        command_parts[1]) * pow(10, 6))
-                elif command_name == "samp":
-                    self.set_samp_rate(samp_rate=float(
-                        command_parts[1]) * pow(10, 6))
-                elif command_name == "coords":
-                    self.set_coords(
-                        float(command_parts[1]), float(command_parts[2]))
-                elif command_name == "object":
-                    if command_parts[-1] in self.ephemeris_locations:
-                        self.find_object_location(command_parts[-1])
-                elif command_name == "obj_coords":
-                    self.rotor_location = (
-                        float(command_parts[1]), float(command_parts[2]))
-                elif command_name == "azel":
-                    self.point_at_azel(
-                        float(command_parts[1]),
-                        float(command_parts[2]),
+                elif kind == CommandKind.FREQ:
+                    self.set_freq(frequency=args[0] * pow(10, 6))
+                elif kind == CommandKind.SAMP:
+                    self.set_samp_rate(samp_rate=args[0] * pow(10, 6))
+                elif kind == CommandKind.COORDS:
+                    self.set_coords(*args)
+                elif kind == CommandKind.OBJECT:
+                    if args[0] in self.ephemeris_locations:
+                        self.find_object_location(args[0])
+                elif kind == CommandKind.OBJ_COORDS:
+                    self.set_rotor_location(args)
+                elif kind == CommandKind.AZEL:
+                    self.point_at_azel(*args)
+                elif kind == CommandKind.OFFSET:
+                    self.point_at_offset(*args)
+                elif kind == CommandKind.CLEAR:
+                    num_cancelled = self.command_scheduler.clear()
+                    self.log_message(f"Cleared {num_cancelled} Queued Commands")
+                # Waits Hold Back Later Commands Without Blocking Urgent Ones
+                elif kind == CommandKind.WAIT:
+                    self.command_scheduler.hold(args[0])
+                elif kind == CommandKind.WAIT_UNTIL_TIME:  # Wait Until Next H:M:S
+                    self.command_scheduler.hold(
+                        seconds_until_time_of_day(args[0], time())
                     )
-                elif command_name == "offset":
-                    self.point_at_offset(
-                        float(command_parts[1]), float(command_parts[2])
-                    )
-                elif (
-                    command_name.isnumeric()
-                ):  # If Command is a Number, Sleep that Long
-                    sleep(float(command_name))
-                elif command_name == "wait":
-                    sleep(float(command_parts[1]))
-                # Wait Until Next Time H:M:S
-                elif command_name.split(":")[0] == "lst":
-                    time_string = command_name.replace("LST:", "")
-                    time_val = datetime.strptime(time_string, "%H:%M:%S")
-                    while time_val < datetime.utcfromtimestamp(time()):
-                        time_val += timedelta(days=1)
-                    time_delta = (
-                        time_val - datetime.utcfromtimestamp(time())
-                    ).total_seconds()
-                    sleep(time_delta)
-                elif len(command_name.split(":")) == 5:  # Wait Until Y:D:H:M:S
-                    time_val = datetime.strptime(
-                        command_name, "%Y:%j:%H:%M:%S")
-                    time_delta = (
-                        time_val - datetime.utcfromtimestamp(time())
-                    ).total_seconds()
-                    sleep(time_delta)
-                else:
-                    self.log_message(f"Command Not Identified '{command}'")
-                self.command_queue.task_done()
+                elif kind == CommandKind.WAIT_UNTIL_DATE:  # Wait Until Y:D:H:M:S
+                    self.command_scheduler.hold(seconds_until_date(args[0], time()))
             except IndexError as e:
-                self.log_message(str(e))
+                self.log_message(str(e), "error")
             except ValueError as e:
-                self.log_message(str(e))
+                self.log_message(str(e), "error")
             except ConnectionRefusedError as e:
-                self.log_message(str(e))
+                self.log_message(str(e), "error")
 
         # On End, Return to Stow and End Recordings
         self.stop_recording()
@@ -0,0 +1,190 @@
+"""
+Embedded Python Blocks:
+
+Each time this file is saved, GRC will instantiate the first class it finds
+to get ports and parameters of your block. The arguments to __init__  will
+be the parameters. All of them are required to have default values!
+"""
+
+import numpy as np
+from gnuradio import gr
+import pmt
+
+import pathlib
+from time import monotonic
+
+try:
+    import h5py
+except ModuleNotFoundError:
+    h5py = None
+
+try:
+    import zarr
+except ModuleNotFoundError:
+    zarr = None
+
+# Per-Row Columns Taken From the Metadata Tag, Alongside 'time' and 'spectra'
+metadata_columns = (
+    "motor_az",
+    "motor_el",
+    "freq",
+    "samp_rate",
+    "num_integrations",
+    "tsys",
+    "tcal",
+    "cal_pwr",
+    "vlsr",
+    "glat",
+    "glon",
+    "bsw",
+)
+source_length = 64  # Bytes Kept of Each 'soutrack' Source Name
+
+# Chunking and Flushing Policy
+chunk_rows = 64  # Spectra per Chunk, Rows are Written a Whole Chunk at a Time
+flush_interval = 5.0  # Seconds Before a Partial Chunk is Written Anyway
+
+
+def column_dtypes(vec_length):
+    dtypes = {"time": ("f8", ()), "spectra": ("f4", (vec_length,))}
+    dtypes.update({name: ("f8", ()) for name in metadata_columns})
+    dtypes["soutrack"] = (f"S{source_length}", ())
+    return dtypes
+
+
+class Hdf5Archive:
+    """Appendable Chunked and Compressed Datasets in an HDF5 File"""
+
+    def __init__(self, file_path, vec_length):
+        if h5py is None:
+            raise ModuleNotFoundError("h5py is Required to Record .h5 Files")
+        self.file = h5py.File(file_path, "a")
+        self.file.attrs["telescope"] = "SmallRadioTelescope"
+        for name, (dtype, shape) in column_dtypes(vec_length).items():
+            if name not in self.file:
+                self.file.create_dataset(
+                    name,
+                    shape=(0,) + shape,
+                    maxshape=(None,) + shape,
+                    chunks=(chunk_rows,) + shape,
+                    dtype=dtype,
+                    compression="gzip",
+                    compression_opts=4,
+                    shuffle=True,
+                )
+        self.file["spectra"].attrs["units"] = "K"
+        self.file["time"].attrs["units"] = "Unix Time (s)"
+
+    def append(self, columns):
+        for name, values in columns.items():
+            dataset = self.file[name]
+            num_rows = dataset.shape[0]
+            dataset.resize(num_rows + len(values), axis=0)
+            dataset[num_rows:] = values
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+class ZarrArchive:
+    """Appendable Chunked and Compressed Arrays in a Zarr Group"""
+
+    def __init__(self, file_path, vec_length):
+        if zarr is None:
+            raise ModuleNotFoundError("zarr is Required to Record .zarr Stores")
+        self.group = zarr.open_group(str(file_path), mode="a")
+        self.group.attrs["telescope"] = "SmallRadioTelescope"
+        for name, (dtype, shape) in column_dtypes(vec_length).items():
+            if name not in self.group:
+                self.group.create_dataset(
+                    name, shape=(0,) + shape, chunks=(chunk_rows,) + shape, dtype=dtype
+                )
+        self.group["spectra"].attrs["units"] = "K"
+        self.group["time"].attrs["units"] = "Unix Time (s)"
+
+    def append(self, columns):
+        for name, values in columns.items():
+            self.group[name].append(values, axis=0)
+
+    def close(self):
+        pass
+
+
+class blk(gr.sync_block):
+    """Embedded Python Block - Saving Spectra Into a Columnar HDF5 or Zarr Archive"""
+
+    def __init__(
+        self, directory=".", filename="test.h5", vec_length=4096
+    ):  # only default arguments here
+        """arguments to this function show up as parameters in GRC"""
+        gr.sync_block.__init__(
+            self,
+            name="Embedded Python Block",  # will show up in GRC
+            in_sig=[(np.float32, vec_length)],
+            out_sig=None,
+        )
+        # if an attribute with the same name as a parameter is found,
+        # a callback is registered (properties work, too).
+        self.directory = directory
+        self.filename = filename
+        self.vec_length = vec_length
+        self.archive = None
+        self.pending = []
+        self.num_pending = 0
+        self.last_flush = monotonic()
+
+    def open_archive(self):
+        file_path = pathlib.Path(self.directory, self.filename)
+        if file_path.suffix == ".zarr":
+            return ZarrArchive(file_path, self.vec_length)
+        return Hdf5Archive(file_path, self.vec_length)
+
+    def work(self, input_items, output_items):
+        """Buffers Rows of Spectra and Metadata, Writing Them a Chunk at a Time"""
+        if self.archive is None:
+            self.archive = self.open_archive()
+        tags = self.get_tags_in_window(0, 0, len(input_items[0]))
+        tags_dict = {pmt.to_python(tag.key): pmt.to_python(tag.value) for tag in tags}
+        metadata = tags_dict["metadata"]
+        num_rows = len(input_items[0])
+        rows = {
+            "time": np.full(
+                num_rows, tags_dict["rx_time"][0] + tags_dict["rx_time"][1]
+            ),
+            "spectra": np.array(input_items[0], dtype=np.float32),
+            "soutrack": np.full(
+                num_rows, str(metadata["soutrack"]).encode()[:source_length]
+            ),
+        }
+        for name in metadata_columns:
+            rows[name] = np.full(num_rows, metadata[name], dtype=np.float64)
+        self.pending.append(rows)
+        self.num_pending += num_rows
+        if (
+            self.num_pending >= chunk_rows
+            or monotonic() - self.last_flush >= flush_interval
+        ):
+            self.flush()
+        return num_rows
+
+    def flush(self):
+        """Appends All Buffered Rows to the Archive"""
+        if self.pending:
+            self.archive.append(
+                {
+                    name: np.concatenate([rows[name] for rows in self.pending])
+                    for name in self.pending[0]
+                }
+            )
+            self.pending = []
+            self.num_pending = 0
+        self.last_flush = monotonic()
+
+    def stop(self):
+        """Writes Any Buffered Rows and Closes the Archive When the Flowgraph Stops"""
+        if self.archive is not None:
+            self.flush()
+            self.archive.close()
+            self.archive = None
+        return True
@@ -26,6 +26,7 @@ class radio_save_spec_fits(gr.top_block):
         file_name="test.fits",
         num_bins=4096,
         samp_rate=2400000,
+        fits_mode="hdu",
     ):
         gr.top_block.__init__(self, "radio_save_spec_fits")
 
@@ -36,6 +37,7 @@ class radio_save_spec_fits(gr.top_block):
         self.file_name = file_name
         self.num_bins = num_bins
         self.samp_rate = samp_rate
+        self.fits_mode = fits_mode
 
         ##################################################
         # Blocks
@@ -44,7 +46,10 @@ class radio_save_spec_fits(gr.top_block):
             gr.sizeof_float, num_bins, "tcp://127.0.0.1:5562", 100, True, -1
         )
         self.save_fits_file = save_fits_file.blk(
-            directory=directory_name, filename=file_name, vec_length=num_bins
+            directory=directory_name,
+            filename=file_name,
+            vec_length=num_bins,
+            mode=fits_mode,
         )
 
         ##################################################
@@ -79,6 +84,13 @@ class radio_save_spec_fits(gr.top_block):
     def set_samp_rate(self, samp_rate):
         self.samp_rate = samp_rate
 
+    def get_fits_mode(self):
+        return self.fits_mode
+
+    def set_fits_mode(self, fits_mode):
+        self.fits_mode = fits_mode
+        self.save_fits_file.mode = self.fits_mode
+
 
 def argument_parser():
     parser = ArgumentParser()
@@ -110,6 +122,13 @@ def argument_parser():
         default=2400000,
         help="Set samp_rate [default=%(default)r]",
     )
+    parser.add_argument(
+        "--fits-mode",
+        dest="fits_mode",
+        type=str,
+        default="hdu",
+        help="Set fits_mode [default=%(default)r]",
+    )
     return parser
 
 
@@ -121,6 +140,7 @@ def main(top_block_cls=radio_save_spec_fits, options=None):
         file_name=options.file_name,
         num_bins=options.num_bins,
         samp_rate=options.samp_rate,
+        fits_mode=options.fits_mode,
     )
 
     def sig_handler(sig=None, frame=None):
@@ -13,14 +13,93 @@ import json
 
 import pathlib
 from datetime import datetime, timezone
+from time import monotonic
 from astropy.io import fits
 
+# Flushing Policy for Table Mode, Whichever Comes First
+flush_size = 1 << 20  # Bytes of Buffered Output
+flush_interval = 1.0  # Seconds Since the Last Flush
+object_length = 64  # Bytes Kept of Each 'soutrack' Source Name in Table Mode
+
+
+def parse_tags(tags):
+    tags_dict = {pmt.to_python(tag.key): pmt.to_python(tag.value) for tag in tags}
+    time_since_epoch = tags_dict["rx_time"][0] + tags_dict["rx_time"][1]
+    return time_since_epoch, tags_dict["metadata"]
+
+
+def build_header(metadata, date):
+    samp_rate = metadata["samp_rate"]
+    num_integrations = metadata["num_integrations"]
+    freq = metadata["freq"]
+    num_bins = metadata["num_bins"]
+    soutrack = metadata["soutrack"]
+
+    hdr = fits.Header()
+    hdr["BUNIT"] = "K"
+    hdr["CTYPE1"] = "Freq"
+    hdr["CRPIX1"] = num_bins / float(2)  # Reference pixel (center)
+    hdr["CRVAL1"] = freq  # Center, USRP, frequency
+    hdr["CDELT1"] = samp_rate / (1 * num_bins)  # Channel width
+    hdr["CUNIT1"] = "Hz"
+
+    hdr["TELESCOP"] = "SmallRadioTelescope"
+    hdr["OBJECT"] = soutrack
+    hdr["OBSTIME"] = (num_bins * num_integrations) / samp_rate
+
+    hdr["DATE-OBS"] = date.strftime("%Y-%m-%d")
+    hdr["UTC"] = date.strftime("%H:%M:00%s")
+    hdr["METADATA"] = json.dumps(metadata)
+    return hdr
+
+
+def table_dtype(vec_length):
+    return np.dtype(
+        [
+            ("TIME", ">f8"),
+            ("OBJECT", f"S{object_length}"),
+            ("AZ", ">f4"),
+            ("EL", ">f4"),
+            ("GLAT", ">f4"),
+            ("GLON", ">f4"),
+            ("VLSR", ">f4"),
+            ("FREQ", ">f8"),
+            ("SAMPRATE", ">f8"),
+            ("NUMINTEG", ">i4"),
+            ("TSYS", ">f4"),
+            ("TCAL", ">f4"),
+            ("CALPWR", ">f4"),
+            ("BSW", ">i4"),
+            ("SPECTRUM", ">f4", (vec_length,)),
+        ]
+    )
+
+
+def table_columns(vec_length):
+    return [
+        fits.Column(name="TIME", format="D", unit="s"),  # Unix Time
+        fits.Column(name="OBJECT", format=f"{object_length}A"),
+        fits.Column(name="AZ", format="E", unit="deg"),
+        fits.Column(name="EL", format="E", unit="deg"),
+        fits.Column(name="GLAT", format="E", unit="deg"),
+        fits.Column(name="GLON", format="E", unit="deg"),
+        fits.Column(name="VLSR", format="E", unit="km/s"),
+        fits.Column(name="FREQ", format="D", unit="Hz"),
+        fits.Column(name="SAMPRATE", format="D", unit="Hz"),
+        fits.Column(name="NUMINTEG", format="J"),  # FFTs Averaged per Spectrum
+        fits.Column(name="TSYS", format="E", unit="K"),
+        fits.Column(name="TCAL", format="E", unit="K"),
+        fits.Column(name="CALPWR", format="E"),
+        fits.Column(name="BSW", format="J"),  # Beam Switching Position
+        fits.Column(name="SPECTRUM", format=f"{vec_length}E", unit="K"),
+    ]
+
 
 class blk(gr.sync_block):
     """Embedded Python Block - Saving"""
 
     def __init__(
-        self, directory=".", filename="test.fits", vec_length=4096
+        self, directory=".", filename="test.fits", vec_length=4096, mode="hdu"
     ):  # only default arguments here
         """arguments to this function show up as parameters in GRC"""
         gr.sync_block.__init__(
@@ -34,45 +113,99 @@ class blk(gr.sync_block):
         self.directory = directory
         self.filename = filename
         self.vec_length = vec_length
+        self.mode = mode
+        self.file = None
+        self.num_rows = 0
+        self.card_offsets = {}
+        self.end_time = None
+        self.last_flush = monotonic()
 
     def work(self, input_items, output_items):
         """Saving Spectrum Data to a FITS File"""
+        tags = self.get_tags_in_window(0, 0, len(input_items[0]))
+        time_since_epoch, metadata = parse_tags(tags)
+        if self.mode == "table":
+            self.write_rows(input_items[0], time_since_epoch, metadata)
+            return len(input_items[0])
+        date = datetime.fromtimestamp(time_since_epoch, timezone.utc)
+        hdr = build_header(metadata, date)
         file_path = pathlib.Path(self.directory, self.filename)
-        for i, input_array in enumerate(input_items[0]):
-            file = open(file_path, "ab+")
-            tags = self.get_tags_in_window(0, 0, len(input_items[0]))
-            tags_dict = {
-                pmt.to_python(tag.key): pmt.to_python(tag.value) for tag in tags
-            }
-            time_since_epoch = tags_dict["rx_time"][0] + tags_dict["rx_time"][1]
-            date = datetime.fromtimestamp(time_since_epoch, timezone.utc)
-            metadata = tags_dict["metadata"]
-            samp_rate = metadata["samp_rate"]
-            num_integrations = metadata["num_integrations"]
-            freq = metadata["freq"]
-            num_bins = metadata["num_bins"]
-            soutrack = metadata["soutrack"]
-
-            hdr = fits.Header()
-            hdr["BUNIT"] = "K"
-            hdr["CTYPE1"] = "Freq"
-            hdr["CRPIX1"] = num_bins / float(2)  # Reference pixel (center)
-            hdr["CRVAL1"] = freq  # Center, USRP, frequency
-            hdr["CDELT1"] = samp_rate / (1 * num_bins)  # Channel width
-            hdr["CUNIT1"] = "Hz"
-
-            hdr["TELESCOP"] = "SmallRadioTelescope"
-            hdr["OBJECT"] = soutrack
-            hdr["OBSTIME"] = (num_bins * num_integrations) / samp_rate
-
-            hdr["DATE-OBS"] = date.strftime("%Y-%m-%d")
-            hdr["UTC"] = date.strftime("%H:%M:00%s")
-            hdr["METADATA"] = json.dumps(metadata)
-
-            fits.append(file, input_array, hdr)
-            file.close()
-            # p = np.sum(input_array)
-            # a = len(input_array)
-            # pwr = (tsys + tcal) * p / (a * calpwr)
-            # ppwr = pwr - tsys
+        with open(file_path, "ab+") as file:
+            for input_array in input_items[0]:
+                fits.append(file, input_array, hdr)
         return len(input_items[0])
+
+    def open_table(self, time_since_epoch, metadata):
+        """Writes the Headers and an Empty Binary Table, Keeping the File Open
+
+        The primary header describes the first spectrum, as in the one HDU per
+        spectrum mode.  Rows are then streamed onto the end of the file, and only
+        the NAXIS2 and DATE-END cards of the table header are rewritten in place.
+        """
+        date = datetime.fromtimestamp(time_since_epoch, timezone.utc)
+        primary = fits.PrimaryHDU(header=build_header(metadata, date))
+        table = fits.BinTableHDU.from_columns(
+            table_columns(self.vec_length), nrows=0, name="SPECTRA"
+        )
+        table.header["DATE-END"] = date.strftime("%Y-%m-%dT%H:%M:%S")
+        file_path = pathlib.Path(self.directory, self.filename)
+        fits.HDUList([primary, table]).writeto(file_path)
+        self.file = open(file_path, "r+b", buffering=flush_size)
+        contents = self.file.read()
+        extension_start = contents.index(b"XTENSION")
+        for offset in range(extension_start, len(contents), 80):
+            keyword = contents[offset : offset + 8].decode().strip()
+            if keyword in ("NAXIS2", "DATE-END"):
+                self.card_offsets[keyword] = offset
+            elif keyword == "END":
+                break
+        self.num_rows = 0
+        self.last_flush = monotonic()
+
+    def write_card(self, keyword, value):
+        """Overwrites a Card of the Table Header in Place"""
+        self.file.seek(self.card_offsets[keyword])
+        self.file.write(fits.Card(keyword, value).image.encode())
+        self.file.seek(0, 2)
+
+    def write_rows(self, spectra, time_since_epoch, metadata):
+        """Appends One Table Row per Spectrum to the End of the File"""
+        if self.file is None:
+            self.open_table(time_since_epoch, metadata)
+        rows = np.zeros(len(spectra), dtype=table_dtype(self.vec_length))
+        rows["TIME"] = time_since_epoch
+        rows["OBJECT"] = str(metadata["soutrack"]).encode()[:object_length]
+        rows["AZ"] = metadata["motor_az"]
+        rows["EL"] = metadata["motor_el"]
+        rows["GLAT"] = metadata["glat"]
+        rows["GLON"] = metadata["glon"]
+        rows["VLSR"] = metadata["vlsr"]
+        rows["FREQ"] = metadata["freq"]
+        rows["SAMPRATE"] = metadata["samp_rate"]
+        rows["NUMINTEG"] = metadata["num_integrations"]
+        rows["TSYS"] = metadata["tsys"]
+        rows["TCAL"] = metadata["tcal"]
+        rows["CALPWR"] = metadata["cal_pwr"]
+        rows["BSW"] = metadata["bsw"]
+        rows["SPECTRUM"] = spectra
+        self.file.write(rows.tobytes())
+        self.num_rows += len(spectra)
+        self.end_time = time_since_epoch
+        if monotonic() - self.last_flush >= flush_interval:
+            # Keep the Row Count Current so the File Stays Readable While Recording
+            self.write_card("NAXIS2", self.num_rows)
+            self.file.flush()
+            self.last_flush = monotonic()
+
+    def stop(self):
+        """Finalizes the Table Header and Pads the File When the Flowgraph Stops"""
+        if self.file is not None:
+            self.write_card("NAXIS2", self.num_rows)
+            if self.num_rows > 0:
+                date = datetime.fromtimestamp(self.end_time, timezone.utc)
+                self.write_card("DATE-END", date.strftime("%Y-%m-%dT%H:%M:%S"))
+            data_size = self.num_rows * table_dtype(self.vec_length).itemsize
+            self.file.write(bytes(-data_size % 2880))
+            self.file.close()
+            self.file = None
+        return True
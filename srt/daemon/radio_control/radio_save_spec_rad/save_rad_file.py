@@ -13,6 +13,7 @@ import pmt
 import pathlib
 from datetime import datetime, timezone
 from math import sqrt
+from time import monotonic
 
 
 # String Formatting Constants
@@ -27,6 +28,10 @@ start_format = (
 integration_format = "Spectrum %6.0f integration periods\n"
 number_format = "%8.3f "
 
+# Flushing Policy, Whichever Comes First
+flush_size = 1 << 20  # Bytes of Buffered Output
+flush_interval = 1.0  # Seconds Since the Last Flush
+
 
 def parse_time(rx_time):
     time_since_epoch = rx_time[0] + rx_time[1]
@@ -90,6 +95,41 @@ class blk(
         self.filename = filename
         self.vec_length = vec_length
         self.obsn = 0
+        self.file = None
+        self.file_path = None
+        self.last_flush = monotonic()
+        self.line_format = None
+
+    def get_file(self):
+        """Returns the Open Output File, Reopening it if the Path Changed"""
+        file_path = pathlib.Path(self.directory, self.filename)
+        if self.file is None or file_path != self.file_path:
+            self.close_file()
+            self.file = open(file_path, "a+", buffering=flush_size)
+            self.file_path = file_path
+            self.last_flush = monotonic()
+        return self.file
+
+    def close_file(self):
+        """Flushes and Closes the Output File, if Open"""
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def get_line_format(self, num_values):
+        """Returns a Format String for a Whole Line of Spectrum Values
+
+        Formatting a line with a single % keeps the exact bytes of formatting each
+        value with number_format in turn, followed by a newline.
+        """
+        if self.line_format is None or self.line_format[0] != num_values:
+            self.line_format = (num_values, number_format * num_values + "\n")
+        return self.line_format[1]
+
+    def stop(self):
+        """Flushes and Closes the Output File When the Flowgraph Stops"""
+        self.close_file()
+        return True
 
     def work(self, input_items, output_items):
         """Saves the data to a rad file.
@@ -102,7 +142,7 @@ class blk(
 
 
         """
-        file = open(pathlib.Path(self.directory, self.filename), "a+")
+        file = self.get_file()
         tags = self.get_tags_in_window(0, 0, len(input_items[0]))
         latest_data_dict = {
             pmt.to_python(tag.key): pmt.to_python(tag.value) for tag in tags
@@ -133,6 +173,8 @@ class blk(
         freqsep = bw / nfreq
         nsam = nfreq  # Old SRT Software Had a Specific Bundle of Samples Shuffled Out and Processed at a Time
         sigma = tsys / sqrt((nsam * integ / (2.0e6 * bw)) * freqsep * 1e6)
+        line_format = self.get_line_format(input_items[0].shape[1])
+        lines = []
         for input_array in input_items[0]:
             p = np.sum(input_array)
             a = len(input_array)
@@ -169,11 +211,12 @@ class blk(
                 bsw,
             )
             integration_line = integration_format % integ
-            file.writelines([header_line, start_line, integration_line])
-            for val in input_array:
-                file.write(number_format % val)
-            file.write("\n")
+            values_line = line_format % tuple(input_array.tolist())
+            lines.extend([header_line, start_line, integration_line, values_line])
             self.obsn += 1
 
-        file.close()
+        file.writelines(lines)
+        if monotonic() - self.last_flush >= flush_interval:
+            file.flush()
+            self.last_flush = monotonic()
         return len(input_items[0])
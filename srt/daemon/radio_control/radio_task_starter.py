@@ -9,6 +9,7 @@ from .radio_calibrate import radio_calibrate
 from .radio_save_raw import radio_save_raw
 from .radio_save_spec_rad import radio_save_spec
 from .radio_save_spec_fits import radio_save_spec_fits
+from .radio_save_spec_archive import radio_save_spec_archive
 
 
 class RadioTask(multiprocessing.Process):
@@ -70,7 +71,9 @@ class RadioSaveSpecFitsTask(RadioTask):
     Multiprocessing Wrapper Process for Saving Spectrum Data in .fits Files
     """
 
-    def __init__(self, samp_rate, num_bins, root_save_directory, file_name):
+    def __init__(
+        self, samp_rate, num_bins, root_save_directory, file_name, fits_mode="hdu"
+    ):
         if file_name is None:
             file_name = time.strftime("SRT_SPEC_SAVE-%Y_%m_%d_%H_%M_%S.fits")
         path = str(Path(expanduser(root_save_directory)).absolute())
@@ -80,6 +83,29 @@ class RadioSaveSpecFitsTask(RadioTask):
             samp_rate=samp_rate,
             num_bins=num_bins,
             file_name=file_name,
+            fits_mode=fits_mode,
+        )
+
+
+class RadioSaveSpecArchiveTask(RadioTask):
+    """
+    Multiprocessing Wrapper Process for Saving Spectrum Data in .h5 or .zarr Archives
+    """
+
+    def __init__(
+        self, samp_rate, num_bins, root_save_directory, file_name, file_format="h5"
+    ):
+        if file_name is None:
+            file_name = time.strftime(
+                f"SRT_SPEC_SAVE-%Y_%m_%d_%H_%M_%S.{file_format}"
+            )
+        path = str(Path(expanduser(root_save_directory)).absolute())
+        super().__init__(
+            radio_save_spec_archive.main,
+            directory_name=path,
+            samp_rate=samp_rate,
+            num_bins=num_bins,
+            file_name=file_name,
         )
 
 
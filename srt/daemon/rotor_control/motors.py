@@ -9,6 +9,8 @@ from abc import ABC, abstractmethod
 from time import sleep
 from math import cos, acos, pi, sqrt, floor
 
+from .slew_model import SlewRecorder
+
 
 class Motor(ABC):
     """Abstract Class for All Motors Types
@@ -25,6 +27,8 @@ class Motor(ABC):
         Tuple of Lower and Upper Elevation Limits
     serial : serial.Serial
         Serial Object for Communicating with the Motor
+    recorder : SlewRecorder
+        Records the Positions Read During Each Commanded Move
 
     See Also
     --------
@@ -48,6 +52,7 @@ class Motor(ABC):
         self.az_limits = az_limits
         self.el_limits = el_limits
         self.serial = None
+        self.recorder = SlewRecorder()
 
     @abstractmethod
     def point(self, az, el):
@@ -349,7 +354,7 @@ class H180Motor(Motor):  # TODO: Test!
         counts_per_step : int
             Maximum number of counts to move per call to function
         """
-        Motor.__init__(self, port, az_limits, el_limits)
+        Motor.__init__(self, port, baudrate, az_limits, el_limits)
         self.serial = serial.Serial(
             port=port,
             baudrate=baudrate,  # 2400,
@@ -4,16 +4,10 @@ Module for Managing Different Motor Objects
 
 """
 from enum import Enum
+from time import time
 
 from .motors import NoMotor, Rot2Motor, H180Motor, PushRodMotor
-
-
-def angle_within_range(angle, limits):
-    lower_limit, upper_limit = limits
-    if lower_limit <= upper_limit:
-        return lower_limit <= angle <= upper_limit
-    else:
-        return not lower_limit < angle < upper_limit
+from ..utilities.functions import angle_within_limits
 
 
 class RotorType(Enum):
@@ -36,7 +30,9 @@ class Rotor:
     motors.py
     """
 
-    def __init__(self, motor_type, port, baudrate, az_limits, el_limits):
+    def __init__(
+        self, motor_type, port, baudrate, az_limits, el_limits, slew_model=None
+    ):
         """Initializes the Rotor with its Motor Object
 
         Parameters
@@ -49,6 +45,8 @@ class Rotor:
             Tuple of Lower and Upper Azimuth Limits
         el_limits : (float, float)
             Tuple of Lower and Upper Elevation Limits
+        slew_model : SlewModel
+            Model Fitted to Every Move the Motor Finishes, or None to Not Learn
         """
         if motor_type == RotorType.NONE or motor_type == RotorType.NONE.value:
             self.motor = NoMotor(port, baudrate, az_limits, el_limits)
@@ -63,6 +61,7 @@ class Rotor:
 
         self.az_limits = az_limits
         self.el_limits = el_limits
+        self.slew_model = slew_model
 
     def get_azimuth_elevation(self):
         """Latest Known Azimuth and Elevation
@@ -72,7 +71,11 @@ class Rotor:
         (float, float)
             Azimuth and Elevation Coordinate as a Tuple of Floats
         """
-        return self.motor.status()
+        azel = self.motor.status()
+        move = self.motor.recorder.sample(time(), azel)
+        if move is not None and self.slew_model is not None:
+            self.slew_model.add_move(move)
+        return azel
 
     def set_azimuth_elevation(self, az, el):
         """Sets the Azimuth and Elevation of the Motor
@@ -89,11 +92,12 @@ class Rotor:
         None
         """
         if self.angles_within_bounds(az, el):
+            self.motor.recorder.command(time(), (az, el))
             self.motor.point(az, el)
         else:
             raise ValueError("Angle Not Within Bounds")
 
     def angles_within_bounds(self, az, el):
-        return angle_within_range(az, self.az_limits) and angle_within_range(
+        return angle_within_limits(az, self.az_limits) and angle_within_limits(
             el, self.el_limits
         )
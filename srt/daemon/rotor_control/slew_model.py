@@ -0,0 +1,420 @@
+"""slew_model.py
+
+Module for Learning How Long Each Motor Axis Takes to Move From its Own Telemetry
+
+"""
+import json
+
+from math import sqrt
+from pathlib import Path
+
+import numpy as np
+
+
+class SlewRecorder:
+    """
+    Records the Positions Read After Each Move is Commanded
+
+    A move is finished once the position is within tolerance of the target and
+    has not changed for quiet_time seconds, and is dropped if a different target
+    is commanded first or it runs longer than max_duration.
+    """
+
+    def __init__(self, tolerance=0.5, quiet_time=1.0, max_duration=600.0):
+        """Initializer for SlewRecorder
+
+        Parameters
+        ----------
+        tolerance : float
+            Degrees From the Target on Both Axes Counted as Arrived
+        quiet_time : float
+            Seconds the Position Must be Unchanged Before the Move is Finished
+        max_duration : float
+            Seconds After Which an Unfinished Move is Dropped
+        """
+        self.tolerance = tolerance
+        self.quiet_time = quiet_time
+        self.max_duration = max_duration
+        self.last_position = None
+        self.move = None
+
+    def command(self, command_time, target):
+        """Starts Recording a Move, Unless the Target is the One Already Being Moved To
+
+        Parameters
+        ----------
+        command_time : float
+            Unix Time the Command was Sent
+        target : (float, float)
+            Commanded Azimuth and Elevation
+
+        Returns
+        -------
+        None
+        """
+        target = tuple(float(angle) for angle in target)
+        if self.move is not None and self.move["target"] == target:
+            return
+        if self.last_position is None:
+            self.move = None
+            return
+        self.move = {
+            "command_time": command_time,
+            "start": self.last_position,
+            "target": target,
+            "times": [],
+            "positions": [],
+        }
+
+    def sample(self, sample_time, position):
+        """Adds a Position Read From the Motor
+
+        Parameters
+        ----------
+        sample_time : float
+            Unix Time the Position was Read
+        position : (float, float)
+            Azimuth and Elevation Read From the Motor
+
+        Returns
+        -------
+        dict or None
+            The Finished Move, With 'command_time', 'start', 'target', 'times',
+            'positions' and 'stop_time', if This Sample Finished One
+        """
+        position = tuple(float(angle) for angle in position)
+        self.last_position = position
+        move = self.move
+        if move is None:
+            return None
+        if sample_time - move["command_time"] > self.max_duration:
+            self.move = None
+            return None
+        if not move["positions"] or move["positions"][-1] != position:
+            move["times"].append(sample_time)
+            move["positions"].append(position)
+            return None
+        arrived = all(
+            abs(angle - target) <= self.tolerance
+            for angle, target in zip(position, move["target"])
+        )
+        if arrived and sample_time - move["times"][-1] >= self.quiet_time:
+            # The Antenna Stopped When it Reached its Final Position
+            move["stop_time"] = move["times"][-1]
+            self.move = None
+            return move
+        return None
+
+
+class AxisModel:
+    """
+    Trapezoidal Velocity Profile of One Axis, Followed by a Settling Time
+
+    Each finished move gives its own estimate of the cruise velocity, the
+    acceleration (from how far the cruise lags behind the command) and the settle
+    time (from how long the axis took to stop after a trapezoidal move would have
+    ended).  Command latency also delays the cruise, so it is counted as slower
+    acceleration, and the settle time is negative when that overestimates the
+    deceleration; long moves are still predicted exactly.  The model uses the
+    median of the most recent estimates.
+    """
+
+    def __init__(self, fits=None, min_distance=2.0, max_fits=50):
+        """Initializer for AxisModel
+
+        Parameters
+        ----------
+        fits : list(dict)
+            Previous Per-Move Estimates, Each With 'velocity', 'acceleration' and
+            'settle'
+        min_distance : float
+            Shortest Move in Degrees Used for Fitting
+        max_fits : int
+            Number of Recent Per-Move Estimates Kept
+        """
+        self.min_distance = min_distance
+        self.max_fits = max_fits
+        self.fits = list(fits or [])[-max_fits:]
+        self.velocity = None
+        self.acceleration = None
+        self.settle = 0.0
+        self.refit()
+
+    def refit(self):
+        """Sets the Model From the Median of the Per-Move Estimates
+
+        Returns
+        -------
+        None
+        """
+        if not self.fits:
+            return
+        self.velocity = float(np.median([fit["velocity"] for fit in self.fits]))
+        accelerations = [
+            fit["acceleration"] for fit in self.fits if fit["acceleration"] is not None
+        ]
+        if accelerations:
+            self.acceleration = float(np.median(accelerations))
+        self.settle = float(np.median([fit["settle"] for fit in self.fits]))
+
+    def is_fitted(self):
+        """Whether Any Move Has Been Fitted
+
+        Returns
+        -------
+        bool
+        """
+        return self.velocity is not None
+
+    @staticmethod
+    def profile_time(distance, velocity, acceleration):
+        """Seconds a Trapezoidal (or Triangular) Profile Takes to Move a Distance
+
+        Parameters
+        ----------
+        distance : float
+            Degrees Moved
+        velocity : float
+            Cruise Velocity in Degrees per Second
+        acceleration : float
+            Acceleration in Degrees per Second Squared, or None for Instant
+
+        Returns
+        -------
+        float
+        """
+        distance = abs(distance)
+        if acceleration is None:
+            return distance / velocity
+        if distance >= velocity * velocity / acceleration:
+            return distance / velocity + velocity / acceleration
+        # Never Reaches Cruise Velocity
+        return 2 * sqrt(distance / acceleration)
+
+    def move_time(self, distance):
+        """Predicted Seconds From a Command Until the Axis Has Stopped
+
+        Parameters
+        ----------
+        distance : float
+            Degrees to Move
+
+        Returns
+        -------
+        float or None
+            Seconds, or None Without a Fitted Model
+        """
+        if distance == 0:
+            return 0.0
+        if not self.is_fitted():
+            return None
+        profile_time = self.profile_time(distance, self.velocity, self.acceleration)
+        return max(profile_time + self.settle, 0.0)
+
+    def fit_move(self, times, positions, start, target):
+        """Estimates the Velocity, Acceleration and Settle Time of One Move
+
+        Parameters
+        ----------
+        times : list(float)
+            Seconds Since the Command of Each Position
+        positions : list(float)
+            Positions of This Axis
+        start : float
+            Position When the Command was Sent
+        target : float
+            Commanded Position
+
+        Returns
+        -------
+        bool
+            Whether the Move Was Long Enough and Clean Enough to Fit
+        """
+        distance = target - start
+        if abs(distance) < self.min_distance or len(times) < 2:
+            return False
+        positions = np.asarray(positions)
+        progress = (positions - start) / distance
+        times = np.asarray(times)
+        # The Axis Stopped at the Last Sample Where its Position Changed
+        changes = np.flatnonzero(np.diff(positions))
+        stop_time = times[changes[-1] + 1] if len(changes) else times[0]
+        # Fit the Cruise Over the Middle of the Move, Away From the Ramps
+        cruise = np.flatnonzero((progress >= 0.2) & (progress <= 0.8))
+        if len(cruise) < 2 or times[cruise[-1]] <= times[cruise[0]]:
+            return False
+        first, last = cruise[0], cruise[-1]
+        velocity = (
+            (progress[last] - progress[first])
+            * abs(distance)
+            / (times[last] - times[first])
+        )
+        if velocity <= 0:
+            return False
+        # The Cruise Line Starts v / 2a After the Command for a Trapezoidal Profile
+        lag = times[first] - progress[first] * abs(distance) / velocity
+        acceleration = velocity / (2 * lag) if lag > 0 else None
+        settle = stop_time - self.profile_time(distance, velocity, acceleration)
+        self.fits.append(
+            {
+                "velocity": float(velocity),
+                "acceleration": None if acceleration is None else float(acceleration),
+                "settle": float(settle),
+            }
+        )
+        self.fits = self.fits[-self.max_fits :]
+        self.refit()
+        return True
+
+
+class SlewModel:
+    """
+    Per-Axis Slew and Settle Model of a Motor, Saved in the Config Directory
+    """
+
+    def __init__(self, motor_type, path=None, fits=None):
+        """Initializer for SlewModel
+
+        Parameters
+        ----------
+        motor_type : str
+            Motor Type the Model Describes (MOTOR_TYPE)
+        path : Path
+            JSON File the Model is Saved to After Every Fitted Move, or None
+        fits : dict
+            Previous Per-Move Estimates of Each Axis, Keyed by 'azimuth' and
+            'elevation'
+        """
+        fits = fits or {}
+        self.motor_type = motor_type
+        self.path = path
+        self.axes = (
+            AxisModel(fits.get("azimuth")),
+            AxisModel(fits.get("elevation")),
+        )
+
+    @classmethod
+    def load(cls, config_directory, motor_type, file_name="slew_model.json"):
+        """Loads the Saved Model, Starting Afresh if it is Missing or for Another Motor
+
+        Parameters
+        ----------
+        config_directory : str
+            Path to the Config Directory
+        motor_type : str
+            Motor Type the Model Describes (MOTOR_TYPE)
+        file_name : str
+            Name of the Model File
+
+        Returns
+        -------
+        SlewModel
+        """
+        path = Path(config_directory, file_name)
+        fits = None
+        if path.is_file():
+            with open(path, "r") as input_file:
+                try:
+                    model_data = json.load(input_file)
+                    if model_data["motor_type"] == motor_type:
+                        fits = model_data["fits"]
+                except (KeyError, ValueError):
+                    pass
+        return cls(motor_type, path, fits)
+
+    def save(self):
+        """Writes the Model to its JSON File
+
+        Returns
+        -------
+        None
+        """
+        if self.path is None:
+            return
+        azimuth, elevation = self.axes
+        model_data = {
+            "motor_type": self.motor_type,
+            "model": {
+                name: {
+                    "velocity": axis.velocity,
+                    "acceleration": axis.acceleration,
+                    "settle": axis.settle,
+                }
+                for name, axis in (("azimuth", azimuth), ("elevation", elevation))
+            },
+            "fits": {"azimuth": azimuth.fits, "elevation": elevation.fits},
+        }
+        with open(self.path, "w") as output_file:
+            json.dump(model_data, output_file, indent=2)
+
+    def add_move(self, move):
+        """Fits a Finished Move From a SlewRecorder and Saves the Model if it Changed
+
+        Parameters
+        ----------
+        move : dict
+            Finished Move Returned by SlewRecorder.sample
+
+        Returns
+        -------
+        bool
+            Whether Either Axis Was Fitted
+        """
+        times = [sample_time - move["command_time"] for sample_time in move["times"]]
+        fitted = False
+        for index, axis in enumerate(self.axes):
+            positions = [position[index] for position in move["positions"]]
+            fitted |= axis.fit_move(
+                times, positions, move["start"][index], move["target"][index]
+            )
+        if fitted:
+            self.save()
+        return fitted
+
+    def predict(self, start_azel, end_azel):
+        """Predicted Seconds From Commanding a Move Until the Antenna Has Stopped
+
+        Parameters
+        ----------
+        start_azel : (float, float)
+            Starting Azimuth and Elevation
+        end_azel : (float, float)
+            Final Azimuth and Elevation
+
+        Returns
+        -------
+        float or None
+            Seconds, or None if a Moving Axis Has No Fitted Model
+        """
+        times = [
+            axis.move_time(end - start)
+            for axis, start, end in zip(self.axes, start_azel, end_azel)
+        ]
+        if None in times:
+            return None
+        return max(times)
+
+    def timeout(self, start_azel, end_azel, default=None, margin=2.0, extra=5.0):
+        """Seconds to Allow for a Move Before Treating it as Failed
+
+        Parameters
+        ----------
+        start_azel : (float, float)
+            Starting Azimuth and Elevation
+        end_azel : (float, float)
+            Final Azimuth and Elevation
+        default : float
+            Timeout Without a Fitted Model
+        margin : float
+            Factor Applied to the Predicted Time
+        extra : float
+            Seconds Added to the Predicted Time
+
+        Returns
+        -------
+        float or None
+        """
+        predicted = self.predict(start_azel, end_azel)
+        if predicted is None:
+            return default
+        return margin * predicted + extra
@@ -0,0 +1,184 @@
+"""command_scheduler.py
+
+Module for Ordering Queued Commands by Priority and Holding Them Through Waits
+
+"""
+import heapq
+from itertools import count
+from threading import Condition
+from time import monotonic, time
+
+
+class CommandScheduler:
+    """
+    Heap of Queued Commands, Released One at a Time to the Command Thread
+
+    Commands run in the order they were queued, except that urgent commands go
+    ahead of every normal one.  Waits do not block the command thread: they hold
+    back normal commands until a deadline on the monotonic clock, while urgent
+    commands still run straight away and the hold can be cleared at any time.
+    """
+
+    URGENT = 0
+    NORMAL = 1
+
+    def __init__(self):
+        """Initializer for CommandScheduler"""
+        self.heap = []
+        self.jobs = {}
+        self.ids = count(1)
+        self.hold_deadline = None
+        self.hold_until = None
+        self.condition = Condition()
+
+    def put(self, command, priority=NORMAL):
+        """Queues a Command
+
+        Parameters
+        ----------
+        command : str
+            Command to Queue
+        priority : int
+            CommandScheduler.URGENT or CommandScheduler.NORMAL
+
+        Returns
+        -------
+        int
+            Job ID, for Cancelling the Command
+        """
+        with self.condition:
+            job_id = next(self.ids)
+            # Job IDs Increase, so Commands of Equal Priority Stay in Order
+            heapq.heappush(self.heap, (priority, job_id))
+            self.jobs[job_id] = command
+            self.condition.notify_all()
+            return job_id
+
+    def get(self):
+        """Waits for the Next Command That is Allowed to Run
+
+        Returns
+        -------
+        (int, str, int)
+            Job ID, Command and Priority
+        """
+        with self.condition:
+            while True:
+                self.drop_cancelled()
+                if self.heap:
+                    priority, job_id = self.heap[0]
+                    remaining = self.hold_remaining()
+                    if priority == self.URGENT or remaining is None:
+                        heapq.heappop(self.heap)
+                        return job_id, self.jobs.pop(job_id), priority
+                    self.condition.wait(remaining)
+                else:
+                    self.condition.wait()
+
+    def drop_cancelled(self):
+        """Removes Cancelled Jobs From the Top of the Heap (Call With the Lock Held)"""
+        while self.heap and self.heap[0][1] not in self.jobs:
+            heapq.heappop(self.heap)
+
+    def hold_remaining(self):
+        """Seconds Left in the Current Hold, or None (Call With the Lock Held)"""
+        if self.hold_deadline is None:
+            return None
+        remaining = self.hold_deadline - monotonic()
+        if remaining <= 0:
+            self.hold_deadline = None
+            self.hold_until = None
+            return None
+        return remaining
+
+    def hold(self, duration):
+        """Holds Back Normal Commands for a Number of Seconds
+
+        Parameters
+        ----------
+        duration : float
+            Seconds to Wait, Measured on the Monotonic Clock
+
+        Returns
+        -------
+        None
+        """
+        with self.condition:
+            duration = max(duration, 0.0)
+            self.hold_deadline = monotonic() + duration
+            self.hold_until = time() + duration
+            self.condition.notify_all()
+
+    def cancel(self, job_id):
+        """Cancels a Queued Command
+
+        Parameters
+        ----------
+        job_id : int
+            Job ID Returned by put
+
+        Returns
+        -------
+        bool
+            Whether the Command was Still Queued
+        """
+        with self.condition:
+            return self.jobs.pop(job_id, None) is not None
+
+    def clear(self):
+        """Cancels Every Queued Command and Ends Any Hold
+
+        Returns
+        -------
+        int
+            Number of Commands Cancelled
+        """
+        with self.condition:
+            num_cancelled = len(self.jobs)
+            self.heap = []
+            self.jobs = {}
+            self.hold_deadline = None
+            self.hold_until = None
+            self.condition.notify_all()
+            return num_cancelled
+
+    def qsize(self):
+        """Number of Queued Commands
+
+        Returns
+        -------
+        int
+        """
+        with self.condition:
+            return len(self.jobs)
+
+    def timeline(self, limit=10):
+        """Lists the Commands That Will Run Next, in Order
+
+        Parameters
+        ----------
+        limit : int
+            Maximum Number of Commands Listed
+
+        Returns
+        -------
+        dict
+            'hold_until', the Unix Time the Current Wait Ends (or None), and
+            'commands', a List of {'id', 'command', 'urgent'} Dictionaries
+        """
+        with self.condition:
+            self.hold_remaining()
+            upcoming = heapq.nsmallest(
+                limit, (entry for entry in self.heap if entry[1] in self.jobs)
+            )
+            return {
+                "hold_until": self.hold_until,
+                "commands": [
+                    {
+                        "id": job_id,
+                        "command": self.jobs[job_id],
+                        "urgent": priority == self.URGENT,
+                    }
+                    for priority, job_id in upcoming
+                ],
+            }
@@ -0,0 +1,176 @@
+"""ephemeris_cache.py
+
+Module for Interpolating Precomputed Ephemeris Samples Between Refreshes
+
+"""
+import numpy as np
+from numpy.polynomial import chebyshev
+
+
+class EphemerisCache:
+    """
+    Chebyshev Fits of a Short Window of AzEl and vlsr Samples for Every Tracked Object
+
+    Evaluating the fits only costs a few NumPy operations, so any time inside of the
+    sampled window can be looked up without calling into astropy.
+    """
+
+    def __init__(self, names, sample_times, az_table, el_table, vlsr_table, degree=6):
+        """Initializer for EphemerisCache
+
+        Parameters
+        ----------
+        names : list(str)
+            Names of the Objects, in the Same Order as the Table Rows
+        sample_times : (M) ndarray
+            Unix Times (in Seconds) of the Table Columns, in Increasing Order
+        az_table : (N, M) ndarray
+            Azimuth of Each Object at Each Sample Time, in Degrees
+        el_table : (N, M) ndarray
+            Elevation of Each Object at Each Sample Time, in Degrees
+        vlsr_table : (N, M) ndarray
+            vlsr of Each Object at Each Sample Time, in km/s
+        degree : int
+            Maximum Degree of the Chebyshev Series Fit to Each Object
+        """
+        sample_times = np.asarray(sample_times, dtype=float)
+        self.names = list(names)
+        self.name_indices = {name: index for index, name in enumerate(self.names)}
+        self.start_time = float(sample_times[0])
+        self.end_time = float(sample_times[-1])
+        self.center_time = (self.start_time + self.end_time) / 2.0
+        self.half_span = max((self.end_time - self.start_time) / 2.0, 1e-9)
+
+        x = self.to_domain(sample_times)
+        degree = min(degree, len(sample_times) - 1)
+        # Azimuth is Unwrapped so Objects Crossing North Don't Produce a 360 Degree Jump
+        unwrapped_az = np.rad2deg(np.unwrap(np.deg2rad(az_table), axis=1))
+        self.az_coeffs = chebyshev.chebfit(x, unwrapped_az.T, degree)
+        self.el_coeffs = chebyshev.chebfit(x, np.asarray(el_table).T, degree)
+        self.vlsr_coeffs = chebyshev.chebfit(x, np.asarray(vlsr_table).T, degree)
+
+    def to_domain(self, unix_time):
+        """Maps Unix Times onto the [-1, 1] Domain of the Chebyshev Fits
+
+        Parameters
+        ----------
+        unix_time : float or ndarray
+            Unix Time(s) in Seconds
+
+        Returns
+        -------
+        float or ndarray
+            Time(s) Scaled to the Fit Domain
+        """
+        return (unix_time - self.center_time) / self.half_span
+
+    def covers(self, unix_time):
+        """Determines if a Time Falls Within the Sampled Window
+
+        Parameters
+        ----------
+        unix_time : float
+            Unix Time in Seconds
+
+        Returns
+        -------
+        bool
+            Whether the Time Can be Interpolated
+        """
+        return self.start_time <= unix_time <= self.end_time
+
+    def get_azimuth_elevation(self, name, unix_time):
+        """Interpolates a Single Object's AzEl
+
+        Parameters
+        ----------
+        name : str
+            Object Name
+        unix_time : float
+            Unix Time in Seconds
+
+        Returns
+        -------
+        (float, float)
+            (az, el) Tuple
+        """
+        index = self.name_indices[name]
+        x = self.to_domain(unix_time)
+        az = chebyshev.chebval(x, self.az_coeffs[:, index]) % 360.0
+        el = chebyshev.chebval(x, self.el_coeffs[:, index])
+        return float(az), float(el)
+
+    def get_azimuth_elevation_rate(self, name, unix_time):
+        """Differentiates a Single Object's AzEl Fits
+
+        Parameters
+        ----------
+        name : str
+            Object Name
+        unix_time : float
+            Unix Time in Seconds
+
+        Returns
+        -------
+        (float, float)
+            Azimuth and Elevation Rates in Degrees per Second
+        """
+        index = self.name_indices[name]
+        x = self.to_domain(unix_time)
+        # The Fits are in Domain Units, Which Span half_span Seconds
+        az_rate = chebyshev.chebval(x, chebyshev.chebder(self.az_coeffs[:, index]))
+        el_rate = chebyshev.chebval(x, chebyshev.chebder(self.el_coeffs[:, index]))
+        return float(az_rate / self.half_span), float(el_rate / self.half_span)
+
+    def get_all_azimuth_elevation(self, unix_time):
+        """Interpolates the AzEl of Every Object
+
+        Parameters
+        ----------
+        unix_time : float
+            Unix Time in Seconds
+
+        Returns
+        -------
+        {str: (float, float)}
+            Dictionary Mapping Object Names to (az, el) Tuples
+        """
+        x = self.to_domain(unix_time)
+        az = (chebyshev.chebval(x, self.az_coeffs) % 360.0).tolist()
+        el = chebyshev.chebval(x, self.el_coeffs).tolist()
+        return {name: (az[index], el[index]) for index, name in enumerate(self.names)}
+
+    def get_vlsr(self, name, unix_time):
+        """Interpolates a Single Object's vlsr
+
+        Parameters
+        ----------
+        name : str
+            Object Name
+        unix_time : float
+            Unix Time in Seconds
+
+        Returns
+        -------
+        float
+            vlsr in km/s
+        """
+        index = self.name_indices[name]
+        x = self.to_domain(unix_time)
+        return float(chebyshev.chebval(x, self.vlsr_coeffs[:, index]))
+
+    def get_all_vlsr(self, unix_time):
+        """Interpolates the vlsr of Every Object
+
+        Parameters
+        ----------
+        unix_time : float
+            Unix Time in Seconds
+
+        Returns
+        -------
+        {str: float}
+            Dictionary Mapping Object Names to vlsr in km/s
+        """
+        vlsr = chebyshev.chebval(self.to_domain(unix_time), self.vlsr_coeffs).tolist()
+        return {name: vlsr[index] for index, name in enumerate(self.names)}
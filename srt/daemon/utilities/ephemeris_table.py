@@ -0,0 +1,398 @@
+"""ephemeris_table.py
+
+Module for Precomputing and Reading an On-Disk Table of Object AzEl and vlsr
+
+"""
+import numpy as np
+
+import hashlib
+import json
+from pathlib import Path
+from time import time as current_unix_time
+
+from .ephemeris_cache import EphemerisCache
+from . import fast_transforms
+
+TABLE_FILE_NAME = "ephemeris_table.npy"
+METADATA_FILE_NAME = "ephemeris_table.json"
+
+
+def hash_catalog(catalog_path):
+    """Hashes the Contents of a sky_coords.csv File
+
+    Parameters
+    ----------
+    catalog_path : str
+        Path to the sky_coords.csv File
+
+    Returns
+    -------
+    str
+        SHA-256 Hex Digest of the File
+    """
+    with open(catalog_path, "rb") as catalog_file:
+        return hashlib.sha256(catalog_file.read()).hexdigest()
+
+
+def precompute_ephemeris_table(
+    tracker, catalog_path, output_directory, start_time, duration, cadence=10.0
+):
+    """Writes the AzEl and vlsr of Every Object in an EphemerisTracker to Disk
+
+    The table is a float32 .npy file of shape (objects, times, 3) holding az, el and
+    vlsr, written through a memory map in chunks, next to a JSON file describing it.
+
+    Parameters
+    ----------
+    tracker : EphemerisTracker
+        Tracker for the Station and Catalog to Precompute
+    catalog_path : str
+        Path to the sky_coords.csv File Used by the Tracker
+    output_directory : str
+        Directory to Write the Table Into
+    start_time : float
+        Unix Time of the First Sample, in Seconds
+    duration : float
+        Length of Time Covered by the Table, in Seconds
+    cadence : float
+        Time Between Samples, in Seconds
+
+    Returns
+    -------
+    Path
+        Path to the Written Table
+    """
+    from astropy.time import Time
+
+    num_times = int(np.ceil(duration / cadence)) + 1
+    table_path = Path(output_directory, TABLE_FILE_NAME)
+    table = np.lib.format.open_memmap(
+        table_path,
+        mode="w+",
+        dtype=np.float32,
+        shape=(len(tracker.object_names), num_times, 3),
+    )
+    chunk_size = 360
+    for chunk_start in range(0, num_times, chunk_size):
+        chunk_end = min(chunk_start + chunk_size, num_times)
+        unix_times = start_time + np.arange(chunk_start, chunk_end) * cadence
+        az, el, vlsr = tracker.calculate_all_az_el_vlsr(Time(unix_times, format="unix"))
+        table[:, chunk_start:chunk_end] = np.stack([az, el, vlsr], axis=-1)
+    table.flush()
+    del table
+
+    metadata = {
+        "names": tracker.object_names,
+        "start_time": start_time,
+        "cadence": cadence,
+        "num_times": num_times,
+        "latitude": tracker.observer_lat,
+        "longitude": tracker.observer_lon,
+        "catalog_hash": hash_catalog(catalog_path),
+    }
+    with open(Path(output_directory, METADATA_FILE_NAME), "w") as metadata_file:
+        json.dump(metadata, metadata_file, indent=4)
+    return table_path
+
+
+class TableEphemerisTracker:
+    """
+    Drop-in Replacement for EphemerisTracker That Reads a Precomputed Ephemeris Table
+
+    Loading only maps the table into memory, so neither AstroPy nor the IERS data is
+    needed while the current time is covered by the table, unless the rotor position
+    is converted with AstroPy rather than fast_transforms.
+    """
+
+    time_offsets = tuple(range(0, 61, 5))
+
+    def __init__(
+        self,
+        table_directory,
+        refresh_time=10,
+        use_fast_transforms=False,
+        use_refraction=False,
+    ):
+        """Initializer for TableEphemerisTracker
+
+        Parameters
+        ----------
+        table_directory : str
+            Directory Containing the Table and its Metadata
+        refresh_time : float
+            Maximum Amount of Time Cache is Valid, in Seconds
+        use_fast_transforms : bool
+            Whether to Convert AzEl to Galactic and vlsr Using fast_transforms Instead of AstroPy
+        use_refraction : bool
+            Whether the fast_transforms Conversions Correct for Atmospheric Refraction
+        """
+        with open(Path(table_directory, METADATA_FILE_NAME), "r") as metadata_file:
+            self.metadata = json.load(metadata_file)
+        self.table = np.load(Path(table_directory, TABLE_FILE_NAME), mmap_mode="r")
+        self.object_names = self.metadata["names"]
+        self.observer_lat = self.metadata["latitude"]
+        self.observer_lon = self.metadata["longitude"]
+        self.start_time = self.metadata["start_time"]
+        self.cadence = self.metadata["cadence"]
+        self.end_time = (
+            self.start_time + (self.metadata["num_times"] - 1) * self.cadence
+        )
+        self.refresh_time = refresh_time
+        self.use_fast_transforms = use_fast_transforms
+        self.use_refraction = use_refraction
+        self.location = None
+        self.latest_time = None
+
+        self.az_el_dict = {}
+        self.vlsr_dict = {}
+        self.time_interval_dict = {}
+        self.cache = None
+        self.update_all_az_el()
+
+    @classmethod
+    def load(cls, table_directory, latitude, longitude, catalog_path, **kwargs):
+        """Loads a Table if it Exists and Matches the Station, Catalog and Current Time
+
+        Parameters
+        ----------
+        table_directory : str
+            Directory Containing the Table and its Metadata
+        latitude : float
+            Station Latitude, in Degrees
+        longitude : float
+            Station Longitude, in Degrees
+        catalog_path : str
+            Path to the sky_coords.csv File in Use
+        **kwargs
+            Passed to the TableEphemerisTracker Initializer
+
+        Returns
+        -------
+        TableEphemerisTracker or None
+            The Loaded Tracker, or None if the Table is Missing or Stale
+        """
+        metadata_path = Path(table_directory, METADATA_FILE_NAME)
+        if (
+            not metadata_path.is_file()
+            or not Path(table_directory, TABLE_FILE_NAME).is_file()
+        ):
+            return None
+        with open(metadata_path, "r") as metadata_file:
+            metadata = json.load(metadata_file)
+        if (
+            metadata["latitude"] != latitude
+            or metadata["longitude"] != longitude
+            or metadata["catalog_hash"] != hash_catalog(catalog_path)
+        ):
+            return None
+        tracker = cls(table_directory, **kwargs)
+        if not tracker.covers(current_unix_time()):
+            return None
+        return tracker
+
+    def covers(self, unix_time):
+        """Determines if the Table Covers a Time Plus the Longest Cached Time Offset
+
+        Parameters
+        ----------
+        unix_time : float
+            Unix Time in Seconds
+
+        Returns
+        -------
+        bool
+            Whether the Table Can be Used at That Time
+        """
+        return (
+            self.start_time
+            <= unix_time
+            <= self.end_time - self.time_offsets[-1] - self.refresh_time
+        )
+
+    def update_all_az_el(self):
+        """Refits the Interpolation Cache Around the Current Time, if it is Outdated
+
+        Returns
+        -------
+        None
+        """
+        now = current_unix_time()
+        if self.latest_time is not None and now < self.latest_time + self.refresh_time:
+            return
+        num_times = self.metadata["num_times"]
+        window_end = now + self.time_offsets[-1] + self.refresh_time
+        first = int(
+            np.clip(np.floor((now - self.start_time) / self.cadence), 0, num_times - 1)
+        )
+        last = int(
+            np.clip(
+                np.ceil((window_end - self.start_time) / self.cadence), 0, num_times - 1
+            )
+        )
+        first = max(min(first, last - 6), 0)
+        samples = np.asarray(self.table[:, first : last + 1], dtype=float)
+        self.cache = EphemerisCache(
+            self.object_names,
+            self.start_time + np.arange(first, last + 1) * self.cadence,
+            samples[:, :, 0],
+            samples[:, :, 1],
+            samples[:, :, 2],
+        )
+        self.az_el_dict = self.cache.get_all_azimuth_elevation(now)
+        self.vlsr_dict = self.cache.get_all_vlsr(now)
+        self.time_interval_dict = {
+            time_passed: self.cache.get_all_azimuth_elevation(now + time_passed)
+            for time_passed in self.time_offsets
+        }
+        self.latest_time = now
+
+    def get_all_azimuth_elevation(self):
+        """Returns Dictionary Mapping the Objects to their Current AzEl Coordinates
+
+        Returns
+        -------
+        self.az_el_dict : {str: (float, float)}
+        """
+        return self.az_el_dict
+
+    def get_all_azel_time(self):
+        """Returns Dictionary Mapping the Time Offset to a dictionary of updated azel coordinates
+
+        Returns
+        -------
+        self.time_interval_dict : {int: {str: (float, float)}}
+        """
+        return self.time_interval_dict
+
+    def get_all_vlsr(self):
+        """Returns Dictionary Mapping the Objects to their Current vlsr
+
+        Returns
+        -------
+        self.vlsr_dict : {str: float}
+        """
+        return self.vlsr_dict
+
+    def get_azimuth_elevation(self, name, time_offset=0):
+        """Returns Individual Object AzEl at Specified Time Offset
+
+        Parameters
+        ----------
+        name : str
+            Object Name
+        time_offset : float
+            Any Offset from the Current Time, in Seconds
+
+        Returns
+        -------
+        (float, float)
+            (az, el) Tuple
+        """
+        return self.cache.get_azimuth_elevation(name, current_unix_time() + time_offset)
+
+    def get_azimuth_elevation_rate(self, name, time_offset=0):
+        """Returns How Fast an Object's AzEl is Changing at Specified Time Offset
+
+        Parameters
+        ----------
+        name : str
+            Object Name
+        time_offset : float
+            Any Offset from the Current Time, in Seconds
+
+        Returns
+        -------
+        (float, float)
+            Azimuth and Elevation Rates in Degrees per Second
+        """
+        return self.cache.get_azimuth_elevation_rate(
+            name, current_unix_time() + time_offset
+        )
+
+    def get_vlsr(self, name, time_offset=0):
+        """Returns Individual Object vlsr at Specified Time Offset
+
+        Parameters
+        ----------
+        name : str
+            Object Name
+        time_offset : float
+            Any Offset from the Current Time, in Seconds
+
+        Returns
+        -------
+        float
+            vlsr in km/s
+        """
+        return self.cache.get_vlsr(name, current_unix_time() + time_offset)
+
+    def get_location(self):
+        """Gets the AstroPy EarthLocation of the Station, Loading AstroPy on First Use
+
+        Returns
+        -------
+        EarthLocation
+        """
+        if self.location is None:
+            from .object_tracker import station_location
+
+            self.location = station_location(self.observer_lat, self.observer_lon)
+        return self.location
+
+    def calculate_vlsr_azel(self, az_el, time=None):
+        """Takes an AzEl tuple and derives the vlsr from Location
+
+        Parameters
+        ----------
+        az_el : (float, float)
+            Azimuth and Elevation
+        time : AstroPy Time Obj
+            Time of Conversion
+
+        Returns
+        -------
+        float
+            vlsr in km/s.
+        """
+        if not self.use_fast_transforms:
+            from .object_tracker import astropy_vlsr_azel
+
+            return astropy_vlsr_azel(self.get_location(), az_el, time)
+        az, el = az_el
+        unix_time = current_unix_time() if time is None else time.unix
+        return float(
+            fast_transforms.vlsr_azel(
+                az,
+                el,
+                self.observer_lat,
+                self.observer_lon,
+                unix_time,
+                self.use_refraction,
+            )
+        )
+
+    def convert_to_gal_coord(self, az_el, time=None):
+        """Converts an AzEl Tuple into a Galactic Tuple from Location
+
+        Parameters
+        ----------
+        az_el : (float, float)
+            Azimuth and Elevation to Convert
+        time : AstroPy Time Obj
+            Time of Conversion
+
+        Returns
+        -------
+        (float, float)
+            Galactic Latitude and Longitude
+        """
+        if not self.use_fast_transforms:
+            from .object_tracker import astropy_azel_to_galactic
+
+            return astropy_azel_to_galactic(self.get_location(), az_el, time)
+        az, el = az_el
+        unix_time = current_unix_time() if time is None else time.unix
+        g_lat, g_lng = fast_transforms.azel_to_galactic(
+            az, el, self.observer_lat, self.observer_lon, unix_time, self.use_refraction
+        )
+        return float(g_lat), float(g_lng)
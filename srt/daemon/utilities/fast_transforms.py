@@ -0,0 +1,395 @@
+"""fast_transforms.py
+
+NumPy-Only Approximations of the AstroPy Coordinate Transforms Used While Tracking
+
+The transforms use mean sidereal time, IAU 1976 precession, first order annual
+aberration and a low precision solar ephemeris for the Earth's velocity.  Nutation,
+polar motion and UT1-UTC are neglected.  Compared against AstroPy (without
+refraction, which matches the AltAz frames used in object_tracker.py), the error
+stays below MAX_POSITION_ERROR degrees on the sky and MAX_VLSR_ERROR km/s in vlsr,
+which scripts/test_fast_transforms.py checks over a grid of az, el and times.
+
+"""
+import numpy as np
+
+# Accuracy Budget Against AstroPy
+MAX_POSITION_ERROR = 0.02  # degrees
+MAX_VLSR_ERROR = 0.05  # km/s
+
+SECONDS_PER_DAY = 86400.0
+UNIX_EPOCH_JD = 2440587.5
+J2000_JD = 2451545.0
+AU_PER_DAY_TO_KM_PER_S = 149597870.7 / SECONDS_PER_DAY
+SPEED_OF_LIGHT = 299792.458  # km/s
+EARTH_EQUATORIAL_SPEED = 0.4651  # km/s
+ARCSEC = np.pi / (180.0 * 3600.0)
+
+# Rotation From ICRS (~J2000 Mean Equator) to Galactic Coordinates (Hipparcos Definition)
+ICRS_TO_GALACTIC = np.array(
+    [
+        [-0.0548755604162154, -0.8734370902348850, -0.4838350155487132],
+        [0.4941094278755837, -0.4448296299600112, 0.7469822444972189],
+        [-0.8676661490190047, -0.1980763734312015, 0.4559837761750669],
+    ]
+)
+
+
+def julian_centuries(unix_time):
+    """Converts Unix Time to Julian Days and Centuries Since J2000
+
+    Parameters
+    ----------
+    unix_time : float
+        Unix Time in Seconds
+
+    Returns
+    -------
+    (float, float)
+        Days Since J2000 and Julian Centuries Since J2000
+    """
+    days = unix_time / SECONDS_PER_DAY + UNIX_EPOCH_JD - J2000_JD
+    return days, days / 36525.0
+
+
+def local_sidereal_time(unix_time, longitude):
+    """Calculates Local Mean Sidereal Time
+
+    Parameters
+    ----------
+    unix_time : float
+        Unix Time in Seconds (UTC is Used in Place of UT1)
+    longitude : float
+        Observer's Longitude in Degrees, East Positive
+
+    Returns
+    -------
+    float
+        Local Mean Sidereal Time in Radians
+    """
+    days, centuries = julian_centuries(unix_time)
+    gmst = (
+        280.46061837
+        + 360.98564736629 * days
+        + 0.000387933 * centuries**2
+        - centuries**3 / 38710000.0
+    )
+    return np.deg2rad((gmst + longitude) % 360.0)
+
+
+def rotation_y(angle):
+    """Coordinate Rotation Matrix About the Y Axis"""
+    c, s = np.cos(angle), np.sin(angle)
+    return np.array([[c, 0.0, -s], [0.0, 1.0, 0.0], [s, 0.0, c]])
+
+
+def rotation_z(angle):
+    """Coordinate Rotation Matrix About the Z Axis"""
+    c, s = np.cos(angle), np.sin(angle)
+    return np.array([[c, s, 0.0], [-s, c, 0.0], [0.0, 0.0, 1.0]])
+
+
+def precession_matrix(unix_time):
+    """IAU 1976 Precession Matrix From the J2000 Mean Equator to the Mean Equator of Date
+
+    Parameters
+    ----------
+    unix_time : float
+        Unix Time in Seconds
+
+    Returns
+    -------
+    (3, 3) ndarray
+        Rotation Matrix
+    """
+    _, t = julian_centuries(unix_time)
+    zeta = (2306.2181 * t + 0.30188 * t**2 + 0.017998 * t**3) * ARCSEC
+    z = (2306.2181 * t + 1.09468 * t**2 + 0.018203 * t**3) * ARCSEC
+    theta = (2004.3109 * t - 0.42665 * t**2 - 0.041833 * t**3) * ARCSEC
+    return rotation_z(-z) @ rotation_y(theta) @ rotation_z(-zeta)
+
+
+def earth_velocity(unix_time):
+    """Approximate Velocity of the Earth Around the Sun, in the Equatorial Frame of Date
+
+    Parameters
+    ----------
+    unix_time : float
+        Unix Time in Seconds
+
+    Returns
+    -------
+    (3) ndarray
+        Velocity Vector in km/s
+    """
+    days, _ = julian_centuries(unix_time)
+    anomaly_rate = np.deg2rad(0.9856003)
+    g = np.deg2rad(357.528) + anomaly_rate * days
+    longitude = np.deg2rad(
+        280.460 + 0.9856474 * days + 1.915 * np.sin(g) + 0.020 * np.sin(2 * g)
+    )
+    distance = 1.00014 - 0.01671 * np.cos(g) - 0.00014 * np.cos(2 * g)
+    longitude_rate = np.deg2rad(0.9856474) + anomaly_rate * np.deg2rad(
+        1.915 * np.cos(g) + 0.040 * np.cos(2 * g)
+    )
+    distance_rate = anomaly_rate * (0.01671 * np.sin(g) + 0.00028 * np.sin(2 * g))
+    # The Earth Moves Opposite to the Apparent Geocentric Motion of the Sun
+    v_x = -(
+        distance_rate * np.cos(longitude)
+        - distance * np.sin(longitude) * longitude_rate
+    )
+    v_y = -(
+        distance_rate * np.sin(longitude)
+        + distance * np.cos(longitude) * longitude_rate
+    )
+    obliquity = np.deg2rad(23.439 - 0.0000004 * days)
+    return AU_PER_DAY_TO_KM_PER_S * np.array(
+        [v_x, v_y * np.cos(obliquity), v_y * np.sin(obliquity)]
+    )
+
+
+def observer_velocity(unix_time, latitude, longitude):
+    """Approximate Velocity of an Observer on the Earth, in the Equatorial Frame of Date
+
+    Parameters
+    ----------
+    unix_time : float
+        Unix Time in Seconds
+    latitude : float
+        Observer's Latitude in Degrees
+    longitude : float
+        Observer's Longitude in Degrees
+
+    Returns
+    -------
+    (3) ndarray
+        Velocity Vector in km/s
+    """
+    lst = local_sidereal_time(unix_time, longitude)
+    rotation_speed = EARTH_EQUATORIAL_SPEED * np.cos(np.deg2rad(latitude))
+    return earth_velocity(unix_time) + rotation_speed * np.array(
+        [-np.sin(lst), np.cos(lst), 0.0]
+    )
+
+
+def refraction(elevation, pressure=1010.0, temperature=10.0):
+    """Bennett's Atmospheric Refraction for an Apparent (Observed) Elevation
+
+    Parameters
+    ----------
+    elevation : float or ndarray
+        Apparent Elevation in Degrees
+    pressure : float
+        Atmospheric Pressure in Millibars
+    temperature : float
+        Air Temperature in Celsius
+
+    Returns
+    -------
+    float or ndarray
+        Refraction in Degrees (Apparent Minus True Elevation)
+    """
+    elevation = np.maximum(elevation, -1.0)
+    arcmin = 1.0 / np.tan(np.deg2rad(elevation + 7.31 / (elevation + 4.4)))
+    return arcmin / 60.0 * (pressure / 1010.0) * (283.0 / (273.0 + temperature))
+
+
+def unrefraction(elevation, pressure=1010.0, temperature=10.0):
+    """Saemundsson's Atmospheric Refraction for a True (Geometric) Elevation
+
+    Parameters
+    ----------
+    elevation : float or ndarray
+        True Elevation in Degrees
+    pressure : float
+        Atmospheric Pressure in Millibars
+    temperature : float
+        Air Temperature in Celsius
+
+    Returns
+    -------
+    float or ndarray
+        Refraction in Degrees (Apparent Minus True Elevation)
+    """
+    elevation = np.maximum(elevation, -1.0)
+    arcmin = 1.02 / np.tan(np.deg2rad(elevation + 10.3 / (elevation + 5.11)))
+    return arcmin / 60.0 * (pressure / 1010.0) * (283.0 / (273.0 + temperature))
+
+
+def azel_to_date_vectors(az, el, latitude, lst):
+    """Converts AzEl to Unit Vectors in the Equatorial Frame of Date"""
+    az, el = np.deg2rad(az), np.deg2rad(el)
+    lat = np.deg2rad(latitude)
+    sin_dec = np.sin(lat) * np.sin(el) + np.cos(lat) * np.cos(el) * np.cos(az)
+    cos_dec_cos_ha = np.cos(lat) * np.sin(el) - np.sin(lat) * np.cos(el) * np.cos(az)
+    cos_dec_sin_ha = -np.cos(el) * np.sin(az)
+    # Right Ascension is the Sidereal Time Minus the Hour Angle
+    x = np.cos(lst) * cos_dec_cos_ha + np.sin(lst) * cos_dec_sin_ha
+    y = np.sin(lst) * cos_dec_cos_ha - np.cos(lst) * cos_dec_sin_ha
+    return np.stack([x, y, sin_dec], axis=-1)
+
+
+def date_vectors_to_azel(vectors, latitude, lst):
+    """Converts Unit Vectors in the Equatorial Frame of Date to AzEl in Degrees"""
+    x, y, sin_dec = vectors[..., 0], vectors[..., 1], vectors[..., 2]
+    cos_dec_cos_ha = np.cos(lst) * x + np.sin(lst) * y
+    cos_dec_sin_ha = np.sin(lst) * x - np.cos(lst) * y
+    lat = np.deg2rad(latitude)
+    el = np.arcsin(
+        np.clip(np.sin(lat) * sin_dec + np.cos(lat) * cos_dec_cos_ha, -1.0, 1.0)
+    )
+    az = np.arctan2(
+        -cos_dec_sin_ha, np.cos(lat) * sin_dec - np.sin(lat) * cos_dec_cos_ha
+    )
+    return np.rad2deg(az) % 360.0, np.rad2deg(el)
+
+
+def aberrate(vectors, velocity, inverse=False):
+    """Applies (or Removes) First Order Aberration to Unit Vectors"""
+    beta = velocity / SPEED_OF_LIGHT
+    if inverse:
+        beta = -beta
+    shifted = vectors + beta - np.sum(vectors * beta, axis=-1, keepdims=True) * vectors
+    return shifted / np.linalg.norm(shifted, axis=-1, keepdims=True)
+
+
+def azel_to_galactic(az, el, latitude, longitude, unix_time, use_refraction=False):
+    """Converts Observed AzEl to Galactic Coordinates
+
+    Parameters
+    ----------
+    az : float or ndarray
+        Azimuth in Degrees
+    el : float or ndarray
+        Elevation in Degrees
+    latitude : float
+        Observer's Latitude in Degrees
+    longitude : float
+        Observer's Longitude in Degrees
+    unix_time : float
+        Unix Time in Seconds
+    use_refraction : bool
+        Whether to Remove Atmospheric Refraction from the Elevation
+
+    Returns
+    -------
+    (float, float) or (ndarray, ndarray)
+        Galactic Latitude and Longitude in Degrees
+    """
+    if use_refraction:
+        el = el - refraction(el)
+    lst = local_sidereal_time(unix_time, longitude)
+    vectors = azel_to_date_vectors(az, el, latitude, lst)
+    vectors = aberrate(vectors, observer_velocity(unix_time, latitude, longitude), True)
+    galactic = vectors @ precession_matrix(unix_time) @ ICRS_TO_GALACTIC.T
+    g_lat = np.rad2deg(np.arcsin(np.clip(galactic[..., 2], -1.0, 1.0)))
+    g_lon = np.rad2deg(np.arctan2(galactic[..., 1], galactic[..., 0])) % 360.0
+    return g_lat, g_lon
+
+
+def galactic_to_azel(
+    g_lat, g_lon, latitude, longitude, unix_time, use_refraction=False
+):
+    """Converts Galactic Coordinates to Observed AzEl
+
+    Parameters
+    ----------
+    g_lat : float or ndarray
+        Galactic Latitude in Degrees
+    g_lon : float or ndarray
+        Galactic Longitude in Degrees
+    latitude : float
+        Observer's Latitude in Degrees
+    longitude : float
+        Observer's Longitude in Degrees
+    unix_time : float
+        Unix Time in Seconds
+    use_refraction : bool
+        Whether to Add Atmospheric Refraction to the Elevation
+
+    Returns
+    -------
+    (float, float) or (ndarray, ndarray)
+        Azimuth and Elevation in Degrees
+    """
+    b, l = np.deg2rad(g_lat), np.deg2rad(g_lon)
+    galactic = np.stack([np.cos(b) * np.cos(l), np.cos(b) * np.sin(l), np.sin(b)], -1)
+    vectors = galactic @ ICRS_TO_GALACTIC @ precession_matrix(unix_time).T
+    return date_vectors_to_azel_observed(
+        vectors, latitude, longitude, unix_time, use_refraction
+    )
+
+
+def radec_to_azel(ra, dec, latitude, longitude, unix_time, use_refraction=False):
+    """Converts ICRS Right Ascension and Declination to Observed AzEl
+
+    Parameters
+    ----------
+    ra : float or ndarray
+        Right Ascension in Degrees
+    dec : float or ndarray
+        Declination in Degrees
+    latitude : float
+        Observer's Latitude in Degrees
+    longitude : float
+        Observer's Longitude in Degrees
+    unix_time : float
+        Unix Time in Seconds
+    use_refraction : bool
+        Whether to Add Atmospheric Refraction to the Elevation
+
+    Returns
+    -------
+    (float, float) or (ndarray, ndarray)
+        Azimuth and Elevation in Degrees
+    """
+    ra, dec = np.deg2rad(ra), np.deg2rad(dec)
+    icrs = np.stack(
+        [np.cos(dec) * np.cos(ra), np.cos(dec) * np.sin(ra), np.sin(dec)], -1
+    )
+    vectors = icrs @ precession_matrix(unix_time).T
+    return date_vectors_to_azel_observed(
+        vectors, latitude, longitude, unix_time, use_refraction
+    )
+
+
+def date_vectors_to_azel_observed(
+    vectors, latitude, longitude, unix_time, use_refraction
+):
+    """Aberrates Mean Place Vectors of Date and Converts Them to Observed AzEl"""
+    vectors = aberrate(vectors, observer_velocity(unix_time, latitude, longitude))
+    az, el = date_vectors_to_azel(
+        vectors, latitude, local_sidereal_time(unix_time, longitude)
+    )
+    if use_refraction:
+        el = el + unrefraction(el)
+    return az, el
+
+
+def vlsr_azel(az, el, latitude, longitude, unix_time, use_refraction=False):
+    """Calculates the Barycentric Radial Velocity Correction Towards an Observed AzEl
+
+    Parameters
+    ----------
+    az : float or ndarray
+        Azimuth in Degrees
+    el : float or ndarray
+        Elevation in Degrees
+    latitude : float
+        Observer's Latitude in Degrees
+    longitude : float
+        Observer's Longitude in Degrees
+    unix_time : float
+        Unix Time in Seconds
+    use_refraction : bool
+        Whether to Remove Atmospheric Refraction from the Elevation
+
+    Returns
+    -------
+    float or ndarray
+        Radial Velocity Correction in km/s
+    """
+    if use_refraction:
+        el = el - refraction(el)
+    lst = local_sidereal_time(unix_time, longitude)
+    vectors = azel_to_date_vectors(az, el, latitude, lst)
+    return vectors @ observer_velocity(unix_time, latitude, longitude)
@@ -3,7 +3,6 @@
 Extra Functions Condensed for Ease-of-Use
 
 """
-import zmq
 import numpy as np
 
 
@@ -51,31 +50,26 @@ def azel_within_range(actual_azel, desired_azel, bounds=(0.5, 0.5)):
     )
 
 
-def get_spectrum(port=5561):
-    """Quickly opens a zmq socket and gets a spectrum
+def angle_within_limits(angle, limits):
+    """Determines if an Angle is Within a Motor's Limits
 
     Parameters
     ----------
-    port : int
-        Number that the spectrum data is broadcast on.
+    angle : float
+        Angle in Degrees
+    limits : (float, float)
+        Lower and Upper Limits, Which Wrap Around if the Lower is Greater
 
     Returns
     -------
-    var : array_like
-        Spectrum array as numpy array
-
+    bool
+        Whether the Angle is Within the Limits
     """
-    context = zmq.Context()
-    socket = context.socket(zmq.SUB)
-    socket.connect("tcp://localhost:%s" % port)
-    socket.subscribe("")
-    try:
-        rec = socket.recv()
-        var = np.frombuffer(rec, dtype="float32")
-    except:
-        return None
-
-    return var
+    lower_limit, upper_limit = limits
+    if lower_limit <= upper_limit:
+        return lower_limit <= angle <= upper_limit
+    else:
+        return not lower_limit < angle < upper_limit
 
 
 def sinc_interp2d(x, y, values, dx, dy, xout, yout):
@@ -0,0 +1,88 @@
+"""log_store.py
+
+Module for Keeping a Bounded, Sequence Numbered Log of Daemon Messages
+
+"""
+from collections import deque
+from itertools import islice
+from threading import Lock
+from time import time
+
+
+class LogStore:
+    """
+    Fixed Capacity Ring Buffer of Log Entries, Each With a Sequence Number and Level
+
+    Sequence numbers start at 1 and increase by one per entry, so a reader can ask for
+    everything after the last entry it has seen, and tell from the first sequence
+    number still stored whether older entries were dropped.
+    """
+
+    LEVELS = ("debug", "info", "warning", "error")
+
+    def __init__(self, capacity=1000):
+        """Initializer for LogStore
+
+        Parameters
+        ----------
+        capacity : int
+            Maximum Number of Entries Kept
+        """
+        self.entries = deque(maxlen=capacity)
+        self.latest_seq = 0
+        self.lock = Lock()
+
+    def append(self, message, level="info"):
+        """Adds an Entry to the Log, Dropping the Oldest Entry if Full
+
+        Parameters
+        ----------
+        message : str
+            Message to Log
+        level : str
+            Severity Level, One of LogStore.LEVELS
+
+        Returns
+        -------
+        int
+            Sequence Number of the New Entry
+        """
+        if level not in self.LEVELS:
+            raise ValueError(f"Unknown Log Level {level}")
+        with self.lock:
+            self.latest_seq += 1
+            self.entries.append(
+                {
+                    "seq": self.latest_seq,
+                    "time": time(),
+                    "level": level,
+                    "message": message,
+                }
+            )
+            return self.latest_seq
+
+    def since(self, seq=0, limit=100):
+        """Gets the Entries Logged After a Sequence Number, Oldest First
+
+        Parameters
+        ----------
+        seq : int
+            Sequence Number of the Last Entry Already Seen (0 for All Entries)
+        limit : int
+            Maximum Number of Entries to Return
+
+        Returns
+        -------
+        dict
+            Log Query Reply With the Entries and the First and Latest Stored Sequence
+        """
+        with self.lock:
+            first_seq = self.entries[0]["seq"] if self.entries else self.latest_seq + 1
+            start = max(seq + 1 - first_seq, 0)
+            entries = list(islice(self.entries, start, start + max(limit, 0)))
+            return {
+                "type": "logs",
+                "first_seq": first_seq,
+                "latest_seq": self.latest_seq,
+                "entries": entries,
+            }
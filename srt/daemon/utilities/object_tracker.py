@@ -12,17 +12,104 @@ import astropy.units as u
 
 import numpy as np
 from pathlib import Path
-from copy import deepcopy
+from time import time as current_unix_time
 
+from .ephemeris_cache import EphemerisCache
+from . import fast_transforms
 
 root_folder = Path(__file__).parent.parent.parent.parent
 
 
+def station_location(observer_lat, observer_lon, observer_elevation=0):
+    """Creates the AstroPy EarthLocation of a Station
+
+    Parameters
+    ----------
+    observer_lat : float
+        Observer's Location Latitude in degrees
+    observer_lon : float
+        Observer's Location Longitude in degrees
+    observer_elevation : float
+        Observer's Location Elevation in meters
+
+    Returns
+    -------
+    EarthLocation
+    """
+    return EarthLocation.from_geodetic(
+        lat=observer_lat * u.deg,
+        lon=observer_lon * u.deg,
+        height=observer_elevation * u.m,
+    )
+
+
+def astropy_vlsr_azel(location, az_el, time=None):
+    """Derives the vlsr of an AzEl Tuple at a Location Using AstroPy
+
+    Parameters
+    ----------
+    location : EarthLocation
+        Location of the Observer
+    az_el : (float, float)
+        Azimuth and Elevation
+    time : AstroPy Time Obj
+        Time of Conversion, or None for Now
+
+    Returns
+    -------
+    float
+        vlsr in km/s.
+    """
+    if time is None:
+        time = Time.now()
+
+    az, el = az_el
+    start_frame = AltAz(obstime=time, location=location, alt=el * u.deg, az=az * u.deg)
+    end_frame = Galactic()
+    result = start_frame.transform_to(end_frame)
+    sk1 = SkyCoord(result)
+    f1 = AltAz(obstime=time, location=location)
+    vlsr = sk1.transform_to(f1).radial_velocity_correction(obstime=time)
+
+    return vlsr.to(u.km / u.s).value
+
+
+def astropy_azel_to_galactic(location, az_el, time=None):
+    """Converts an AzEl Tuple at a Location into a Galactic Tuple Using AstroPy
+
+    Parameters
+    ----------
+    location : EarthLocation
+        Location of the Observer
+    az_el : (float, float)
+        Azimuth and Elevation to Convert
+    time : AstroPy Time Obj
+        Time of Conversion, or None for Now
+
+    Returns
+    -------
+    (float, float)
+        Galactic Latitude and Longitude
+    """
+    if time is None:
+        time = Time.now()
+    az, el = az_el
+    start_frame = AltAz(obstime=time, location=location, alt=el * u.deg, az=az * u.deg)
+    end_frame = Galactic()
+    result = start_frame.transform_to(end_frame)
+    g_lat = float(result.b.degree)
+    g_lng = float(result.l.degree)
+    return g_lat, g_lng
+
+
 class EphemerisTracker:
     """
     Enables Calculating the AzEl Coordinates of the Bodies Specified in sky_coords.csv
     """
 
+    # Offsets, in Seconds From the Latest Refresh, at Which Positions are Cached
+    time_offsets = tuple(range(0, 61, 5))
+
     def __init__(
         self,
         observer_lat,
@@ -31,6 +118,8 @@ class EphemerisTracker:
         config_file="config/sky_coords.csv",
         refresh_time=10,
         auto_download=True,
+        use_fast_transforms=False,
+        use_refraction=False,
     ):
         """Initializer for EphemerisTracker
 
@@ -52,6 +141,10 @@ class EphemerisTracker:
             Maximum Amount of Time Cache is Valid
         auto_download : bool
             Whether AstroPy is Permitted to Use Internet to Increase Accuracy
+        use_fast_transforms : bool
+            Whether to Convert AzEl to Galactic and vlsr Using fast_transforms Instead of AstroPy
+        use_refraction : bool
+            Whether the fast_transforms Conversions Correct for Atmospheric Refraction
         """
 
         table = Table.read(Path(root_folder, config_file), format="ascii.csv")
@@ -81,23 +174,25 @@ class EphemerisTracker:
         self.sky_coords = SkyCoord(
             ra=sky_coords_ra * u.deg, dec=sky_coords_dec * u.deg, frame=CIRS
         )
-        self.location = EarthLocation.from_geodetic(
-            lat=observer_lat * u.deg,
-            lon=observer_lon * u.deg,
-            height=observer_elevation * u.m,
-        )
+        self.location = station_location(observer_lat, observer_lon, observer_elevation)
+        self.observer_lat = observer_lat
+        self.observer_lon = observer_lon
+        self.use_fast_transforms = use_fast_transforms
+        self.use_refraction = use_refraction
+        self.object_names = list(self.sky_coord_names) + ["Sun", "Moon"]
         self.latest_time = None
         self.refresh_time = refresh_time * u.second
 
         self.az_el_dict = {}
         self.vlsr_dict = {}
-        # self.time_interval_dict = {}
-        self.time_interval_dict = self.inital_azeltime()
-
-        self.update_all_az_el()
+        self.time_interval_dict = {}
+        self.az_table = None
+        self.el_table = None
+        self.vlsr_table = None
+        self.cache = None
 
-        # self.update_azeltime()
         conf.auto_download = auto_download
+        self.update_all_az_el()
 
     def calculate_az_el(self, name, time, alt_az_frame):
         """Calculates Azimuth and Elevation of the Specified Object at the Specified Time
@@ -151,7 +246,7 @@ class EphemerisTracker:
             tframe = get_moon(time).transform_to(frame)
             vlsr = tframe.radial_velocity_correction(obstime=time)
         else:
-            tframe = self.sky_coord_names[name].transform_to(frame)
+            tframe = self.sky_coords[self.sky_coord_names[name]].transform_to(frame)
             vlsr = tframe.radial_velocity_correction(obstime=time)
 
         return vlsr.to(u.km / u.s).value
@@ -171,21 +266,21 @@ class EphemerisTracker:
         float
             vlsr in km/s.
         """
+        if self.use_fast_transforms:
+            az, el = az_el
+            unix_time = current_unix_time() if time is None else time.unix
+            return float(
+                fast_transforms.vlsr_azel(
+                    az,
+                    el,
+                    self.observer_lat,
+                    self.observer_lon,
+                    unix_time,
+                    self.use_refraction,
+                )
+            )
 
-        if time is None:
-            time = Time.now()
-
-        az, el = az_el
-        start_frame = AltAz(
-            obstime=time, location=self.location, alt=el * u.deg, az=az * u.deg
-        )
-        end_frame = Galactic()
-        result = start_frame.transform_to(end_frame)
-        sk1 = SkyCoord(result)
-        f1 = AltAz(obstime=time, location=self.location)
-        vlsr = sk1.transform_to(f1).radial_velocity_correction(obstime=time)
-
-        return vlsr.to(u.km/u.s).value
+        return astropy_vlsr_azel(self.location, az_el, time)
 
     def convert_to_gal_coord(self, az_el, time=None):
         """Converts an AzEl Tuple into a Galactic Tuple from Location
@@ -202,17 +297,58 @@ class EphemerisTracker:
         (float, float)
             Galactic Latitude and Longitude
         """
-        if time is None:
-            time = Time.now()
-        az, el = az_el
-        start_frame = AltAz(
-            obstime=time, location=self.location, alt=el * u.deg, az=az * u.deg
+        if self.use_fast_transforms:
+            az, el = az_el
+            unix_time = current_unix_time() if time is None else time.unix
+            g_lat, g_lng = fast_transforms.azel_to_galactic(
+                az,
+                el,
+                self.observer_lat,
+                self.observer_lon,
+                unix_time,
+                self.use_refraction,
+            )
+            return float(g_lat), float(g_lng)
+        return astropy_azel_to_galactic(self.location, az_el, time)
+
+    def calculate_all_az_el_vlsr(self, times):
+        """Calculates the AzEl and vlsr of Every Tracked Object at Every Given Time
+
+        All catalog objects are transformed in a single AltAz frame whose obstime
+        array is broadcast against the catalog, so that the cost is one astropy call
+        for the catalog plus one each for the Sun and the Moon.
+
+        Parameters
+        ----------
+        times : Time
+            1-D Array of Times to Calculate Positions At
+
+        Returns
+        -------
+        (ndarray, ndarray, ndarray)
+            Azimuth, Elevation (degrees) and vlsr (km/s) Tables, Each of Shape
+            (len(self.object_names), len(times))
+        """
+        frame = AltAz(obstime=times[:, np.newaxis], location=self.location)
+        transformed = self.sky_coords[np.newaxis, :].transform_to(frame)
+        vlsr = transformed.radial_velocity_correction()
+        az_rows = [transformed.az.degree.T]
+        el_rows = [transformed.alt.degree.T]
+        vlsr_rows = [vlsr.to_value(u.km / u.s).T]
+
+        body_frame = AltAz(obstime=times, location=self.location)
+        for body in (get_sun(times), get_moon(times, self.location)):
+            body_transformed = body.transform_to(body_frame)
+            body_vlsr = body_transformed.radial_velocity_correction()
+            az_rows.append(body_transformed.az.degree[np.newaxis, :])
+            el_rows.append(body_transformed.alt.degree[np.newaxis, :])
+            vlsr_rows.append(body_vlsr.to_value(u.km / u.s)[np.newaxis, :])
+
+        return (
+            np.concatenate(az_rows),
+            np.concatenate(el_rows),
+            np.concatenate(vlsr_rows),
         )
-        end_frame = Galactic()
-        result = start_frame.transform_to(end_frame)
-        g_lat = float(result.b.degree)
-        g_lng = float(result.l.degree)
-        return g_lat, g_lng
 
     def update_all_az_el(self):
         """Updates Every Entry in the AzEl Dictionary Cache, if the Cache is Outdated
@@ -227,38 +363,38 @@ class EphemerisTracker:
         ):
             return
         time = Time.now()
-        frame = AltAz(obstime=time, location=self.location)
-        transformed = self.sky_coords.transform_to(frame)
-        for name in self.sky_coord_names:
-            index = self.sky_coord_names[name]
-            self.az_el_dict[name] = (
-                transformed.az[index].degree,
-                transformed.alt[index].degree,
-            )
-            vlsr = transformed[index].radial_velocity_correction(obstime=time)
-            self.vlsr_dict[name] = vlsr.to(u.km / u.s).value
-        self.az_el_dict["Sun"] = self.calculate_az_el("Sun", time, frame)
-        self.vlsr_dict["Sun"] = self.calculate_vlsr("Sun", time, frame)
-        self.az_el_dict["Moon"] = self.calculate_az_el("Moon", time, frame)
-        self.vlsr_dict["Moon"] = self.calculate_vlsr("Moon", time, frame)
-
-        for time_passed in range(0, 61, 5):
-
-            timenew = time + time_passed
-            frame = AltAz(obstime=timenew, location=self.location)
-            transformed = self.sky_coords.transform_to(frame)
-
-            for name in self.sky_coord_names:
-                index = self.sky_coord_names[name]
-                self.time_interval_dict[time_passed][name] = (
-                    transformed.az[index].degree,
-                    transformed.alt[index].degree,
-                )
-            self.time_interval_dict[time_passed]["Sun"] = self.calculate_az_el(
-                "Sun", time, frame)
-            self.time_interval_dict[time_passed]["Moon"] = self.calculate_az_el(
-                "Moon", time, frame)
+        times = time + np.array(self.time_offsets) * u.second
+        az_table, el_table, vlsr_table = self.calculate_all_az_el_vlsr(times)
+        self.az_table = az_table
+        self.el_table = el_table
+        self.vlsr_table = vlsr_table
+        self.cache = EphemerisCache(
+            self.object_names,
+            time.unix + np.array(self.time_offsets),
+            az_table,
+            el_table,
+            vlsr_table,
+        )
 
+        # New Dictionaries are Built Rather than Updated so Readers in Other Threads
+        # Never See a Partially Refreshed Cache
+        az_list = az_table.tolist()
+        el_list = el_table.tolist()
+        vlsr_list = vlsr_table.tolist()
+        self.az_el_dict = {
+            name: (az_list[index][0], el_list[index][0])
+            for index, name in enumerate(self.object_names)
+        }
+        self.vlsr_dict = {
+            name: vlsr_list[index][0] for index, name in enumerate(self.object_names)
+        }
+        self.time_interval_dict = {
+            time_passed: {
+                name: (az_list[index][epoch], el_list[index][epoch])
+                for index, name in enumerate(self.object_names)
+            }
+            for epoch, time_passed in enumerate(self.time_offsets)
+        }
         self.latest_time = time
 
     def get_all_azimuth_elevation(self):
@@ -280,66 +416,86 @@ class EphemerisTracker:
         # return
         return self.time_interval_dict
 
-    def get_azimuth_elevation(self, name, time_offset):
+    def get_azimuth_elevation(self, name, time_offset=0):
         """Returns Individual Object AzEl at Specified Time Offset
 
+        Times Within the Cached Window are Interpolated, Without any AstroPy Calls
+
         Parameters
         ----------
         name : str
             Object Name
-        time_offset : Time
-            Any Offset from the Current Time
+        time_offset : float
+            Any Offset from the Current Time, in Seconds
         Returns
         -------
         (float, float)
             (az, el) Tuple
         """
-        if time_offset == 0:
-            return self.get_all_azimuth_elevation()[name]
-        else:
-            time = Time.now() + time_offset
-            return self.calculate_az_el(
-                name, time, AltAz(obstime=time, location=self.location)
-            )
+        unix_time = current_unix_time() + time_offset
+        cache = self.cache
+        if cache is not None and cache.covers(unix_time):
+            return cache.get_azimuth_elevation(name, unix_time)
+        time = Time(unix_time, format="unix")
+        return self.calculate_az_el(
+            name, time, AltAz(obstime=time, location=self.location)
+        )
+
+    def get_azimuth_elevation_rate(self, name, time_offset=0):
+        """Returns How Fast an Object's AzEl is Changing at Specified Time Offset
+
+        Parameters
+        ----------
+        name : str
+            Object Name
+        time_offset : float
+            Any Offset from the Current Time, in Seconds
+
+        Returns
+        -------
+        (float, float)
+            Azimuth and Elevation Rates in Degrees per Second
+        """
+        unix_time = current_unix_time() + time_offset
+        cache = self.cache
+        if cache is not None and cache.covers(unix_time):
+            return cache.get_azimuth_elevation_rate(name, unix_time)
+        # Central Difference Over Two Seconds When Outside the Cached Window
+        before_az, before_el = self.get_azimuth_elevation(name, time_offset - 1)
+        after_az, after_el = self.get_azimuth_elevation(name, time_offset + 1)
+        az_change = (after_az - before_az + 180.0) % 360.0 - 180.0
+        return az_change / 2.0, (after_el - before_el) / 2.0
 
     def get_all_vlsr(self):
+        """Returns Dictionary Mapping the Objects to their Current vlsr
+
+        Returns
+        -------
+        self.vlsr_dict : {str: float}
+        """
         return self.vlsr_dict
 
     def get_vlsr(self, name, time_offset=0):
+        """Returns Individual Object vlsr at Specified Time Offset
 
-        if time_offset == 0:
-            return self.get_all_vlsr()[name]
-        else:
-            time = Time.now() + time_offset
-            frame = AltAz(obstime=time, location=self.location)
-            return self.calculate_vlsr(name, time, frame)
-
-    def inital_azeltime(self):
-        new_dict = {}
-        for time_passed in range(0, 61, 5):
-            # new_time_dict = deepcopy(self.az_el_dict)
-            new_time_dict = {}
-            new_dict[time_passed] = new_time_dict
-        return new_dict
-
-    def update_azeltime(self):
-        # if (
-        #     self.latest_time is not None
-        #     and Time.now() < self.latest_time + self.refresh_time
-        # ):
-        #     return
-
-        for time_passed in range(0, 61, 5):
-
-            time = Time.now() + time_passed
-            frame = AltAz(obstime=time, location=self.location)
-            transformed = self.sky_coords.transform_to(frame)
-
-            for name in self.sky_coord_names:
-                index = self.sky_coord_names[name]
-                self.time_interval_dict[time_passed][name] = (
-                    transformed.az[index].degree,
-                    transformed.alt[index].degree,
-                )
-        self.latest_time = Time.now()
-        return
+        Times Within the Cached Window are Interpolated, Without any AstroPy Calls
+
+        Parameters
+        ----------
+        name : str
+            Object Name
+        time_offset : float
+            Any Offset from the Current Time, in Seconds
+
+        Returns
+        -------
+        float
+            vlsr in km/s
+        """
+        unix_time = current_unix_time() + time_offset
+        cache = self.cache
+        if cache is not None and cache.covers(unix_time):
+            return cache.get_vlsr(name, unix_time)
+        time = Time(unix_time, format="unix")
+        frame = AltAz(obstime=time, location=self.location)
+        return self.calculate_vlsr(name, time, frame)
@@ -0,0 +1,62 @@
+"""scan_engine.py
+
+Module for Collecting Spectra Taken Entirely After the Antenna Settles During Scans
+
+"""
+import numpy as np
+
+from time import time
+
+
+class ScanEngine:
+    """
+    Averages Spectra From a SpectrumCache That Were Integrated After the Antenna Settled
+
+    Every cached spectrum is timestamped on arrival.  Since each spectrum is the
+    integration of the preceding integration_time seconds of samples, it only holds
+    data from after the antenna settled if it arrived at least integration_time
+    seconds after settling, and only those spectra are averaged.
+    """
+
+    def __init__(self, spectrum_cache, integration_time, dwell_time=0.0):
+        """Initializer for ScanEngine
+
+        Parameters
+        ----------
+        spectrum_cache : SpectrumCache
+            Running Cache of Timestamped Spectra
+        integration_time : float
+            Seconds of Samples Integrated Into Each Spectrum
+        dwell_time : float
+            Minimum Seconds of Settled Data to Average at Each Point (At Least One Spectrum)
+        """
+        self.spectrum_cache = spectrum_cache
+        self.integration_time = integration_time
+        self.dwell_time = dwell_time
+
+    def measure(self, settle_time, timeout=None):
+        """Averages the Spectra Integrated Entirely After a Settle Time
+
+        Parameters
+        ----------
+        settle_time : float
+            Unix Time at Which the Antenna Settled on the Current Point
+        timeout : float
+            Seconds After the Settle Time to Give Up, Defaults to Twice the Time Needed
+
+        Returns
+        -------
+        (N) ndarray or None
+            Averaged Spectrum, or None if No Settled Spectrum Arrived in Time
+        """
+        needed_count = max(int(np.ceil(self.dwell_time / self.integration_time)), 1)
+        if timeout is None:
+            timeout = 2 * (needed_count + 1) * self.integration_time + 5.0
+        earliest_arrival = settle_time + self.integration_time
+        self.spectrum_cache.wait_since(
+            earliest_arrival, needed_count, max(settle_time + timeout - time(), 0)
+        )
+        _, _, spectra = self.spectrum_cache.since(earliest_arrival)
+        if len(spectra) == 0:
+            return None
+        return spectra[:needed_count].mean(axis=0)
@@ -0,0 +1,168 @@
+"""spectrum_cache.py
+
+Thread Which Keeps the Latest Spectra From GNU Radio With Timestamps and Rotor Positions
+
+"""
+import zmq
+import numpy as np
+
+from threading import Thread, Condition
+from time import time
+
+
+class SpectrumCache(Thread):
+    """
+    Long-Lived Subscriber Keeping a Ring Buffer of Timestamped Spectra
+
+    Spectra are stored in preallocated NumPy arrays along with their arrival time
+    and the rotor position at arrival, so readers never have to open their own
+    socket or wait through ZMQ's subscription delay.
+    """
+
+    def __init__(self, port, get_rotor_location, capacity=256, name=None):
+        """Initializer for SpectrumCache
+
+        Parameters
+        ----------
+        port : int
+            Port of the Spectrum ZMQ PUB/SUB Socket
+        get_rotor_location : callable
+            Returns the Current Rotor (az, el), Stored With Each Spectrum
+        capacity : int
+            Maximum Number of Spectra Kept
+        name : str
+            Name of the Thread
+        """
+        super().__init__(name=name, daemon=True)
+        self.port = port
+        self.get_rotor_location = get_rotor_location
+        self.capacity = capacity
+        self.times = np.zeros(capacity)
+        self.positions = np.zeros((capacity, 2))
+        self.spectra = None
+        self.count = 0
+        self.condition = Condition()
+
+    def run(self):
+        """Receives Spectra From ZMQ and Stores Them in the Ring Buffer
+
+        Returns
+        -------
+        None
+        """
+        context = zmq.Context()
+        socket = context.socket(zmq.SUB)
+        socket.connect("tcp://localhost:%s" % self.port)
+        socket.subscribe("")
+        while True:
+            spectrum = np.frombuffer(socket.recv(), dtype="float32")
+            arrival_time = time()
+            rotor_location = self.get_rotor_location()
+            with self.condition:
+                if self.spectra is None or self.spectra.shape[1] != len(spectrum):
+                    # Number of Bins Changed, so Older Spectra can't be Kept
+                    self.spectra = np.zeros((self.capacity, len(spectrum)), "float32")
+                    self.count = 0
+                index = self.count % self.capacity
+                self.times[index] = arrival_time
+                self.positions[index] = rotor_location
+                self.spectra[index] = spectrum
+                self.count += 1
+                self.condition.notify_all()
+
+    def _ordered_indices(self):
+        """Indices of the Stored Spectra, Oldest First (Call With the Lock Held)"""
+        stored = min(self.count, self.capacity)
+        return np.arange(self.count - stored, self.count) % self.capacity
+
+    def latest(self, n=1):
+        """Gets the Most Recent Spectra
+
+        Parameters
+        ----------
+        n : int
+            Maximum Number of Spectra
+
+        Returns
+        -------
+        ((M) ndarray, (M, 2) ndarray, (M, N) ndarray)
+            Arrival Times, Rotor Positions and Spectra, Oldest First
+        """
+        with self.condition:
+            indices = self._ordered_indices()[-n:] if n > 0 else np.arange(0)
+            return self._copy(indices)
+
+    def since(self, start_time):
+        """Gets the Spectra That Arrived at or After a Time
+
+        Parameters
+        ----------
+        start_time : float
+            Unix Time in Seconds
+
+        Returns
+        -------
+        ((M) ndarray, (M, 2) ndarray, (M, N) ndarray)
+            Arrival Times, Rotor Positions and Spectra, Oldest First
+        """
+        with self.condition:
+            indices = self._ordered_indices()
+            return self._copy(indices[self.times[indices] >= start_time])
+
+    def average(self, start_time, end_time):
+        """Averages the Spectra That Arrived Between Two Times
+
+        Parameters
+        ----------
+        start_time : float
+            Earliest Arrival Unix Time in Seconds
+        end_time : float
+            Latest Arrival Unix Time in Seconds
+
+        Returns
+        -------
+        (N) ndarray or None
+            Mean Spectrum, or None if No Spectra Arrived in the Interval
+        """
+        with self.condition:
+            indices = self._ordered_indices()
+            arrivals = self.times[indices]
+            indices = indices[(arrivals >= start_time) & (arrivals <= end_time)]
+            if len(indices) == 0:
+                return None
+            return self.spectra[indices].mean(axis=0)
+
+    def wait_since(self, start_time, n=1, timeout=None):
+        """Blocks Until a Number of Spectra Have Arrived Since a Time
+
+        Parameters
+        ----------
+        start_time : float
+            Unix Time in Seconds
+        n : int
+            Number of Spectra to Wait For
+        timeout : float
+            Maximum Number of Seconds to Wait, or None to Wait Indefinitely
+
+        Returns
+        -------
+        bool
+            Whether the Spectra Arrived Before the Timeout
+        """
+
+        def count_since():
+            indices = self._ordered_indices()
+            return np.count_nonzero(self.times[indices] >= start_time)
+
+        with self.condition:
+            return self.condition.wait_for(lambda: count_since() >= n, timeout)
+
+    def _copy(self, indices):
+        """Copies Out the Entries at the Given Indices (Call With the Lock Held)"""
+        if self.spectra is None:
+            return np.zeros(0), np.zeros((0, 2)), np.zeros((0, 0), "float32")
+        return (
+            self.times[indices].copy(),
+            self.positions[indices].copy(),
+            self.spectra[indices].copy(),
+        )
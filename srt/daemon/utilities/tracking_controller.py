@@ -0,0 +1,144 @@
+"""tracking_controller.py
+
+Module for Tracking a Moving Object With as Few Rotor Commands as Possible
+
+"""
+from collections import deque
+from math import cos, hypot, radians
+
+
+def sky_separation(first_azel, second_azel):
+    """Approximate Angle Between Two Nearby AzEl Positions
+
+    Parameters
+    ----------
+    first_azel : (float, float)
+        First Azimuth and Elevation
+    second_azel : (float, float)
+        Second Azimuth and Elevation
+
+    Returns
+    -------
+    float
+        Separation in Degrees, Scaling Azimuth by the Cosine of Elevation
+    """
+    az_difference = (second_azel[0] - first_azel[0] + 180.0) % 360.0 - 180.0
+    mean_el = (first_azel[1] + second_azel[1]) / 2.0
+    return hypot(az_difference * cos(radians(mean_el)), second_azel[1] - first_azel[1])
+
+
+class TrackingController:
+    """
+    Commands Lead Positions Ahead of a Moving Object, Only When They are Needed
+
+    Rather than re-commanding the antenna each time it falls behind the object,
+    each setpoint is placed where the object will be once the antenna has moved
+    there and the object has drifted another tolerance along.  The pointing error
+    then sweeps from one side of the object to the other instead of only lagging,
+    and a new setpoint is sent only once the error at the time the antenna could
+    reach it would exceed the tolerance.
+    """
+
+    def __init__(self, tolerance, max_lead=300.0, history=600):
+        """Initializer for TrackingController
+
+        Parameters
+        ----------
+        tolerance : float
+            Largest Pointing Error in Degrees Allowed Before a New Setpoint
+        max_lead : float
+            Most Seconds Ahead of the Object a Setpoint is Placed
+        history : int
+            Number of Recent Tracking Errors Kept for the Statistics
+        """
+        self.tolerance = tolerance
+        self.max_lead = max_lead
+        self.errors = deque(maxlen=history)
+        self.name = None
+        self.num_setpoints = 0
+
+    def reset(self, name=None):
+        """Starts Tracking a New Object, Forgetting the Previous Errors
+
+        Parameters
+        ----------
+        name : str
+            Name of the Object Being Tracked, or None
+
+        Returns
+        -------
+        None
+        """
+        self.name = name
+        self.num_setpoints = 0
+        self.errors.clear()
+
+    def update(self, name, azel, rate, setpoint, move_time=0.0):
+        """Decides Whether a New Setpoint is Needed, and Where
+
+        Parameters
+        ----------
+        name : str
+            Name of the Object Being Tracked
+        azel : (float, float)
+            Current Azimuth and Elevation of the Object
+        rate : (float, float)
+            Azimuth and Elevation Rates of the Object in Degrees per Second
+        setpoint : (float, float)
+            Azimuth and Elevation the Antenna is Currently Commanded to
+        move_time : float
+            Predicted Seconds for the Antenna to Reach a New Setpoint
+
+        Returns
+        -------
+        (float, float) or None
+            Azimuth and Elevation to Command, or None to Keep the Current Setpoint
+        """
+        if name != self.name:
+            self.reset(name)
+        arrival_azel = (azel[0] + rate[0] * move_time, azel[1] + rate[1] * move_time)
+        if sky_separation(arrival_azel, setpoint) < self.tolerance:
+            return None
+        sky_rate = hypot(rate[0] * cos(radians(azel[1])), rate[1])
+        lead = move_time
+        if sky_rate > 0:
+            lead += self.tolerance / sky_rate
+        lead = min(lead, self.max_lead)
+        self.num_setpoints += 1
+        return (azel[0] + rate[0] * lead) % 360.0, azel[1] + rate[1] * lead
+
+    def record_error(self, azel, antenna_azel):
+        """Records How Far the Antenna is From the Object
+
+        Parameters
+        ----------
+        azel : (float, float)
+            Current Azimuth and Elevation of the Object (Including Any Offsets)
+        antenna_azel : (float, float)
+            Current Azimuth and Elevation of the Antenna
+
+        Returns
+        -------
+        None
+        """
+        self.errors.append(sky_separation(azel, antenna_azel))
+
+    def get_status(self):
+        """Summarizes the Tracking of the Current Object
+
+        Returns
+        -------
+        dict or None
+            'object', 'error', 'rms_error' and 'max_error' in Degrees, and
+            'setpoints' Sent, or None if Nothing is Being Tracked
+        """
+        if self.name is None or not self.errors:
+            return None
+        errors = list(self.errors)
+        return {
+            "object": self.name,
+            "error": errors[-1],
+            "rms_error": (sum(error * error for error in errors) / len(errors)) ** 0.5,
+            "max_error": max(errors),
+            "setpoints": self.num_setpoints,
+        }
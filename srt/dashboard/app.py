@@ -29,8 +29,11 @@ import base64
 from .layouts import monitor_page, system_page  # , figure_page
 from .layouts.sidebar import generate_sidebar
 from .messaging.status_fetcher import StatusThread
+from .messaging.log_fetcher import LogThread
 from .messaging.command_dispatcher import CommandThread
 from .messaging.spectrum_fetcher import SpectrumThread
+from .messaging.spectrogram import SpectrogramStore
+from .messaging.spectrum_stream import SpectrumStream, register_spectrum_stream
 
 
 def generate_app(config_dir, config_dict):
@@ -66,13 +69,28 @@ def generate_app(config_dir, config_dict):
     status_thread = StatusThread(port=5555)
     status_thread.start()
 
+    log_thread = LogThread(status_thread)
+    log_thread.start()
+
     command_thread = CommandThread(port=5556)
     command_thread.start()
 
     raw_spectrum_thread = SpectrumThread(port=5561)
     raw_spectrum_thread.start()
 
-    cal_spectrum_thread = SpectrumThread(port=5563)
+    # The Waterfall Shows Calibrated Spectra, Averaged Into Time Bins and Channels
+    if "DASHBOARD_WATERFALL_SECONDS" in config_dict.keys():
+        waterfall_resolution = config_dict["DASHBOARD_WATERFALL_SECONDS"]
+    else:
+        waterfall_resolution = 10.0
+    if "DASHBOARD_WATERFALL_CHANNELS" in config_dict.keys():
+        waterfall_channels = config_dict["DASHBOARD_WATERFALL_CHANNELS"]
+    else:
+        waterfall_channels = 256
+    cal_spectrum_thread = SpectrumThread(
+        port=5563,
+        spectrogram=SpectrogramStore(waterfall_resolution, waterfall_channels),
+    )
     cal_spectrum_thread.start()
 
     # Dictionary of Pages and matching URL prefixes
@@ -85,6 +103,16 @@ def generate_app(config_dir, config_dict):
         refresh_time = config_dict["DASHBOARD_REFRESH_MS"]  # ms
     else:
         refresh_time = 1000
+    # Optionally Push Spectra to Browsers as They Arrive, Rather Than Polling
+    if "DASHBOARD_STREAM_MS" in config_dict.keys():
+        stream_time = config_dict["DASHBOARD_STREAM_MS"]  # ms
+        spectrum_stream = SpectrumStream(
+            {"raw": raw_spectrum_thread, "cal": cal_spectrum_thread},
+            stream_time / 1000,
+        )
+        register_spectrum_stream(server, spectrum_stream)
+    else:
+        stream_time = None
     pio.templates.default = "seaborn"  # Style Choice for Graphs
     curfold = Path(__file__).parent.absolute()
     # Generate Sidebar Objects
@@ -144,6 +172,14 @@ def generate_app(config_dir, config_dict):
             content,
             dcc.Interval(id="interval-component",
                          interval=refresh_time, n_intervals=0),
+            dcc.Interval(
+                id="stream-interval",
+                interval=stream_time or refresh_time,
+                n_intervals=0,
+                disabled=stream_time is None,
+            ),
+            # Whether This Browser's Spectrum Stream is Open, Set by the Browser
+            dcc.Store(id="stream-receiving", data=False),
             html.Div(id="output-clientside"),
         ],
         id="mainContainer",
@@ -182,7 +218,7 @@ def generate_app(config_dir, config_dict):
         software
     )
     # Create Callbacks for System Page Objects
-    system_page.register_callbacks(app, config_dict, status_thread)
+    system_page.register_callbacks(app, config_dict, status_thread, log_thread)
 
     # # Create Callbacks for figure page callbacks
     # figure_page.register_callbacks(app,config_dict, status_thread)
@@ -0,0 +1,67 @@
+if (!window.dash_clientside) {
+  window.dash_clientside = {};
+}
+(function() {
+  // Stream Event Name of Each Spectrum Graph
+  var streams = {
+    "raw-spectrum-histogram": "raw",
+    "cal-spectrum-histogram": "cal"
+  };
+  var calibrated = {"cal-spectrum-histogram": true};
+  var latest = {};
+  var source = null;
+
+  function connect() {
+    source = new EventSource("/stream/spectra");
+    Object.keys(streams).forEach(function(id) {
+      source.addEventListener(streams[id], function(event) {
+        var bytes = Uint8Array.from(atob(event.data), function(c) {
+          return c.charCodeAt(0);
+        });
+        latest[streams[id]] = new Float32Array(bytes.buffer);
+      });
+    });
+    // Refused While Too Many Browsers are Streaming, so Try Again Later
+    source.onerror = function() {
+      if (source.readyState === EventSource.CLOSED) {
+        setTimeout(function() {
+          source = null;
+        }, 30000);
+      }
+    };
+  }
+
+  window.dash_clientside.stream = {
+    // Tells the Server Whether it Must Still Send This Browser its Spectra
+    receiving: function(n, shown) {
+      var open = source !== null && source.readyState === EventSource.OPEN;
+      return open === shown ? window.dash_clientside.no_update : open;
+    },
+    spectrum: function(n, id) {
+      if (source === null) {
+        connect();
+      }
+      var name = streams[id];
+      var spectrum = latest[name];
+      if (!spectrum) {
+        return window.dash_clientside.no_update;
+      }
+      delete latest[name];
+      if (calibrated[id]) {
+        var graph = document.getElementById(id);
+        var plot = graph && graph.querySelector(".js-plotly-plot");
+        if (plot) {
+          var low = Infinity;
+          var high = -Infinity;
+          for (var i = 0; i < spectrum.length; i++) {
+            low = Math.min(low, spectrum[i]);
+            high = Math.max(high, spectrum[i]);
+          }
+          Plotly.relayout(plot, {"yaxis.range": [low, high]});
+        }
+      }
+      // Extending by a Whole Spectrum With maxPoints of its Length Replaces it
+      return [{y: [Array.from(spectrum)]}, [0], spectrum.length];
+    }
+  };
+})();
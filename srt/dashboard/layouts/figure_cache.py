@@ -0,0 +1,95 @@
+"""figure_cache.py
+
+Server-Side Cache of the Latest Figure Built for Each Graph, Keyed on its Inputs' Versions
+
+"""
+from threading import Lock
+
+from dash.exceptions import PreventUpdate
+
+
+class FigureCache:
+    """
+    Keeps the Latest Figure of Each Graph so Browsers Polling the Same Data Share it
+
+    Each browser keeps the key of the figure it last received in a dcc.Store, so a
+    callback can skip sending anything when that browser is already up to date, and
+    only builds a figure once per key no matter how many browsers are connected.
+    """
+
+    def __init__(self):
+        """Initializer for FigureCache"""
+        self.entries = {}
+        self.lock = Lock()
+
+    def get(self, name, key, build):
+        """Gets the Figure for a Key, Building it Only if the Key Changed
+
+        Parameters
+        ----------
+        name : str
+            Name of the Graph
+        key : str
+            Versions of Everything the Figure is Built From
+        build : callable
+            Builds the Figure When it is Not Cached
+
+        Returns
+        -------
+        dict or str
+            Figure, Converted to a Dictionary if it is a Plotly Figure
+        """
+        with self.lock:
+            entry = self.entries.get(name)
+            if entry is not None and entry[0] == key:
+                return entry[1]
+        figure = build()
+        if hasattr(figure, "to_dict"):
+            figure = figure.to_dict()
+        with self.lock:
+            self.entries[name] = (key, figure)
+        return figure
+
+    def update(self, name, key, shown_key, build):
+        """Gets the Figure and Key to Send a Browser, Unless it Already Shows the Key
+
+        Parameters
+        ----------
+        name : str
+            Name of the Graph
+        key : str
+            Versions of Everything the Figure is Built From
+        shown_key : str
+            Key of the Figure the Browser Last Received
+        build : callable
+            Builds the Figure When it is Not Cached
+
+        Returns
+        -------
+        (dict or str, str)
+            Figure and its Key
+
+        Raises
+        ------
+        PreventUpdate
+            If the Browser Already Shows the Figure for the Key
+        """
+        if key == shown_key:
+            raise PreventUpdate
+        return self.get(name, key, build), key
+
+
+def version_key(*parts):
+    """Builds a Figure Key From the Versions and Settings a Figure Depends on
+
+    Parameters
+    ----------
+    parts : object
+        Values With a Stable repr, Such as Version Numbers and Graph Options
+
+    Returns
+    -------
+    str
+        Key That Can be Stored in a dcc.Store
+    """
+    return repr(parts)
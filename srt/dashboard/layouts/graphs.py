@@ -5,7 +5,6 @@ Contains the Code for Generating Complicated Graphs
 """
 
 import plotly.graph_objects as go
-from datetime import datetime
 import numpy as np
 from dash import Dash, dcc, html, Input, Output, callback
 import pandas as pd
@@ -560,7 +559,7 @@ def generate_el_time_graph(
     return fig
 
 
-def generate_power_history_graph(tsys, tcal, cal_pwr, spectrum_history):
+def generate_power_history_graph(tsys, tcal, cal_pwr, power_history):
     """Generates a Graph of the Power History
 
     Parameters
@@ -571,25 +570,20 @@ def generate_power_history_graph(tsys, tcal, cal_pwr, spectrum_history):
         Temperature of the Calibration Source (i.e. Trees)
     cal_pwr : float
         Power Observed during Calibration
-    spectrum_history : list
-        List of Spectrum Samples and Timestamps
+    power_history : ((N) ndarray, (N) ndarray)
+        Timestamps and Mean Power of Each Spectrum, Oldest First
 
     Returns
     -------
     Plotly Figure of Power History Graph
     """
-    power_history = []
-    for t, spectrum in spectrum_history:
-        p = np.sum(spectrum)
-        a = len(spectrum)
-        pwr = (tsys + tcal) * p / (a * cal_pwr)
-        power_history.insert(0, (t, pwr))
-    if power_history is None or len(power_history) == 0:
+    power_time, mean_power = power_history
+    if len(power_time) == 0:
         return ""
-    power_time, power_vals = zip(*power_history)
+    power_vals = (tsys + tcal) * np.asarray(mean_power) / cal_pwr
     fig = go.Figure(
         data=go.Scatter(
-            x=[datetime.utcfromtimestamp(t) for t in power_time], y=power_vals
+            x=(np.asarray(power_time) * 1000).astype("datetime64[ms]"), y=power_vals
         ),
         layout={
             "title": "Power vs Time",
@@ -609,6 +603,54 @@ def generate_power_history_graph(tsys, tcal, cal_pwr, spectrum_history):
     return fig
 
 
+def generate_waterfall_graph(bandwidth, cf, spectrogram):
+    """Generates a Waterfall (Time by Frequency) Image of the Spectrum History
+
+    Parameters
+    ----------
+    bandwidth : float
+        Bandwidth of the Incoming Spectra
+    cf : float
+        Center Frequency of the Incoming Spectra
+    spectrogram : ((M) ndarray, (M, C) ndarray)
+        Row Center Times and Powers in dB of Each Channel, Oldest First
+
+    Returns
+    -------
+    Plotly Figure of the Waterfall
+    """
+    row_times, decibels = spectrogram
+    if len(row_times) == 0:
+        return ""
+    num_channels = decibels.shape[1]
+    channel_centers = (np.arange(num_channels) + 0.5) / num_channels - 0.5
+    fig = go.Figure(
+        data=go.Heatmap(
+            x=(cf + bandwidth * channel_centers) / pow(10, 6),
+            y=(row_times * 1000).astype("datetime64[ms]"),
+            z=decibels,
+            zsmooth=False,
+            colorscale="Viridis",
+            colorbar={"title": "dB"},
+        ),
+        layout={
+            "title": "Waterfall",
+            "xaxis_title": "Frequency (MHz)",
+            "yaxis_title": "Time (UTC)",
+            "height": 300,
+            "margin": dict(
+                l=20,
+                r=20,
+                b=20,
+                t=30,
+                pad=4,
+            ),
+            "uirevision": True,
+        },
+    )
+    return fig
+
+
 def generate_spectrum_graph(bandwidth, cf, spectrum, is_spec_cal):
     """Generates a Graph of Spectrum Data
 
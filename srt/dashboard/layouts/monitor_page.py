@@ -20,7 +20,12 @@ except:
 
 from dash.exceptions import PreventUpdate
 
-from dash.dependencies import Input, Output, State
+try:
+    from dash import Patch
+except ImportError:
+    Patch = None
+
+from dash.dependencies import Input, Output, State, ClientsideFunction
 
 from pathlib import Path
 from time import time
@@ -34,11 +39,13 @@ from .graphs import (
     generate_az_time_graph,
     generate_el_time_graph,
     generate_power_history_graph,
+    generate_waterfall_graph,
     generate_spectrum_graph,
     generate_zoom_graph,
     generate_npoint,
     emptygraph,
 )
+from .figure_cache import FigureCache, version_key
 
 from astropy.table import Table
 from srt import config_loader
@@ -89,6 +96,50 @@ def generate_first_row():
     )
 
 
+def generate_waterfall_row():
+    """Generates the Waterfall Display
+
+    Returns
+    -------
+    Div Containing the Waterfall Graph
+    """
+    return html.Div(
+        [
+            html.Div(
+                [dcc.Graph(id="waterfall-graph")],
+                className="pretty_container twelve columns",
+            ),
+        ],
+        className="flex-display",
+        style={"margin": dict(l=10, r=5, t=5, b=5)},
+    )
+
+
+# Graphs Whose Callbacks Skip Sending Figures a Browser Already Shows
+CACHED_GRAPHS = (
+    "power-graph",
+    "waterfall-graph",
+    "cal-spectrum-histogram",
+    "raw-spectrum-histogram",
+    "az-el-graph",
+    "zoom-graph",
+    "az-el-elevation",
+)
+
+
+def generate_figure_versions():
+    """Generates the Stores Holding the Key of the Figure Each Graph Shows
+
+    Returns
+    -------
+    Div Containing a dcc.Store per Cached Graph
+    """
+    return html.Div(
+        [dcc.Store(id=f"{graph}-version") for graph in CACHED_GRAPHS],
+        style={"display": "none"},
+    )
+
+
 def generate_srt_azel():
     """Generates AzEl  Display
 
@@ -654,6 +705,10 @@ def generate_popups(software):
                                         "label": ".fits Format (Spectrum)",
                                         "value": "*.fits",
                                     },
+                                    {
+                                        "label": ".h5 Format (Spectrum)",
+                                        "value": "*.h5",
+                                    },
                                 ],
                                 id="record-options",
                                 value="",
@@ -824,10 +879,12 @@ def generate_layout(software):
                 dbc.Alert("Recording", color="danger",
                           id="recording-alert", is_open=False),
                 generate_first_row(),
+                generate_waterfall_row(),
                 generate_second_row(),
                 generate_third_row(),
                 generate_popups(software),
                 html.Div(id="signal", style={"display": "none"}),
+                generate_figure_versions(),
             ]
         )
     else:
@@ -837,11 +894,13 @@ def generate_layout(software):
                 dbc.Alert("Recording", color="danger",
                           id="recording-alert", is_open=False),
                 generate_first_row(),
+                generate_waterfall_row(),
                 generate_srt_azel(),
                 generate_srt_second_row(),
                 generate_third_row(),
                 generate_popups(software),
                 html.Div(id="signal", style={"display": "none"}),
+                generate_figure_versions(),
             ]
         )
     return layout
@@ -878,49 +937,191 @@ def register_callbacks(
         vsrt = True
     else:
         vsrt = False
+    if "DASHBOARD_POWER_HISTORY" in config:
+        power_history_duration = config["DASHBOARD_POWER_HISTORY"]
+    else:
+        power_history_duration = None
+    # Spectra Reach the Spectrum Graphs Through the Stream Instead of Callbacks,
+    # Except in Browsers Whose Stream is Refused or Broken
+    streaming = "DASHBOARD_STREAM_MS" in config
 
-    @app.callback(
-        Output("cal-spectrum-histogram", "figure"),
-        [Input("interval-component", "n_intervals")],
-    )
-    def update_cal_spectrum_histogram(n):
-        spectrum = cal_spectrum_thread.get_spectrum()
+    figure_cache = FigureCache()
+
+    def update_spectrum_histogram(name, spectrum_thread, shown, receiving, is_spec_cal):
+        spectrum = spectrum_thread.get_spectrum()
         status = status_thread.get_status()
         if status is None or spectrum is None:
-            return ""
+            if shown is None:
+                raise PreventUpdate
+            return "", None
         bandwidth = float(status["bandwidth"])
         cf = float(status["center_frequency"])
-        return generate_spectrum_graph(bandwidth, cf, spectrum, is_spec_cal=True)
+        version = spectrum_thread.get_version()
+        axis = version_key(bandwidth, cf, len(spectrum))
+        if shown is not None and shown["axis"] == axis:
+            if (streaming and receiving) or shown["version"] == version:
+                raise PreventUpdate
+        if Patch is not None and shown is not None and shown["axis"] == axis:
+            # Same Frequency Axis, so Only the Spectrum Values are Sent
+            figure = Patch()
+            figure["data"][0]["y"] = spectrum
+            if is_spec_cal:
+                figure["layout"]["yaxis"]["range"] = [
+                    float(np.min(spectrum)),
+                    float(np.max(spectrum)),
+                ]
+        else:
+            figure = figure_cache.get(
+                name,
+                version_key(version, axis),
+                lambda: generate_spectrum_graph(bandwidth, cf, spectrum, is_spec_cal),
+            )
+        return figure, {"version": version, "axis": axis}
 
     @app.callback(
-        Output("raw-spectrum-histogram", "figure"),
+        [
+            Output("cal-spectrum-histogram", "figure"),
+            Output("cal-spectrum-histogram-version", "data"),
+        ],
         [Input("interval-component", "n_intervals")],
+        [
+            State("cal-spectrum-histogram-version", "data"),
+            State("stream-receiving", "data"),
+        ],
     )
-    def update_raw_spectrum_histogram(n):
+    def update_cal_spectrum_histogram(n, shown, receiving):
+        return update_spectrum_histogram(
+            "cal-spectrum-histogram",
+            cal_spectrum_thread,
+            shown,
+            receiving,
+            is_spec_cal=True,
+        )
 
-        spectrum = raw_spectrum_thread.get_spectrum()
+    @app.callback(
+        [
+            Output("raw-spectrum-histogram", "figure"),
+            Output("raw-spectrum-histogram-version", "data"),
+        ],
+        [Input("interval-component", "n_intervals")],
+        [
+            State("raw-spectrum-histogram-version", "data"),
+            State("stream-receiving", "data"),
+        ],
+    )
+    def update_raw_spectrum_histogram(n, shown, receiving):
+        return update_spectrum_histogram(
+            "raw-spectrum-histogram",
+            raw_spectrum_thread,
+            shown,
+            receiving,
+            is_spec_cal=False,
+        )
+
+    @app.callback(
+        [
+            Output("waterfall-graph", "figure"),
+            Output("waterfall-graph-version", "data"),
+        ],
+        [Input("interval-component", "n_intervals")],
+        [State("waterfall-graph-version", "data")],
+    )
+    def update_waterfall_graph(n, shown):
         status = status_thread.get_status()
-        if status is None or spectrum is None:
-            return ""
+        if status is None:
+            raise PreventUpdate
         bandwidth = float(status["bandwidth"])
         cf = float(status["center_frequency"])
-        return generate_spectrum_graph(bandwidth, cf, spectrum, is_spec_cal=False)
+        version = cal_spectrum_thread.get_spectrogram_version()
+        key = version_key(version, bandwidth, cf)
+        return figure_cache.update(
+            "waterfall-graph",
+            key,
+            shown,
+            lambda: generate_waterfall_graph(
+                bandwidth, cf, cal_spectrum_thread.get_spectrogram()
+            ),
+        )
+
+    if streaming:
+        for graph in ("cal-spectrum-histogram", "raw-spectrum-histogram"):
+            app.clientside_callback(
+                ClientsideFunction(namespace="stream", function_name="spectrum"),
+                Output(graph, "extendData"),
+                [Input("stream-interval", "n_intervals")],
+                [State(graph, "id")],
+            )
+        app.clientside_callback(
+            ClientsideFunction(namespace="stream", function_name="receiving"),
+            Output("stream-receiving", "data"),
+            [Input("stream-interval", "n_intervals")],
+            [State("stream-receiving", "data")],
+        )
 
     @app.callback(
-        Output("power-graph",
-               "figure"), [Input("interval-component", "n_intervals")]
+        [
+            Output("power-graph", "figure"),
+            Output("power-graph", "extendData"),
+            Output("power-graph-version", "data"),
+        ],
+        [Input("interval-component", "n_intervals")],
+        [State("power-graph-version", "data")],
     )
-    def update_power_graph(n):
+    def update_power_graph(n, shown):
         status = status_thread.get_status()
         if status is None:
-            return ""
+            if shown is None:
+                raise PreventUpdate
+            return "", dash.no_update, None
         tsys = float(status["temp_sys"])
         tcal = float(status["temp_cal"])
         cal_pwr = float(status["cal_power"])
-        spectrum_history = raw_spectrum_thread.get_history()
-        if spectrum_history is None:
-            return ""
-        return generate_power_history_graph(tsys, tcal, cal_pwr, spectrum_history)
+        power_time, mean_power = raw_spectrum_thread.get_power_history(
+            duration=power_history_duration
+        )
+        if len(power_time) == 0:
+            raise PreventUpdate
+        scale = version_key(tsys, tcal, cal_pwr)
+        last_time = float(power_time[-1])
+        if power_history_duration is None:
+            if shown is not None and shown["last_time"] == last_time:
+                raise PreventUpdate
+            if (
+                shown is not None
+                and shown["scale"] == scale
+                and power_time[0] <= shown["last_time"] < last_time
+            ):
+                # Only the Points Newer Than the Browser's are Sent
+                new_points = power_time > shown["last_time"]
+                new_times = power_time[new_points] * 1000
+                extension = (
+                    {
+                        "x": [new_times.astype("datetime64[ms]")],
+                        "y": [(tsys + tcal) * mean_power[new_points] / cal_pwr],
+                    },
+                    [0],
+                    len(power_time),
+                )
+                return (
+                    dash.no_update,
+                    extension,
+                    {"scale": scale, "last_time": last_time},
+                )
+            key = version_key(scale, last_time)
+        else:
+            # The Latest Downsampled Point Keeps Changing Until its Bin Ends
+            key = version_key(scale, last_time, float(mean_power[-1]))
+            if shown is not None and shown["key"] == key:
+                raise PreventUpdate
+        figure = figure_cache.get(
+            "power-graph",
+            key,
+            lambda: generate_power_history_graph(
+                tsys, tcal, cal_pwr, (power_time, mean_power)
+            ),
+        )
+        shown = {"scale": scale, "last_time": last_time, "key": key}
+        return figure, dash.no_update, shown
 
     @app.callback(
         Output("npoint_info", "data"),
@@ -1057,95 +1258,99 @@ def register_callbacks(
         else:
             return html.Div(["Awaiting Command File"])
 
+    def status_graph_args(status):
+        return (
+            status["az_limits"],
+            status["el_limits"],
+            status["object_locs"],
+            status["motor_azel"],
+            status["stow_loc"],
+            status["cal_loc"],
+            status["horizon_points"],
+            status["beam_width"],
+        )
+
     @app.callback(
-        Output("az-el-graph",
-               "figure"), [Input("interval-component", "n_intervals")]
+        [Output("az-el-graph", "figure"), Output("az-el-graph-version", "data")],
+        [Input("interval-component", "n_intervals")],
+        [State("az-el-graph-version", "data")],
     )
-    def update_az_el_graph(n):
+    def update_az_el_graph(n, shown):
+        key = version_key(status_thread.get_version())
         status = status_thread.get_status()
-        if status is not None:
-            return generate_az_el_graph(
-                status["az_limits"],
-                status["el_limits"],
-                status["object_locs"],
-                status["motor_azel"],
-                status["stow_loc"],
-                status["cal_loc"],
-                status["horizon_points"],
-                status["beam_width"],
-            )
-        return ""
+        if status is None:
+            return figure_cache.update("az-el-graph", key, shown, lambda: "")
+        return figure_cache.update(
+            "az-el-graph",
+            key,
+            shown,
+            lambda: generate_az_el_graph(*status_graph_args(status)),
+        )
 
     @app.callback(
-        Output("zoom-graph",
-               "figure"), [Input("interval-component", "n_intervals")]
+        [Output("zoom-graph", "figure"), Output("zoom-graph-version", "data")],
+        [Input("interval-component", "n_intervals")],
+        [State("zoom-graph-version", "data")],
     )
-    def update_zoom_graph(n):
+    def update_zoom_graph(n, shown):
+        key = version_key(status_thread.get_version())
         status = status_thread.get_status()
-        if status is not None:
-            return generate_zoom_graph(
-                status["az_limits"],
-                status["el_limits"],
-                status["object_locs"],
-                status["motor_azel"],
-                status["stow_loc"],
-                status["cal_loc"],
-                status["horizon_points"],
-                status["beam_width"],
-            )
-        return ""
+        if status is None:
+            return figure_cache.update("zoom-graph", key, shown, lambda: "")
+        return figure_cache.update(
+            "zoom-graph",
+            key,
+            shown,
+            lambda: generate_zoom_graph(*status_graph_args(status)),
+        )
 
     @app.callback(
-        Output("az-el-elevation",
-               "figure"),
+        [
+            Output("az-el-elevation", "figure"),
+            Output("az-el-elevation-version", "data"),
+        ],
         [
             Input("interval-component", "n_intervals"),
             Input("graphaz", "n_clicks_timestamp"),
             Input("graphel", "n_clicks_timestamp"),
-            Input("timeinput", "value")]
+            Input("timeinput", "value")],
+        [State("az-el-elevation-version", "data")],
     )
-    def update_az_el_time_graph(n, clicksaz, clicksel, range):
-        status = status_thread.get_status()
+    def update_az_el_time_graph(n, clicksaz, clicksel, range, shown):
         if not clicksel:
             axisstatus = 0
         elif not clicksaz:
             axisstatus = 1
         elif clicksaz > clicksel:
             axisstatus = 0
-        elif clicksaz < clicksel:
+        else:
             axisstatus = 1
 
-        if status is not None:
-            # if (not clicksaz and not clicksel) or clicksaz > clicksel:
-            # if clicksaz > clicksel:
-            if axisstatus == 0:
-                return generate_az_time_graph(
-                    status["az_limits"],
-                    status["el_limits"],
-                    status["object_locs"],
-                    status["object_time_locs"],
-                    status["motor_azel"],
-                    status["stow_loc"],
-                    status["cal_loc"],
-                    status["horizon_points"],
-                    status["beam_width"],
-                    range
-                )
-            # if clicksaz < clicksel:
-            if axisstatus == 1:
-                return generate_el_time_graph(
-                    status["az_limits"],
-                    status["el_limits"],
-                    status["object_locs"],
-                    status["object_time_locs"],
-                    status["motor_azel"],
-                    status["stow_loc"],
-                    status["cal_loc"],
-                    status["horizon_points"],
-                    status["beam_width"],
-                    range
-                )
-        return ""
+        key = version_key(status_thread.get_version(), axisstatus, range)
+        status = status_thread.get_status()
+        if status is None:
+            return figure_cache.update("az-el-elevation", key, shown, lambda: "")
+        if axisstatus == 0:
+            generate_time_graph = generate_az_time_graph
+        else:
+            generate_time_graph = generate_el_time_graph
+        return figure_cache.update(
+            "az-el-elevation",
+            key,
+            shown,
+            lambda: generate_time_graph(
+                status["az_limits"],
+                status["el_limits"],
+                status["object_locs"],
+                status["object_time_locs"],
+                status["motor_azel"],
+                status["stow_loc"],
+                status["cal_loc"],
+                status["horizon_points"],
+                status["beam_width"],
+                range
+            ),
+        )
 
     @ app.callback(
         Output("az-el-graph-modal", "is_open"),
@@ -1486,34 +1691,35 @@ def register_callbacks(
                 return not is_open
             return is_open
 
+    # Only the SRT Layout Has a Stow Button
+    cmd_buttons = [
+        Input("btn-stop-record", "n_clicks"),
+        Input("btn-quit", "n_clicks"),
+        Input("btn-calibrate", "n_clicks"),
+    ]
+    if not vsrt:
+        cmd_buttons.append(Input("btn-stow", "n_clicks"))
+
     @ app.callback(
         Output("signal", "children"),
-        [
-            # Input("btn-stow", "n_clicks"),
-            Input("btn-stop-record", "n_clicks"),
-            Input("btn-quit", "n_clicks"),
-            Input("btn-calibrate", "n_clicks"),
-        ],
+        cmd_buttons,
         [State("recording-alert", "is_open")]
     )
-    def cmd_button_pressed(
-        # n_clicks_stow,
-        n_clicks_stop_record,
-        n_clicks_shutdown,
-        n_clicks_calibrate,
-        is_open
-    ):
+    def cmd_button_pressed(*args):
+        is_open = args[-1]
         ctx = dash.callback_context
         if not ctx.triggered:
             return ""
         else:
             button_id = ctx.triggered[0]["prop_id"].split(".")[0]
+            # Stow and Shutdown are Urgent, so They Skip Ahead of Queued Commands
+            # and Waits
             if button_id == "btn-stow":
-                command_thread.add_to_queue("stow")
+                command_thread.add_to_queue("!stow")
             if button_id == "btn-stop-record":
                 command_thread.add_to_queue("roff")
                 return not is_open
             elif button_id == "btn-quit":
-                command_thread.add_to_queue("quit")
+                command_thread.add_to_queue("!quit")
             elif button_id == "btn-calibrate":
                 command_thread.add_to_queue("calibrate")
@@ -124,7 +124,7 @@ def generate_layout():
     return layout
 
 
-def register_callbacks(app, config, status_thread):
+def register_callbacks(app, config, status_thread, log_thread):
     """Registers the Callbacks for the System Page
 
     Parameters
@@ -135,6 +135,8 @@ def register_callbacks(app, config, status_thread):
         Contains All Settings for Dashboard / Daemon
     status_thread : Thread
         Thread for Getting Status from Daemon
+    log_thread : Thread
+        Thread for Getting Log Entries from Daemon
 
     Returns
     -------
@@ -162,15 +164,15 @@ def register_callbacks(app, config, status_thread):
         [Input("interval-component", "n_intervals")],
     )
     def update_message_logs(n):
-        status = status_thread.get_status()
-        if status is None or "error_logs" not in status:
+        entries = log_thread.get_logs(limit=200)
+        if not entries:
             return ""
-        status = status["error_logs"]
         children = [
             html.P(
-                f"{datetime.fromtimestamp(log_time).strftime('%Y-%m-%d %H:%M:%S')}: {log_txt}"
+                f"{datetime.fromtimestamp(entry['time']).strftime('%Y-%m-%d %H:%M:%S')}"
+                f" [{entry['level'].upper()}]: {entry['message']}"
             )
-            for log_time, log_txt in status
+            for entry in entries
         ]
         return html.Div(children=children)
 
@@ -201,6 +203,23 @@ def register_callbacks(app, config, status_thread):
          - Running Command: {current_cmd}
          - {queue_size} More Commands Waiting in the Queue
         """
+        tracking = status.get("tracking")
+        if tracking is not None:
+            rms_error = tracking["rms_error"]
+            max_error = tracking["max_error"]
+            status_string += f""" - Tracking {tracking["object"]}: \
+{rms_error:.2f}° RMS Error, {max_error:.2f}° Max, {tracking["setpoints"]} Positions Sent
+        """
+        timeline = status.get("queue_timeline")
+        if timeline is not None and timeline["hold_until"] is not None:
+            hold_until = datetime.utcfromtimestamp(timeline["hold_until"])
+            status_string += f""" - Waiting Until {hold_until:%H:%M:%S} UTC
+        """
+        if timeline is not None:
+            for entry in timeline["commands"]:
+                urgent = " (Urgent)" if entry["urgent"] else ""
+                status_string += f""" - Next: {entry["command"]}{urgent}
+        """
         return status_string
 
     @app.callback(
@@ -0,0 +1,127 @@
+"""log_fetcher.py
+
+Thread Which Pages Through the Daemon's Log Entries
+
+"""
+
+import zmq
+from threading import Thread, Lock
+from collections import deque
+from time import sleep
+
+from srt.status_protocol import STATUS_QUERY_PORT, encode_message, decode_message
+
+
+class LogThread(Thread):
+    """
+    Thread Which Fetches New Log Entries Whenever the Status Reports a Newer Sequence
+    """
+
+    def __init__(
+        self,
+        status_thread,
+        group=None,
+        target=None,
+        name=None,
+        port=STATUS_QUERY_PORT,
+        capacity=1000,
+        page_size=100,
+    ):
+        """Initializer for LogThread
+
+        Parameters
+        ----------
+        status_thread : StatusThread
+            Thread Holding the Latest Status, Whose 'log_seq' Triggers Fetches
+        group : NoneType
+            The ThreadGroup the Thread Belongs to (Currently Unimplemented in Python 3.8)
+        target : callable
+            Function that the Thread Should Run (Leave This Be For Command Sending)
+        name : str
+            Name of the Thread
+        port : int
+            Port of the Status Query ZMQ REQ/REP Socket
+        capacity : int
+            Maximum Number of Log Entries Kept Locally
+        page_size : int
+            Maximum Number of Entries Requested at a Time
+        """
+        super().__init__(group=group, target=target, name=name, daemon=True)
+        self.status_thread = status_thread
+        self.port = port
+        self.page_size = page_size
+        self.entries = deque(maxlen=capacity)
+        self.latest_seq = 0
+        self.lock = Lock()
+
+    def fetch_page(self, context):
+        """Requests the Next Page of Entries After the Latest One Stored
+
+        Parameters
+        ----------
+        context : zmq.Context
+            ZMQ Context to Create the Request Socket With
+
+        Returns
+        -------
+        bool
+            Whether More Entries Remain on the Daemon
+        """
+        socket = context.socket(zmq.REQ)
+        socket.setsockopt(zmq.LINGER, 0)
+        socket.connect("tcp://localhost:%s" % self.port)
+        socket.send(
+            encode_message(
+                {"request": "logs", "since": self.latest_seq, "limit": self.page_size}
+            )
+        )
+        reply = None
+        if socket.poll(1000) == zmq.POLLIN:
+            reply = decode_message(socket.recv())
+        socket.close()
+        if reply is None or reply.get("type") != "logs":
+            return False
+        with self.lock:
+            if reply["latest_seq"] < self.latest_seq:
+                # Daemon was Restarted, so its Sequence Numbers Started Over
+                self.entries.clear()
+                self.latest_seq = 0
+                return True
+            self.entries.extend(reply["entries"])
+            if reply["entries"]:
+                self.latest_seq = reply["entries"][-1]["seq"]
+        return self.latest_seq < reply["latest_seq"]
+
+    def run(self):
+        """Fetches Log Entries Whenever the Daemon Reports New Ones
+
+        Returns
+        -------
+
+        """
+        context = zmq.Context()
+        while True:
+            status = self.status_thread.get_status()
+            if status is not None and status.get("log_seq", 0) != self.latest_seq:
+                while self.fetch_page(context):
+                    pass
+            sleep(0.5)
+
+    def get_logs(self, limit=None):
+        """Return the Most Recent Log Entries, Oldest First
+
+        Parameters
+        ----------
+        limit : int
+            Maximum Number of Entries, or None for All Stored Entries
+
+        Returns
+        -------
+        list(dict)
+            Entries With 'seq', 'time', 'level' and 'message' Keys
+        """
+        with self.lock:
+            entries = list(self.entries)
+        if limit is not None:
+            entries = entries[-limit:]
+        return entries
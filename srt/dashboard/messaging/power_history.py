@@ -0,0 +1,149 @@
+"""power_history.py
+
+Rolling, Downsampled Time Series of Spectrum Power for the Dashboard
+
+"""
+import numpy as np
+
+from math import floor
+
+# Default (Seconds per Point, Number of Points) of Each Tier: 1 h, 1 Day and 30 Days
+DEFAULT_TIERS = ((1.0, 3600), (60.0, 1440), (3600.0, 720))
+
+
+class PowerTier:
+    """
+    Averages Power Into Fixed Length Time Bins, Keeping the Most Recent Bins
+    """
+
+    def __init__(self, resolution, capacity):
+        """Initializer for PowerTier
+
+        Parameters
+        ----------
+        resolution : float
+            Length of Each Time Bin in Seconds
+        capacity : int
+            Maximum Number of Completed Bins Kept
+        """
+        self.resolution = resolution
+        self.capacity = capacity
+        # Written Twice, capacity Rows Apart, Like SpectrumThread's History
+        self.times = np.zeros(2 * capacity)
+        self.powers = np.zeros(2 * capacity)
+        self.count = 0
+        self.bin_start = None
+        self.bin_sum = 0.0
+        self.bin_count = 0
+
+    def add(self, sample_time, power):
+        """Adds a Power Sample, Completing the Current Bin if the Sample is Past it
+
+        Parameters
+        ----------
+        sample_time : float
+            Unix Time of the Sample
+        power : float
+            Power of the Sample
+
+        Returns
+        -------
+        None
+        """
+        bin_start = floor(sample_time / self.resolution) * self.resolution
+        if self.bin_start is not None and bin_start != self.bin_start:
+            index = self.count % self.capacity
+            for row in (index, index + self.capacity):
+                self.times[row] = self.bin_start + self.resolution / 2
+                self.powers[row] = self.bin_sum / self.bin_count
+            self.count += 1
+            self.bin_sum = 0.0
+            self.bin_count = 0
+        self.bin_start = bin_start
+        self.bin_sum += power
+        self.bin_count += 1
+
+    def get(self):
+        """Gets the Completed Bins Followed by the Partial Current Bin
+
+        Returns
+        -------
+        ((N) ndarray, (N) ndarray)
+            Bin Center Times and Mean Powers, Oldest First
+        """
+        stored = min(self.count, self.capacity)
+        end = self.count % self.capacity + self.capacity
+        if self.count < self.capacity:
+            end = self.count
+        times = self.times[end - stored : end]
+        powers = self.powers[end - stored : end]
+        if self.bin_count == 0:
+            return times.copy(), powers.copy()
+        return (
+            np.append(times, self.bin_start + self.resolution / 2),
+            np.append(powers, self.bin_sum / self.bin_count),
+        )
+
+    def span(self):
+        """Seconds of History the Tier Can Hold
+
+        Returns
+        -------
+        float
+        """
+        return self.resolution * self.capacity
+
+
+class PowerHistory:
+    """
+    Set of PowerTiers, From Finest to Coarsest, Fed One Power Sample per Spectrum
+    """
+
+    def __init__(self, tiers=DEFAULT_TIERS):
+        """Initializer for PowerHistory
+
+        Parameters
+        ----------
+        tiers : iterable((float, int))
+            Seconds per Point and Number of Points of Each Tier
+        """
+        self.tiers = [
+            PowerTier(resolution, capacity) for resolution, capacity in sorted(tiers)
+        ]
+
+    def add(self, sample_time, power):
+        """Adds a Power Sample to Every Tier
+
+        Parameters
+        ----------
+        sample_time : float
+            Unix Time of the Sample
+        power : float
+            Power of the Sample
+
+        Returns
+        -------
+        None
+        """
+        for tier in self.tiers:
+            tier.add(sample_time, power)
+
+    def get(self, duration):
+        """Gets the Finest Series That Covers a Duration
+
+        Parameters
+        ----------
+        duration : float
+            Seconds of History Wanted
+
+        Returns
+        -------
+        ((N) ndarray, (N) ndarray)
+            Times and Mean Powers, Oldest First, Limited to the Last duration Seconds
+        """
+        tier = next(
+            (tier for tier in self.tiers if tier.span() >= duration), self.tiers[-1]
+        )
+        times, powers = tier.get()
+        start = np.searchsorted(times, times[-1] - duration) if len(times) else 0
+        return times[start:], powers[start:]
@@ -0,0 +1,152 @@
+"""spectrogram.py
+
+Compact, Downsampled Time by Frequency History of Spectra for the Dashboard's Waterfall
+
+"""
+import numpy as np
+
+from math import floor
+
+
+class SpectrogramStore:
+    """
+    Averages Spectra Into Time Bins and Frequency Channels, Storing Each Row as uint8
+
+    Rows are stored in decibels, quantized to 256 levels between the row's own
+    minimum and maximum, so a row of C channels takes C bytes plus two floats.
+    """
+
+    def __init__(self, resolution=10.0, num_channels=256, capacity=1440):
+        """Initializer for SpectrogramStore
+
+        Parameters
+        ----------
+        resolution : float
+            Length of Each Time Bin in Seconds
+        num_channels : int
+            Maximum Number of Frequency Channels per Row
+        capacity : int
+            Maximum Number of Rows Kept
+        """
+        self.resolution = resolution
+        self.num_channels = num_channels
+        self.capacity = capacity
+        # Written Twice, capacity Rows Apart, Like SpectrumThread's History
+        self.times = np.zeros(2 * capacity)
+        self.offsets = np.zeros(2 * capacity, dtype="float32")
+        self.scales = np.zeros(2 * capacity, dtype="float32")
+        self.rows = None
+        self.num_bins = None
+        self.edges = None
+        self.widths = None
+        self.count = 0
+        self.version = 0
+        self.bin_start = None
+        self.bin_sum = None
+        self.bin_count = 0
+
+    def reset(self, num_bins):
+        """Clears the Store for Spectra With a Different Number of Frequency Bins
+
+        Parameters
+        ----------
+        num_bins : int
+            Number of Frequency Bins of the Incoming Spectra
+
+        Returns
+        -------
+        None
+        """
+        num_channels = min(self.num_channels, num_bins)
+        # Frequency Bins Spanned by Each Channel, Spreading Any Remainder Evenly
+        edges = np.linspace(0, num_bins, num_channels + 1).astype(int)
+        self.num_bins = num_bins
+        self.edges = edges[:-1]
+        self.widths = np.diff(edges)
+        self.rows = np.zeros((2 * self.capacity, num_channels), dtype="uint8")
+        self.count = 0
+        self.version += 1
+        self.bin_start = None
+        self.bin_sum = np.zeros(num_channels)
+        self.bin_count = 0
+
+    def add(self, sample_time, spectrum):
+        """Adds a Spectrum, Completing the Current Row if the Spectrum is Past its Bin
+
+        Parameters
+        ----------
+        sample_time : float
+            Unix Time of the Spectrum
+        spectrum : (N) ndarray
+            Spectrum Data
+
+        Returns
+        -------
+        None
+        """
+        if len(spectrum) != self.num_bins:
+            self.reset(len(spectrum))
+        bin_start = floor(sample_time / self.resolution) * self.resolution
+        if self.bin_start is not None and bin_start != self.bin_start:
+            self.store_row()
+        self.bin_start = bin_start
+        channel_sums = np.add.reduceat(np.asarray(spectrum, dtype=float), self.edges)
+        self.bin_sum += channel_sums / self.widths
+        self.bin_count += 1
+
+    def store_row(self):
+        """Quantizes the Mean of the Current Bin Into the Next Row
+
+        Returns
+        -------
+        None
+        """
+        power = self.bin_sum / self.bin_count
+        decibels = 10 * np.log10(np.maximum(power, np.finfo("float32").tiny))
+        offset = decibels.min()
+        scale = (decibels.max() - offset) / 255 or 1.0
+        row = np.rint((decibels - offset) / scale).astype("uint8")
+        index = self.count % self.capacity
+        for position in (index, index + self.capacity):
+            self.times[position] = self.bin_start + self.resolution / 2
+            self.offsets[position] = offset
+            self.scales[position] = scale
+            self.rows[position] = row
+        self.count += 1
+        self.version += 1
+        self.bin_sum[:] = 0
+        self.bin_count = 0
+
+    def get(self, n=None):
+        """Gets the Most Recent Completed Rows, Converted Back to Decibels
+
+        Parameters
+        ----------
+        n : int
+            Maximum Number of Rows, or None for Every Row Kept
+
+        Returns
+        -------
+        ((M) ndarray, (M, C) ndarray)
+            Row Center Times and Powers in dB, Oldest First
+        """
+        if self.rows is None:
+            return np.zeros(0), np.zeros((0, 0), dtype="float32")
+        n = min(self.capacity if n is None else n, self.count, self.capacity)
+        end = self.count % self.capacity + self.capacity
+        if self.count < self.capacity:
+            end = self.count
+        index = slice(end - n, end)
+        decibels = self.rows[index] * self.scales[index, np.newaxis]
+        decibels += self.offsets[index, np.newaxis]
+        return self.times[index].copy(), decibels
+
+    def get_version(self):
+        """Return a Number Which Changes With Every Row Stored and Every Reset
+
+        Returns
+        -------
+        int
+            Spectrogram Version
+        """
+        return self.version
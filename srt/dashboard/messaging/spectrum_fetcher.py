@@ -6,10 +6,12 @@ Thread Which Handles Receiving Spectrum Data
 
 import zmq
 import numpy as np
-from threading import Thread
+from threading import Thread, Lock
 from time import sleep
 import time
 
+from .power_history import PowerHistory
+
 
 class SpectrumThread(Thread):
     """
@@ -17,7 +19,13 @@ class SpectrumThread(Thread):
     """
 
     def __init__(
-        self, group=None, target=None, name=None, port=5560, history_length=1000
+        self,
+        group=None,
+        target=None,
+        name=None,
+        port=5560,
+        history_length=1000,
+        spectrogram=None,
     ):
         """Initializer for the SpectrumThread
 
@@ -33,12 +41,23 @@ class SpectrumThread(Thread):
             Port of the Spectrum Data ZMQ PUB/SUB Socket
         history_length : int
             Max Length of Spectrum Data History List
+        spectrogram : SpectrogramStore
+            Downsampled History for a Waterfall, or None to Not Keep One
         """
         super().__init__(group=group, target=target, name=name, daemon=True)
         self.history_length = history_length
         self.spectrum = None
-        self.history = []
         self.port = port
+        self.lock = Lock()
+        # Every Entry is Written Twice, history_length Rows Apart, so the Latest
+        # history_length Entries are Always One Contiguous Slice
+        self.times = np.zeros(2 * history_length)
+        self.powers = np.zeros(2 * history_length)
+        self.spectra = None
+        self.count = 0
+        self.version = 0
+        self.power_history = PowerHistory()
+        self.spectrogram = spectrogram
 
     def run(self):
         """Grabs Samples From ZMQ, Converts them to Numpy, and Stores
@@ -54,10 +73,145 @@ class SpectrumThread(Thread):
         while True:
             rec = socket.recv()
             var = np.frombuffer(rec, dtype="float32")
-            if len(self.history) >= self.history_length:
-                self.history.pop()
-            self.history.insert(0, (time.time(), var))
-            self.spectrum = var
+            self.add_spectrum(time.time(), var)
+
+    def add_spectrum(self, arrival_time, spectrum):
+        """Stores a Spectrum, its Arrival Time and its Mean Power in the Ring Buffer
+
+        Parameters
+        ----------
+        arrival_time : float
+            Unix Time the Spectrum was Received
+        spectrum : (N) ndarray
+            Spectrum Data
+
+        Returns
+        -------
+        None
+        """
+        with self.lock:
+            if self.spectra is None or self.spectra.shape[1] != len(spectrum):
+                # Number of Bins Changed, so Older Spectra can't be Kept
+                self.spectra = np.zeros(
+                    (2 * self.history_length, len(spectrum)), dtype="float32"
+                )
+                self.count = 0
+            index = self.count % self.history_length
+            power = np.mean(spectrum)
+            for row in (index, index + self.history_length):
+                self.times[row] = arrival_time
+                self.powers[row] = power
+                self.spectra[row] = spectrum
+            self.power_history.add(arrival_time, power)
+            if self.spectrogram is not None:
+                self.spectrogram.add(arrival_time, spectrum)
+            self.count += 1
+            self.version += 1
+            self.spectrum = spectrum
+
+    def _latest_slice(self, n):
+        """Slice of the Latest n Entries, Oldest First (Call With the Lock Held)"""
+        n = max(min(n, self.count, self.history_length), 0)
+        end = self.count % self.history_length + self.history_length
+        if self.count < self.history_length:
+            end = self.count
+        return slice(end - n, end)
+
+    def latest(self, n=None):
+        """Return Views of the Most Recent Spectra Without Copying
+
+        The views are into the ring buffer, so entries are overwritten after
+        history_length newer spectra arrive; copy them to keep them longer.
+
+        Parameters
+        ----------
+        n : int
+            Maximum Number of Spectra, or None for the Whole History
+
+        Returns
+        -------
+        ((M) ndarray, (M, N) ndarray)
+            Arrival Times and Spectra, Oldest First
+        """
+        with self.lock:
+            if self.spectra is None:
+                return np.zeros(0), np.zeros((0, 0), dtype="float32")
+            index = self._latest_slice(self.history_length if n is None else n)
+            return self.times[index], self.spectra[index]
+
+    def window(self, start_time, end_time):
+        """Return Views of the Spectra That Arrived Between Two Times
+
+        Parameters
+        ----------
+        start_time : float
+            Earliest Arrival Unix Time in Seconds
+        end_time : float
+            Latest Arrival Unix Time in Seconds
+
+        Returns
+        -------
+        ((M) ndarray, (M, N) ndarray)
+            Arrival Times and Spectra, Oldest First
+        """
+        with self.lock:
+            if self.spectra is None:
+                return np.zeros(0), np.zeros((0, 0), dtype="float32")
+            index = self._latest_slice(self.history_length)
+            times = self.times[index]
+            first = index.start + np.searchsorted(times, start_time, side="left")
+            last = index.start + np.searchsorted(times, end_time, side="right")
+            return self.times[first:last], self.spectra[first:last]
+
+    def get_power_history(self, n=None, duration=None):
+        """Return the Mean Power of Each Spectrum, Computed Once on Arrival
+
+        Without a duration, views of the per-spectrum powers are returned.  With one,
+        the finest downsampled series (1 s, 1 min or 1 h points) covering it is
+        returned instead, so hours of history stay cheap to read.
+
+        Parameters
+        ----------
+        n : int
+            Maximum Number of Entries, or None for the Whole History
+        duration : float
+            Seconds of Downsampled History, or None for the Per-Spectrum History
+
+        Returns
+        -------
+        ((M) ndarray, (M) ndarray)
+            Times and Mean Powers, Oldest First
+        """
+        with self.lock:
+            if duration is not None:
+                return self.power_history.get(duration)
+            index = self._latest_slice(self.history_length if n is None else n)
+            return self.times[index], self.powers[index]
+
+    def get_spectrogram(self):
+        """Return the Downsampled Waterfall History, Converted to Decibels
+
+        Returns
+        -------
+        ((M) ndarray, (M, C) ndarray)
+            Row Center Times and Powers in dB, Oldest First
+        """
+        with self.lock:
+            if self.spectrogram is None:
+                return np.zeros(0), np.zeros((0, 0), dtype="float32")
+            return self.spectrogram.get()
+
+    def get_spectrogram_version(self):
+        """Return a Number Which Changes Whenever the Waterfall History Changes
+
+        Returns
+        -------
+        int
+            Spectrogram Version, or 0 Without a Waterfall History
+        """
+        if self.spectrogram is None:
+            return 0
+        return self.spectrogram.get_version()
 
     def get_spectrum(self):
         """Return Most Recently Received Spectrum
@@ -68,15 +222,26 @@ class SpectrumThread(Thread):
         """
         return self.spectrum
 
+    def get_version(self):
+        """Return the Number of Spectra Received, Which Changes With Every Spectrum
+
+        Returns
+        -------
+        int
+            Spectrum Version
+        """
+        return self.version
+
     def get_history(self):
         """Return Entire History List
 
         Returns
         -------
         [(int, ndarary)]
-            Time and Numpy Spectrum Pairs History
+            Time and Numpy Spectrum Pairs History, Newest First
         """
-        return self.history.copy()
+        times, spectra = self.latest()
+        return list(zip(times[::-1].tolist(), spectra[::-1].copy()))
 
 
 if __name__ == "__main__":
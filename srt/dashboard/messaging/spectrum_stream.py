@@ -0,0 +1,146 @@
+"""spectrum_stream.py
+
+Server-Sent Events Stream of the Latest Spectra for the Dashboard's Clientside Graphs
+
+"""
+
+import base64
+import numpy as np
+from threading import Lock
+from time import sleep, time
+
+import flask
+
+# Seconds Between Comments Sent to Keep Idle Connections Open
+keepalive_interval = 15.0
+
+# Most Streams Open at Once, as Each Holds a Server Thread for as Long as it is Open
+max_streams = 12
+
+
+class SpectrumStream:
+    """
+    Encodes Each New Spectrum Once and Streams it to Every Connected Browser
+    """
+
+    def __init__(self, spectrum_threads, period, max_open=max_streams):
+        """Initializer for SpectrumStream
+
+        Parameters
+        ----------
+        spectrum_threads : dict
+            SpectrumThread of Each Stream, by Event Name
+        period : float
+            Minimum Number of Seconds Between Spectra Sent to a Browser
+        max_open : int
+            Most Browsers Streamed to at Once
+        """
+        self.spectrum_threads = spectrum_threads
+        self.period = period
+        self.max_open = max_open
+        self.num_open = 0
+        self.encoded = {}
+        self.lock = Lock()
+
+    def open(self):
+        """Claims One of the Streams, Unless They are All in Use
+
+        Returns
+        -------
+        bool
+            Whether a Stream was Claimed, Which Must Later be Given Back With close
+        """
+        with self.lock:
+            if self.num_open >= self.max_open:
+                return False
+            self.num_open += 1
+            return True
+
+    def close(self):
+        """Gives Back a Stream Claimed With open
+
+        Returns
+        -------
+        None
+        """
+        with self.lock:
+            self.num_open -= 1
+
+    def get_event(self, name):
+        """Gets the Latest Spectrum of a Stream as a Server-Sent Event
+
+        Parameters
+        ----------
+        name : str
+            Event Name of the Stream
+
+        Returns
+        -------
+        (int, bytes)
+            Spectrum Version and the Event, With the float32 Spectrum in Base64
+        """
+        spectrum_thread = self.spectrum_threads[name]
+        version = spectrum_thread.get_version()
+        with self.lock:
+            cached = self.encoded.get(name)
+            if cached is not None and cached[0] == version:
+                return cached
+        spectrum = np.asarray(spectrum_thread.get_spectrum(), dtype="<f4")
+        data = base64.b64encode(spectrum.tobytes())
+        event = b"event: " + name.encode() + b"\ndata: " + data + b"\n\n"
+        with self.lock:
+            self.encoded[name] = (version, event)
+        return version, event
+
+    def events(self):
+        """Yields Events for One Browser Whenever a Stream has a New Spectrum
+
+        Yields
+        ------
+        bytes
+            Server-Sent Events and Keep-Alive Comments
+        """
+        sent = {name: 0 for name in self.spectrum_threads}
+        last_send = time()
+        while True:
+            for name, spectrum_thread in self.spectrum_threads.items():
+                if spectrum_thread.get_version() != sent[name]:
+                    sent[name], event = self.get_event(name)
+                    last_send = time()
+                    yield event
+            if time() - last_send > keepalive_interval:
+                last_send = time()
+                yield b": keepalive\n\n"
+            sleep(self.period)
+
+
+def register_spectrum_stream(server, stream, route="/stream/spectra"):
+    """Adds the Route Serving a SpectrumStream to the Flask Server
+
+    Parameters
+    ----------
+    server : flask.Flask
+        Server Hosting the Dashboard
+    stream : SpectrumStream
+        Stream to Serve
+    route : str
+        URL of the Stream
+
+    Returns
+    -------
+    None
+    """
+
+    @server.route(route)
+    def spectrum_stream():
+        """Streams Spectra as Server-Sent Events"""
+        if not stream.open():
+            # Leave the Remaining Server Threads to the Dashboard Itself
+            return flask.Response(status=503, headers={"Retry-After": "30"})
+        response = flask.Response(
+            stream.events(),
+            mimetype="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+        response.call_on_close(stream.close)
+        return response
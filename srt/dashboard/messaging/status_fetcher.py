@@ -7,7 +7,14 @@ Thread Which Handles Receiving Status Data
 import zmq
 from threading import Thread
 from time import sleep
-import json
+
+from srt.status_protocol import (
+    StatusReceiverState,
+    STATUS_QUERY_PORT,
+    HEARTBEAT,
+    encode_message,
+    decode_message,
+)
 
 
 class StatusThread(Thread):
@@ -15,7 +22,14 @@ class StatusThread(Thread):
     Thread Which Handles Receiving Status Data
     """
 
-    def __init__(self, group=None, target=None, name=None, port=5550):  # 5555
+    def __init__(
+        self,
+        group=None,
+        target=None,
+        name=None,
+        port=5550,  # 5555
+        query_port=STATUS_QUERY_PORT,
+    ):
         """Initializer for StatusThread
 
         Parameters
@@ -28,13 +42,41 @@ class StatusThread(Thread):
             Name of the Thread
         port : int
             Port of the Status Data ZMQ PUB/SUB Socket
+        query_port : int
+            Port of the Status Query ZMQ REQ/REP Socket, Used to Request Snapshots
         """
         super().__init__(group=group, target=target, name=name, daemon=True)
         self.status = None
         self.port = port
+        self.query_port = query_port
+        self.receiver = StatusReceiverState()
+        self.version = 0
+
+    def request_snapshot(self, context):
+        """Requests a Full Status Snapshot From the Status Query Port
+
+        Parameters
+        ----------
+        context : zmq.Context
+            ZMQ Context to Create the Request Socket With
+
+        Returns
+        -------
+        dict or None
+            Snapshot Message, or None if the Daemon Did not Answer in Time
+        """
+        socket = context.socket(zmq.REQ)
+        socket.setsockopt(zmq.LINGER, 0)
+        socket.connect("tcp://localhost:%s" % self.query_port)
+        socket.send(encode_message({"request": "snapshot"}))
+        reply = None
+        if socket.poll(1000) == zmq.POLLIN:
+            reply = decode_message(socket.recv())
+        socket.close()
+        return reply
 
     def run(self):
-        """Grabs Most Recent Status From ZMQ and Stores
+        """Applies Status Snapshots and Deltas From ZMQ to the Stored Status
 
         Returns
         -------
@@ -45,9 +87,16 @@ class StatusThread(Thread):
         socket.connect("tcp://localhost:%s" % self.port)
         socket.subscribe("")
         while True:
-            rec = socket.recv()
-            dump = json.loads(rec)
-            self.status = dump
+            message = decode_message(socket.recv())
+            if not self.receiver.apply(message):
+                # A Message was Missed, so Resynchronize From a Full Snapshot
+                snapshot = self.request_snapshot(context)
+                if snapshot is None or not self.receiver.apply(snapshot):
+                    continue
+                message = snapshot
+            self.status = self.receiver.status
+            if message["type"] != HEARTBEAT:
+                self.version += 1
 
     def get_status(self):
         """Return Most Recent Status Dictionary
@@ -59,6 +108,16 @@ class StatusThread(Thread):
         """
         return self.status
 
+    def get_version(self):
+        """Return a Number That Increases Whenever the Status Other Than 'time' Changes
+
+        Returns
+        -------
+        int
+            Local Status Version
+        """
+        return self.version
+
 
 if __name__ == "__main__":
     thread = StatusThread()
@@ -0,0 +1,213 @@
+"""
+radindex.py
+
+Sidecar Index of the Records in a .rad File, for Reading Selected Spectra by Seeking
+
+"""
+import os
+import pathlib
+import zlib
+import numpy as np
+
+from .readrad import (
+    concatenate_chunks,
+    iter_radlines,
+    parse_date_line,
+    parse_rad_time,
+)
+
+INDEX_SUFFIX = ".idx.npz"
+
+# Fields Kept per Record, 'offset' and 'length' Locating its Bytes in the File
+INDEX_DTYPE = np.dtype(
+    [
+        ("offset", "i8"),
+        ("length", "i8"),
+        ("time", "f8"),
+        ("source", "U32"),
+        ("az", "f8"),
+        ("el", "f8"),
+    ]
+)
+
+
+def index_path(filename):
+    """Gets the Path of the Sidecar Index of a .rad File
+
+    Parameters
+    ----------
+    filename : str
+        Input filename.
+
+    Returns
+    -------
+    pathlib.Path
+        Path of the Index, Next to the .rad File
+    """
+    return pathlib.Path(str(filename) + INDEX_SUFFIX)
+
+
+def _scan_records(filename, start_offset):
+    """Finds Every Complete Record Starting at a Byte Offset
+
+    Returns
+    -------
+    ((M) ndarray, int)
+        Index Entries and the Byte Offset Just Past the Last Complete Record
+    """
+    entries = []
+    offset = start_offset
+    indexed_size = start_offset
+    record_start = None
+    record = {}
+    with open(filename, "rb") as fp:
+        fp.seek(start_offset)
+        for line in fp:
+            # A Live Recording May End Partway Through a Line, Which is Left for
+            # the Next Scan Once it is Complete
+            if not line.endswith(b"\n"):
+                break
+            if line.startswith(b"DATE"):
+                record_start = offset
+                record = {}
+                parse_date_line(line.decode(), record)
+            elif (
+                record_start is not None
+                and not line.startswith((b"Fstart", b"Spectrum"))
+                and not line.isspace()
+            ):
+                # Spectrum Values are the Last Line of Each Record
+                end = offset + len(line)
+                entries.append(
+                    (
+                        record_start,
+                        end - record_start,
+                        record["time"],
+                        record["source"],
+                        record["az"],
+                        record["el"],
+                    )
+                )
+                indexed_size = end
+                record_start = None
+            offset += len(line)
+    return np.array(entries, dtype=INDEX_DTYPE), indexed_size
+
+
+def _last_record_checksum(filename, records):
+    """Gets the CRC-32 of the Bytes of the Last Indexed Record, or 0 if There is None"""
+    if len(records) == 0:
+        return 0
+    with open(filename, "rb") as fp:
+        fp.seek(records["offset"][-1])
+        return zlib.crc32(fp.read(records["length"][-1]))
+
+
+def build_index(filename):
+    """Builds or Extends the Sidecar Index of a .rad File
+
+    Since .rad files are only appended to while recording, an existing index is
+    extended from the end of the last record it holds.  The index also keeps the
+    file's inode and a checksum of its last record, and if the file has been
+    replaced, is now shorter than the indexed part, or no longer holds that last
+    record, it was rewritten and is indexed again.
+
+    Parameters
+    ----------
+    filename : str
+        Input filename.
+
+    Returns
+    -------
+    (M) ndarray
+        Structured Index Array With INDEX_DTYPE Fields, One Entry per Record
+    """
+    path = index_path(filename)
+    file_stat = os.stat(filename)
+    current = False
+    if path.exists():
+        with np.load(path) as index:
+            if "checksum" in index:
+                records = index["records"]
+                indexed_size = int(index["indexed_size"])
+                current = (
+                    int(index["inode"]) == file_stat.st_ino
+                    and indexed_size <= file_stat.st_size
+                    and int(index["checksum"])
+                    == _last_record_checksum(filename, records)
+                )
+    if not current:
+        records = np.zeros(0, dtype=INDEX_DTYPE)
+        indexed_size = 0
+    elif file_stat.st_size == indexed_size:
+        return records
+    new_records, indexed_size = _scan_records(filename, indexed_size)
+    records = np.concatenate([records, new_records])
+    temporary_path = path.with_name(path.name + ".tmp")
+    with open(temporary_path, "wb") as fp:
+        np.savez(
+            fp,
+            records=records,
+            indexed_size=np.int64(indexed_size),
+            inode=np.uint64(file_stat.st_ino),
+            checksum=np.uint32(_last_record_checksum(filename, records)),
+        )
+    os.replace(temporary_path, path)
+    return records
+
+
+def query_radfile(
+    filename, source=None, start_time=None, end_time=None, dtype=np.float32
+):
+    """Reads the Records of a Source Within a Time Range, Seeking Straight to Them
+
+    The index is built or brought up to date first, so only new records are ever
+    scanned, and only the matching records are read and parsed.
+
+    Parameters
+    ----------
+    filename : str
+        Input filename.
+    source : str
+        Source Name to Select, or None for Any Source
+    start_time : float or str
+        Earliest Unix Time, or a .rad 'DATE' String (Year:DayOfYear:H:M:S)
+    end_time : float or str
+        Latest Unix Time, or a .rad 'DATE' String (Year:DayOfYear:H:M:S)
+    dtype : numpy.dtype
+        Data Type of the Spectra
+
+    Returns
+    -------
+    ((M) ndarray, (M, N) ndarray)
+        Structured Metadata Array (With RAD_DTYPE Fields) and the Matching Spectra
+    """
+    records = build_index(filename)
+    selected = np.ones(len(records), dtype=bool)
+    if source is not None:
+        selected &= records["source"] == source
+    if start_time is not None:
+        if isinstance(start_time, str):
+            start_time = parse_rad_time(start_time)
+        selected &= records["time"] >= start_time
+    if end_time is not None:
+        if isinstance(end_time, str):
+            end_time = parse_rad_time(end_time)
+        selected &= records["time"] <= end_time
+    records = records[selected]
+    if len(records) == 0:
+        return concatenate_chunks([])
+
+    # Neighbouring Records are Read Together in One Contiguous Read
+    starts = records["offset"]
+    ends = starts + records["length"]
+    breaks = np.flatnonzero(starts[1:] != ends[:-1]) + 1
+    range_starts = starts[np.concatenate([[0], breaks])]
+    range_ends = ends[np.concatenate([breaks - 1, [len(records) - 1]])]
+    chunks = []
+    with open(filename, "rb") as fp:
+        for range_start, range_end in zip(range_starts, range_ends):
+            fp.seek(range_start)
+            lines = fp.read(range_end - range_start).splitlines(keepends=True)
+            chunks.extend(iter_radlines(lines, dtype=dtype))
+    return concatenate_chunks(chunks)
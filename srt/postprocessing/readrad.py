@@ -2,13 +2,288 @@
 readrad.py
 
 """
-from datetime import datetime
+from datetime import datetime, timezone
 import numpy as np
 
+# Fields of Each .rad Record, in the Order They Appear in the File
+RAD_DTYPE = np.dtype(
+    [
+        ("time", "f8"),
+        ("obsn", "i4"),
+        ("az", "f8"),
+        ("el", "f8"),
+        ("freq_MHz", "f8"),
+        ("Tsys", "f8"),
+        ("Tant", "f8"),
+        ("vlsr", "f8"),
+        ("glat", "f8"),
+        ("glon", "f8"),
+        ("source", "U32"),
+        ("Fstart", "f8"),
+        ("fstop", "f8"),
+        ("spacing", "f8"),
+        ("bw", "f8"),
+        ("fbw", "f8"),
+        ("nfreq", "i4"),
+        ("nsam", "i4"),
+        ("npoint", "f8"),
+        ("integ", "f8"),
+        ("sigma", "f8"),
+        ("bsw", "i4"),
+        ("integrations", "f8"),
+    ]
+)
+
+
+def parse_rad_time(date_string):
+    """Converts a .rad 'DATE' Value (Year:DayOfYear:Hour:Minute:Second) to Unix Time
+
+    Parameters
+    ----------
+    date_string : str
+        UTC Date Written by the Recorder, i.e. '2020:123:04:05:06'
+
+    Returns
+    -------
+    float
+        Unix Time in Seconds
+    """
+    year, day, hour, minute, second = (int(val) for val in date_string.split(":"))
+    new_year = datetime(year, 1, 1, tzinfo=timezone.utc).timestamp()
+    return new_year + (day - 1) * 86400.0 + hour * 3600.0 + minute * 60.0 + second
+
+
+# Width of Each Spectrum Value Written With the Recorder's "%8.3f " Format
+VALUE_WIDTH = 9
+
+
+def parse_date_line(line, record):
+    """Fills a Record From a 'DATE' Line, Whose Source Name May Contain Spaces
+
+    Parameters
+    ----------
+    line : str
+        'DATE' Line of a Record
+    record : dict
+        Record Given 'time', 'source' and Each Named Value on the Line
+
+    Returns
+    -------
+    None
+    """
+    values, _, source = line.partition(" source ")
+    tokens = values.split()
+    record["time"] = parse_rad_time(tokens[1])
+    for name, value in zip(tokens[2::2], tokens[3::2]):
+        record[name] = float(value)
+    record["source"] = source.strip()
+
+
+def _parse_start_line(line, record):
+    """Fills a Record From an 'Fstart' Line"""
+    tokens = line.split()
+    tokens.remove("MHz")
+    for name, value in zip(tokens[0::2], tokens[1::2]):
+        record[name] = float(value)
+
+
+def _combine_digits(fields):
+    """Combines Four Digit Bytes Packed in Each uint32, First Digit Lowest, Into a Number"""
+    fields *= np.uint32(10 * 256 + 1)
+    fields >>= np.uint32(8)
+    fields &= np.uint32(0x00FF00FF)
+    fields *= np.uint32(100 * 65536 + 1)
+    fields >>= np.uint32(16)
+    return fields
+
+
+def _parse_fixed_width(spectrum_lines, nfreq, dtype):
+    """Parses Spectrum Lines of "%8.3f " Values Four Characters at a Time
+
+    Each value is read as two little-endian uint32 words, the integer part and
+    the '.ddd' fraction, whose digits are combined with a few integer operations
+    on the whole chunk.  A value is then its integer number of thousandths divided
+    by 1000, which gives the same correctly rounded result as parsing its text.
+    Any value too wide for the format makes its line longer, so checking the line
+    lengths and the '.' and ' ' positions is enough to know the layout holds.
+
+    Returns
+    -------
+    (M, N) ndarray or None
+        Spectra, or None if Any Line Does Not Have the Fixed Width Layout
+    """
+    num_lines = len(spectrum_lines)
+    line_length = VALUE_WIDTH * nfreq + 1
+    if any(len(line) != line_length for line in spectrum_lines):
+        return None
+    joined = b"".join(spectrum_lines)
+    chars = np.frombuffer(joined, dtype=np.uint8).reshape(num_lines, line_length)
+    if not (
+        np.all(chars[:, 4:-1:VALUE_WIDTH] == ord("."))
+        and np.all(chars[:, 8:-1:VALUE_WIDTH] == ord(" "))
+    ):
+        return None
+
+    def load_words(offset):
+        return np.ndarray(
+            (num_lines, nfreq),
+            dtype="<u4",
+            buffer=joined,
+            offset=offset,
+            strides=(line_length, VALUE_WIDTH),
+        ).copy()
+
+    # Digits are the Only Characters With the 0x10 Bit Set, and '-' the Only Other
+    # Character With the 0x01 Bit Set, Since Leading Characters are ' ', '-' or Digits
+    whole = load_words(0)
+    digit_bits = (whole >> np.uint32(4)) & np.uint32(0x01010101)
+    negative = (whole & np.uint32(0x01010101) & ~digit_bits) != 0
+    whole &= digit_bits * np.uint32(0x0F)
+    thousandths = _combine_digits(whole) * np.uint32(1000)
+    # The '.' Takes the Place of a Leading Zero Digit
+    thousandths += _combine_digits(load_words(4) & np.uint32(0x0F0F0F00))
+    thousandths = thousandths.view(np.int32)
+    np.negative(thousandths, out=thousandths, where=negative)
+    values = thousandths.astype(np.float64)
+    values /= 1000.0
+    return values.astype(dtype, copy=False)
+
+
+def _build_chunk(records, spectrum_lines, nfreq, dtype):
+    """Converts Parsed Records and Their Spectrum Lines Into Arrays"""
+    metadata = np.zeros(len(records), dtype=RAD_DTYPE)
+    for name in RAD_DTYPE.names:
+        metadata[name] = [record.get(name, 0) for record in records]
+    spectra = _parse_fixed_width(spectrum_lines, nfreq, dtype)
+    if spectra is None:
+        spectra = np.fromstring(
+            b" ".join(spectrum_lines).decode(), dtype=dtype, sep=" "
+        )
+        if len(spectra) != len(records) * nfreq:
+            raise ValueError("Spectrum Line Length Does Not Match its 'nfreq' Value")
+    return metadata, spectra.reshape(len(records), nfreq)
+
+
+def iter_radlines(lines, chunk_size=256, dtype=np.float32):
+    """Parses Lines of .rad Records in Chunks, Using Memory Bounded by the Chunk Size
+
+    Every record of a chunk has the same number of frequency bins, so a chunk ends
+    early whenever 'nfreq' changes between records.  Parsing stops at a line
+    without a line ending, such as the end of a file still being recorded.
+
+    Parameters
+    ----------
+    lines : iterable(bytes)
+        Lines of Whole .rad Records, Including Their Line Endings
+    chunk_size : int
+        Maximum Number of Records per Chunk
+    dtype : numpy.dtype
+        Data Type of the Spectra
+
+    Yields
+    ------
+    ((M) ndarray, (M, N) ndarray)
+        Structured Metadata Array (With RAD_DTYPE Fields) and Spectra
+    """
+    records = []
+    spectrum_lines = []
+    nfreq = None
+    record = {}
+    for line in lines:
+        if not line.endswith(b"\n"):
+            break
+        if line.startswith(b"DATE"):
+            record = {}
+            parse_date_line(line.decode(), record)
+        elif line.startswith(b"Fstart"):
+            _parse_start_line(line.decode(), record)
+        elif line.startswith(b"Spectrum"):
+            record["integrations"] = float(line.split()[1])
+        elif not line.isspace():
+            if "nfreq" in record:
+                record_nfreq = int(record["nfreq"])
+            else:
+                record_nfreq = len(line.split())
+            if records and (record_nfreq != nfreq or len(records) >= chunk_size):
+                yield _build_chunk(records, spectrum_lines, nfreq, dtype)
+                records = []
+                spectrum_lines = []
+            nfreq = record_nfreq
+            records.append(record)
+            spectrum_lines.append(line)
+    if records:
+        yield _build_chunk(records, spectrum_lines, nfreq, dtype)
+
+
+def iter_radfile(filename, chunk_size=256, dtype=np.float32):
+    """Streams a .rad File in Chunks of Records, Using Memory Bounded by the Chunk Size
+
+    Parameters
+    ----------
+    filename : str
+        Input filename.
+    chunk_size : int
+        Maximum Number of Records per Chunk
+    dtype : numpy.dtype
+        Data Type of the Spectra
+
+    Yields
+    ------
+    ((M) ndarray, (M, N) ndarray)
+        Structured Metadata Array (With RAD_DTYPE Fields) and Spectra
+    """
+    with open(filename, "rb") as fp:
+        yield from iter_radlines(fp, chunk_size, dtype)
+
+
+def load_radfile(filename):
+    """Reads a Whole .rad File Into a Structured Metadata Array and a Spectrum Matrix
+
+    Parameters
+    ----------
+    filename : str
+        Input filename.
+
+    Returns
+    -------
+    ((M) ndarray, (M, N) ndarray)
+        Structured Metadata Array (With RAD_DTYPE Fields, 'time' in Unix Seconds)
+        and a Contiguous float32 Matrix With One Spectrum per Row
+    """
+    return concatenate_chunks(list(iter_radfile(filename)))
+
+
+def concatenate_chunks(chunks):
+    """Joins Chunks From iter_radlines Into One Metadata Array and Spectrum Matrix
+
+    Parameters
+    ----------
+    chunks : list(((M) ndarray, (M, N) ndarray))
+        Metadata Arrays and Spectrum Matrices, All With the Same Number of Bins
+
+    Returns
+    -------
+    ((M) ndarray, (M, N) ndarray)
+        Structured Metadata Array (With RAD_DTYPE Fields) and Spectrum Matrix
+    """
+    if not chunks:
+        return np.zeros(0, dtype=RAD_DTYPE), np.zeros((0, 0), dtype=np.float32)
+    if len({spectra.shape[1] for _, spectra in chunks}) > 1:
+        raise ValueError(
+            "Number of Frequency Bins Changes Within the File, Use iter_radfile"
+        )
+    metadata = np.concatenate([metadata for metadata, _ in chunks])
+    spectra = np.concatenate([spectra for _, spectra in chunks])
+    return metadata, spectra
+
 
 def read_radfile(filename):
     """Read in a rad file.py
 
+    Legacy interface kept for compatibility, built on iter_radfile.  Records are
+    keyed by the integer second of their timestamp, so records taken within the
+    same second overwrite each other; use load_radfile to keep every record.
+
     Parameters
     ----------
     filename : str
@@ -19,41 +294,20 @@ def read_radfile(filename):
     outdict : dict
         Holds the info from each entry in the file
     """
-
-    with open(filename) as fp:
-        lines = fp.read().splitlines()
-
     outdict = {}
-    for iline in lines:
-        # Rad files have 4 types of lines
-        linesp = list(filter(None, iline.split(" ")))
-
-        # This has time stamp.
-        if linesp[0] == "DATE":
+    for metadata, spectra in iter_radfile(filename, dtype=float):
+        for record, spectrum in zip(metadata, spectra):
             cur_dict = {
-                linesp[i]: float(linesp[i + 1])
-                if is_number(linesp[i + 1])
-                else linesp[i + 1]
-                for i in range(0, len(linesp), 2)
-            }
-            cur_dict["DATE"] = datetime.strptime(cur_dict["DATE"], "%Y:%j:%H:%M:%S")
-        # This has receiver info
-        elif linesp[0] == "Fstart":
-            linesp.remove("MHz")
-            temp_dict = {
-                linesp[i]: float(linesp[i + 1])
-                if is_number(linesp[i + 1])
-                else linesp[i + 1]
-                for i in range(0, len(linesp), 2)
+                name: float(record[name])
+                for name in RAD_DTYPE.names
+                if name not in ("time", "source")
             }
-            cur_dict.update(temp_dict)
-        elif linesp[0] == "Spectrum":
-            cur_dict["integrations"] = float(linesp[1])
-        elif is_number(linesp[0]):
-            cur_dict["spectrum"] = np.array(linesp).astype(float)
-            tstp = cur_dict["DATE"].timestamp()
-            del cur_dict["DATE"]
-            outdict[int(tstp)] = cur_dict
+            source = str(record["source"])
+            cur_dict["source"] = float(source) if is_number(source) else source
+            cur_dict["spectrum"] = spectrum
+            # Keys Were Made From the UTC Date Read as a Local Time
+            date = datetime.fromtimestamp(record["time"], timezone.utc)
+            outdict[int(date.replace(tzinfo=None).timestamp())] = cur_dict
     return outdict
 
 
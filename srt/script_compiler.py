@@ -0,0 +1,559 @@
+"""script_compiler.py
+
+Module for Parsing SRT Commands Into Typed Commands and Estimating How Long Scripts Take
+
+"""
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from math import ceil
+
+from .daemon.utilities.functions import angle_within_limits
+
+
+class CommandKind(Enum):
+    """
+    Enum Class for the Different Kinds of SRT Commands
+    """
+
+    POINT = "point"
+    NPOINT = "npoint"
+    BEAMSWITCH = "beamswitch"
+    STOW = "stow"
+    CAL = "cal"
+    CALIBRATE = "calibrate"
+    QUIT = "quit"
+    RECORD = "record"
+    ROFF = "roff"
+    FREQ = "freq"
+    SAMP = "samp"
+    COORDS = "coords"
+    OBJECT = "object"
+    OBJ_COORDS = "obj_coords"
+    AZEL = "azel"
+    OFFSET = "offset"
+    CLEAR = "clear"
+    WAIT = "wait"
+    WAIT_UNTIL_TIME = "wait_until_time"
+    WAIT_UNTIL_DATE = "wait_until_date"
+
+
+# Command Names With Fixed Numbers of Float Parameters
+float_commands = {
+    "freq": (CommandKind.FREQ, 1),
+    "samp": (CommandKind.SAMP, 1),
+    "coords": (CommandKind.COORDS, 2),
+    "obj_coords": (CommandKind.OBJ_COORDS, 2),
+    "azel": (CommandKind.AZEL, 2),
+    "offset": (CommandKind.OFFSET, 2),
+    "wait": (CommandKind.WAIT, 1),
+}
+# Command Names Without Parameters
+plain_commands = {
+    "stow": CommandKind.STOW,
+    "cal": CommandKind.CAL,
+    "calibrate": CommandKind.CALIBRATE,
+    "quit": CommandKind.QUIT,
+    "roff": CommandKind.ROFF,
+    "clear": CommandKind.CLEAR,
+}
+
+
+class ScriptCommand:
+    """
+    One Parsed SRT Command, With its Kind and Converted Parameters
+    """
+
+    def __init__(self, kind, args=(), text="", line_number=None):
+        """Initializer for ScriptCommand
+
+        Parameters
+        ----------
+        kind : CommandKind
+            Kind of Command
+        args : tuple
+            Parameters, Converted to float Where Numeric
+        text : str
+            Command as Written, Without Any Leading ':'
+        line_number : int
+            Line of the Script the Command Came From, if Any
+        """
+        self.kind = kind
+        self.args = tuple(args)
+        self.text = text
+        self.line_number = line_number
+
+    def __repr__(self):
+        return f"ScriptCommand({self.kind.name}, {self.args}, line={self.line_number})"
+
+
+def parse_command(command, object_names=None, line_number=None):
+    """Parses One Command, Using the Same Rules as the Daemon Always Has
+
+    Parameters
+    ----------
+    command : str
+        Command Text
+    object_names : iterable(str)
+        Names of Objects That Can be Pointed At, or None to Accept Any Other Word
+    line_number : int
+        Line of the Script the Command Came From, if Any
+
+    Returns
+    -------
+    ScriptCommand or None
+        Parsed Command, Whose Text Keeps Any Urgent '!' Prefix, or None for
+        Comments and Blank Lines
+
+    Raises
+    ------
+    ValueError
+        If the Command is Not Recognised or its Parameters are Invalid
+    """
+    command = command.strip()
+    # An Urgent '!' Prefix Only Changes Where the Daemon Queues the Command
+    urgent = command.startswith("!")
+    if urgent:
+        command = command[1:].strip()
+    if len(command) < 2 or command[0] == "*":
+        return None
+    elif command[0] == ":":
+        command = command[1:].strip()
+    command_parts = command.split()
+    if not command_parts:
+        return None
+    command_name = command_parts[0].lower()
+    text = f"!{command}" if urgent else command
+    location = "" if line_number is None else f"Line {line_number}: "
+
+    if object_names is not None and command_parts[0] in object_names:
+        kind = {"n": CommandKind.NPOINT, "b": CommandKind.BEAMSWITCH}.get(
+            command_parts[-1] if len(command_parts) > 1 else None, CommandKind.POINT
+        )
+        return ScriptCommand(kind, (command_parts[0],), text, line_number)
+    if command_name in plain_commands:
+        return ScriptCommand(plain_commands[command_name], (), text, line_number)
+    if command_name == "record":
+        name = None if len(command_parts) <= 1 else command_parts[1]
+        return ScriptCommand(CommandKind.RECORD, (name,), text, line_number)
+    if command_name == "object":
+        return ScriptCommand(
+            CommandKind.OBJECT, (command_parts[-1],), text, line_number
+        )
+    if command_name in float_commands:
+        kind, num_args = float_commands[command_name]
+        if len(command_parts) <= num_args:
+            raise ValueError(
+                f"{location}'{command_name}' Needs {num_args} Parameter(s): '{command}'"
+            )
+        try:
+            args = tuple(float(part) for part in command_parts[1 : num_args + 1])
+        except ValueError:
+            raise ValueError(f"{location}Parameters Must be Numbers: '{command}'")
+        return ScriptCommand(kind, args, text, line_number)
+    if command_name.isnumeric():  # A Number is a Wait of that Many Seconds
+        return ScriptCommand(
+            CommandKind.WAIT, (float(command_name),), text, line_number
+        )
+    if command_name.split(":")[0] == "lst":  # Wait Until Next Time H:M:S
+        time_string = command_name[len("lst:") :]
+        try:
+            datetime.strptime(time_string, "%H:%M:%S")
+        except ValueError:
+            raise ValueError(f"{location}Time Must be LST:hh:mm:ss: '{command}'")
+        return ScriptCommand(
+            CommandKind.WAIT_UNTIL_TIME, (time_string,), text, line_number
+        )
+    if len(command_name.split(":")) == 5:  # Wait Until Y:D:H:M:S
+        try:
+            datetime.strptime(command_name, "%Y:%j:%H:%M:%S")
+        except ValueError:
+            raise ValueError(f"{location}Date Must be Y:D:H:M:S: '{command}'")
+        return ScriptCommand(
+            CommandKind.WAIT_UNTIL_DATE, (command_name,), text, line_number
+        )
+    if object_names is None:
+        # Without a Catalog, Any Other Word is Taken as an Object Name
+        kind = {"n": CommandKind.NPOINT, "b": CommandKind.BEAMSWITCH}.get(
+            command_parts[-1] if len(command_parts) > 1 else None, CommandKind.POINT
+        )
+        return ScriptCommand(kind, (command_parts[0],), text, line_number)
+    raise ValueError(f"{location}Command Not Identified '{command}'")
+
+
+def compile_script(lines, object_names=None):
+    """Parses Every Line of a Command File, Collecting All Errors at Once
+
+    Parameters
+    ----------
+    lines : iterable(str)
+        Lines of the Command File
+    object_names : iterable(str)
+        Names of Objects That Can be Pointed At, or None to Accept Any Other Word
+
+    Returns
+    -------
+    (list(ScriptCommand), list(str))
+        Parsed Commands and the Error Message of Each Invalid Line
+    """
+    commands = []
+    errors = []
+    if object_names is not None:
+        object_names = set(object_names)
+    for line_number, line in enumerate(lines, start=1):
+        try:
+            command = parse_command(line, object_names, line_number)
+        except ValueError as e:
+            errors.append(str(e))
+            continue
+        if command is not None:
+            commands.append(command)
+    return commands, errors
+
+
+def seconds_until_time_of_day(time_string, now):
+    """Seconds Until the Next Occurrence of a UTC Time of Day
+
+    Parameters
+    ----------
+    time_string : str
+        UTC Time of Day, 'hh:mm:ss'
+    now : float
+        Current Unix Time
+
+    Returns
+    -------
+    float
+        Seconds From now Until the Time, Which is Tomorrow if it has Passed Today
+    """
+    hour, minute, second = (int(val) for val in time_string.split(":"))
+    current = datetime.fromtimestamp(now, timezone.utc)
+    target = current.replace(hour=hour, minute=minute, second=second, microsecond=0)
+    if target < current:
+        target += timedelta(days=1)
+    return (target - current).total_seconds()
+
+
+def seconds_until_date(date_string, now):
+    """Seconds Until a UTC Date, Negative if it has Passed
+
+    Parameters
+    ----------
+    date_string : str
+        UTC Date, 'Year:DayOfYear:hh:mm:ss'
+    now : float
+        Current Unix Time
+
+    Returns
+    -------
+    float
+        Seconds From now Until the Date
+    """
+    target = datetime.strptime(date_string, "%Y:%j:%H:%M:%S")
+    return target.replace(tzinfo=timezone.utc).timestamp() - now
+
+
+class PlanStep:
+    """
+    Predicted Timing and Pointing of One Command of a Script
+    """
+
+    def __init__(self, command, start, slew=0.0, settle=0.0, integration=0.0, wait=0.0):
+        """Initializer for PlanStep
+
+        Parameters
+        ----------
+        command : ScriptCommand
+            Command the Step Runs
+        start : float
+            Predicted Unix Time the Command Starts
+        slew : float
+            Predicted Seconds Spent Slewing
+        settle : float
+            Predicted Seconds Spent Settling After Slews
+        integration : float
+            Predicted Seconds Spent Integrating Spectra
+        wait : float
+            Predicted Seconds Spent Waiting
+        """
+        self.command = command
+        self.start = start
+        self.slew = slew
+        self.settle = settle
+        self.integration = integration
+        self.wait = wait
+        self.azel = None
+        self.warnings = []
+
+    @property
+    def duration(self):
+        """Predicted Seconds the Command Takes"""
+        return self.slew + self.settle + self.integration + self.wait
+
+    @property
+    def end(self):
+        """Predicted Unix Time the Command Ends"""
+        return self.start + self.duration
+
+
+class PlanEstimator:
+    """
+    Predicts When Each Command of a Script Runs, Where the Antenna Points and Whether
+    Every Position is Within the Motor Limits
+    """
+
+    def __init__(
+        self,
+        config_dict,
+        locate=None,
+        slew_rate=1.0,
+        slew_model=None,
+    ):
+        """Initializer for PlanEstimator
+
+        Parameters
+        ----------
+        config_dict : dict
+            Configuration Dictionary (Output of YAML Parser)
+        locate : callable
+            Gives the (az, el) of an Object Name at a Unix Time, or None if Unknown
+        slew_rate : float
+            Degrees per Second Each Axis Moves, Both Axes Moving Together
+        slew_model : SlewModel
+            Model Learned From the Motor's Moves, Used Instead of slew_rate Once
+            Both Axes Have Been Fitted
+        """
+        self.locate = locate
+        self.slew_rate = slew_rate
+        self.slew_model = slew_model
+        self.az_limits = (
+            config_dict["AZLIMITS"]["lower_bound"],
+            config_dict["AZLIMITS"]["upper_bound"],
+        )
+        self.el_limits = (
+            config_dict["ELLIMITS"]["lower_bound"],
+            config_dict["ELLIMITS"]["upper_bound"],
+        )
+        self.stow_location = (
+            config_dict["STOW_LOCATION"]["azimuth"],
+            config_dict["STOW_LOCATION"]["elevation"],
+        )
+        self.cal_location = (
+            config_dict["CAL_LOCATION"]["azimuth"],
+            config_dict["CAL_LOCATION"]["elevation"],
+        )
+        self.num_bins = config_dict["RADIO_NUM_BINS"]
+        self.integ_cycles = config_dict["RADIO_INTEG_CYCLES"]
+        self.samp_rate = config_dict["RADIO_SF"]
+        self.num_beamswitches = config_dict["NUM_BEAMSWITCHES"]
+        self.beamwidth = config_dict["BEAMWIDTH"]
+        if "SCAN_DWELL" in config_dict:
+            self.scan_dwell = config_dict["SCAN_DWELL"]
+        else:
+            self.scan_dwell = 0.0
+        if "SCAN_SETTLE" in config_dict:
+            self.scan_settle = config_dict["SCAN_SETTLE"]
+        else:
+            self.scan_settle = 0.5
+
+    def slew_time(self, start_azel, end_azel):
+        """Predicted Seconds to Slew Between Two Positions
+
+        Parameters
+        ----------
+        start_azel : (float, float)
+            Starting Azimuth and Elevation
+        end_azel : (float, float)
+            Final Azimuth and Elevation
+
+        Returns
+        -------
+        float
+        """
+        if self.slew_model is not None:
+            predicted = self.slew_model.predict(start_azel, end_azel)
+            if predicted is not None:
+                return predicted
+        return (
+            max(abs(end_azel[0] - start_azel[0]), abs(end_azel[1] - start_azel[1]))
+            / self.slew_rate
+        )
+
+    def within_limits(self, azel):
+        """Whether a Position is Within the AZLIMITS and ELLIMITS
+
+        Parameters
+        ----------
+        azel : (float, float)
+            Azimuth and Elevation
+
+        Returns
+        -------
+        bool
+        """
+        return angle_within_limits(azel[0], self.az_limits) and angle_within_limits(
+            azel[1], self.el_limits
+        )
+
+    def measure_time(self):
+        """Predicted Seconds to Take the Spectra of One Scan Point
+
+        The first spectrum after settling is usually only partly settled, so one
+        more integration than the dwell needs is counted.
+
+        Returns
+        -------
+        float
+        """
+        integration_time = self.num_bins * self.integ_cycles / self.samp_rate
+        needed_count = max(int(ceil(self.scan_dwell / integration_time)), 1)
+        return (needed_count + 1) * integration_time
+
+    def estimate(self, commands, start_time, start_azel=None):
+        """Predicts the Timing and Pointing of Each Command in Turn
+
+        Parameters
+        ----------
+        commands : list(ScriptCommand)
+            Commands of the Script
+        start_time : float
+            Unix Time the Script Starts
+        start_azel : (float, float)
+            Antenna Position When the Script Starts, Defaulting to Stow
+
+        Returns
+        -------
+        list(PlanStep)
+            One Step per Command, With Any Warnings
+        """
+        current_time = start_time
+        azel = tuple(start_azel) if start_azel is not None else self.stow_location
+        tracking = None
+        steps = []
+        for command in commands:
+            step = PlanStep(command, current_time)
+            kind = command.kind
+            if kind in (CommandKind.POINT, CommandKind.NPOINT, CommandKind.BEAMSWITCH):
+                target = self.locate_object(command.args[0], current_time, step)
+                if target is not None:
+                    step.slew = self.slew_time(azel, target)
+                    step.settle = self.scan_settle
+                    azel = target
+                    if kind == CommandKind.NPOINT:
+                        self.add_scan(step, 25, self.beamwidth * 0.5)
+                    elif kind == CommandKind.BEAMSWITCH:
+                        self.add_scan(step, 3 * self.num_beamswitches, self.beamwidth)
+                    tracking = command.args[0]
+            elif kind == CommandKind.OBJ_COORDS:
+                # Tells the Daemon Where the Antenna is, Without Moving it
+                azel = command.args
+                tracking = None
+            elif kind in (
+                CommandKind.STOW,
+                CommandKind.CAL,
+                CommandKind.AZEL,
+                CommandKind.OFFSET,
+            ):
+                if kind == CommandKind.STOW:
+                    target = self.stow_location
+                elif kind == CommandKind.CAL:
+                    target = self.cal_location
+                elif kind == CommandKind.OFFSET:
+                    target = (azel[0] + command.args[0], azel[1] + command.args[1])
+                else:
+                    target = command.args
+                if kind != CommandKind.OFFSET:
+                    tracking = None
+                if self.within_limits(target):
+                    step.slew = self.slew_time(azel, target)
+                    step.settle = self.scan_settle
+                    azel = tuple(target)
+                else:
+                    step.warnings.append(f"Position {tuple(target)} Out of Bounds")
+            elif kind == CommandKind.CALIBRATE:
+                step.integration = 2 * self.num_bins * self.integ_cycles / self.samp_rate
+            elif kind == CommandKind.SAMP:
+                self.samp_rate = command.args[0] * pow(10, 6)
+            elif kind == CommandKind.WAIT:
+                step.wait = max(command.args[0], 0.0)
+            elif kind == CommandKind.WAIT_UNTIL_TIME:
+                step.wait = seconds_until_time_of_day(command.args[0], current_time)
+            elif kind == CommandKind.WAIT_UNTIL_DATE:
+                step.wait = seconds_until_date(command.args[0], current_time)
+                if step.wait < 0:
+                    step.warnings.append("Date Has Already Passed When Reached")
+                    step.wait = 0.0
+            elif kind == CommandKind.QUIT:
+                if command is not commands[-1]:
+                    step.warnings.append("Commands After 'quit' Never Run")
+                step.azel = azel
+                steps.append(step)
+                break
+            current_time = step.end
+            if tracking is not None and self.locate is not None:
+                # The Antenna Follows the Object Until the Next Pointing Command
+                end_azel = self.locate(tracking, current_time)
+                if end_azel is not None:
+                    azel = end_azel
+                    if not self.within_limits(azel):
+                        end = datetime.fromtimestamp(current_time, timezone.utc)
+                        step.warnings.append(
+                            f"{tracking} Leaves the Motor Bounds by {end:%H:%M:%S} UTC"
+                        )
+            step.azel = azel
+            steps.append(step)
+        return steps
+
+    def locate_object(self, name, unix_time, step):
+        """Gets an Object's Position, Adding a Warning to the Step if Unusable"""
+        if self.locate is None:
+            step.warnings.append(f"Position of {name} Unknown, Slew Not Estimated")
+            return None
+        azel = self.locate(name, unix_time)
+        if azel is None:
+            step.warnings.append(f"Position of {name} Unknown, Slew Not Estimated")
+            return None
+        if not self.within_limits(azel):
+            step.warnings.append(f"{name} at {tuple(azel)} Not in Motor Bounds")
+            return None
+        return tuple(azel)
+
+    def add_scan(self, step, num_points, spacing):
+        """Adds the Time of a Scan's Points, Each a Short Slew, a Settle and a Measurement"""
+        step.slew += num_points * spacing / self.slew_rate
+        step.settle += num_points * self.scan_settle
+        step.integration += num_points * self.measure_time()
+
+
+def ephemeris_locator(tracker, cadence=60.0):
+    """Builds a locate Function for PlanEstimator From an EphemerisTracker
+
+    Parameters
+    ----------
+    tracker : EphemerisTracker
+        Tracker for the Station and Catalog
+    cadence : float
+        Seconds Positions are Rounded to, so Nearby Times Share One Calculation
+
+    Returns
+    -------
+    callable
+        Gives the (az, el) of an Object Name at a Unix Time, or None if Unknown
+    """
+    from astropy.time import Time
+
+    positions = {}
+
+    def locate(name, unix_time):
+        if name not in tracker.object_names:
+            return None
+        rounded_time = round(unix_time / cadence) * cadence
+        if rounded_time not in positions:
+            az, el, _ = tracker.calculate_all_az_el_vlsr(
+                Time([rounded_time], format="unix")
+            )
+            positions[rounded_time] = (az[:, 0], el[:, 0])
+        az, el = positions[rounded_time]
+        index = tracker.object_names.index(name)
+        return float(az[index]), float(el[index])
+
+    return locate
@@ -0,0 +1,291 @@
+"""source_planner.py
+
+Module for Ordering a List of Sources to Observe so as Little Time as Possible is Spent
+Slewing
+
+"""
+import numpy as np
+
+from datetime import datetime, timezone
+from math import ceil, floor
+
+
+def horizon_elevation(horizon_points, az):
+    """Interpolates the Horizon Mask's Minimum Elevation at Azimuths
+
+    Parameters
+    ----------
+    horizon_points : list((float, float))
+        Azimuth and Elevation Points of the Horizon Mask (HORIZON_POINTS)
+    az : float or ndarray
+        Azimuths in Degrees
+
+    Returns
+    -------
+    float or ndarray
+        Lowest Visible Elevation at Each Azimuth
+    """
+    if not horizon_points:
+        return np.zeros_like(az, dtype=float)
+    points = np.array(sorted(horizon_points), dtype=float)
+    return np.interp(np.mod(az, 360.0), points[:, 0], points[:, 1], period=360.0)
+
+
+class SourcePlanner:
+    """
+    Orders Sources by a Time-Dependent Travelling Salesman Heuristic
+
+    Source positions move during the night, so the cost of each slew depends on
+    when it happens.  A tour is built by always going to the source that can be
+    observed soonest, then improved by 2-opt moves, each checked by simulating the
+    whole night again: more sources observed always wins, then less slewing.
+    """
+
+    def __init__(
+        self,
+        names,
+        start_time,
+        cadence,
+        az_table,
+        el_table,
+        estimator,
+        horizon_points,
+        dwell,
+    ):
+        """Initializer for SourcePlanner
+
+        Parameters
+        ----------
+        names : list(str)
+            Source Names
+        start_time : float
+            Unix Time of the First Column of the Position Tables, and Start of the Window
+        cadence : float
+            Seconds Between Columns of the Position Tables
+        az_table : (S, T) ndarray
+            Azimuth of Each Source at Each Time, in Degrees
+        el_table : (S, T) ndarray
+            Elevation of Each Source at Each Time, in Degrees
+        estimator : PlanEstimator
+            Gives Slew Times and the Motor Limits
+        horizon_points : list((float, float))
+            Azimuth and Elevation Points of the Horizon Mask (HORIZON_POINTS)
+        dwell : float
+            Seconds Spent Observing Each Source
+        """
+        self.names = list(names)
+        self.start_time = start_time
+        self.cadence = cadence
+        # Unwrapped so Azimuths Interpolate Smoothly Across North
+        self.az_table = np.rad2deg(np.unwrap(np.deg2rad(az_table)))
+        self.el_table = np.asarray(el_table, dtype=float)
+        self.estimator = estimator
+        self.dwell = dwell
+        self.end_time = start_time + cadence * (self.el_table.shape[1] - 1)
+
+        az = np.mod(self.az_table, 360.0)
+        visible = self.el_table >= horizon_elevation(horizon_points, az)
+        visible &= np.vectorize(
+            lambda a, e: estimator.within_limits((a, e)), otypes=[bool]
+        )(az, self.el_table)
+        # A Source Can be Started at a Sample if it is Visible Through the Dwell
+        span = int(ceil(dwell / cadence))
+        num_times = visible.shape[1]
+        self.startable = np.zeros_like(visible)
+        for start in range(num_times - span):
+            self.startable[:, start] = visible[:, start : start + span + 1].all(axis=1)
+        # Index of the First Startable Sample at or After Each Sample (num_times if None)
+        self.next_start = np.full(visible.shape, num_times)
+        for index in range(num_times - 2, -1, -1):
+            self.next_start[:, index] = np.where(
+                self.startable[:, index], index, self.next_start[:, index + 1]
+            )
+
+    def position(self, source, unix_time):
+        """Interpolates a Source's Position
+
+        Parameters
+        ----------
+        source : int
+            Index of the Source
+        unix_time : float
+            Unix Time
+
+        Returns
+        -------
+        (float, float)
+            Azimuth and Elevation in Degrees
+        """
+        sample = (unix_time - self.start_time) / self.cadence
+        samples = np.arange(self.el_table.shape[1])
+        az = np.interp(sample, samples, self.az_table[source])
+        el = np.interp(sample, samples, self.el_table[source])
+        return float(np.mod(az, 360.0)), float(el)
+
+    def earliest_start(self, source, unix_time):
+        """Finds the Earliest Time at or After unix_time a Source Can be Observed
+
+        Parameters
+        ----------
+        source : int
+            Index of the Source
+        unix_time : float
+            Unix Time the Antenna Could Start
+
+        Returns
+        -------
+        float or None
+            Unix Time the Observation Can Start, or None if Not in the Window
+        """
+        sample = (unix_time - self.start_time) / self.cadence
+        num_times = self.el_table.shape[1]
+        before = max(int(floor(sample)), 0)
+        after = int(ceil(sample))
+        if after >= num_times:
+            return None
+        if self.startable[source, before] and self.startable[source, after]:
+            return unix_time
+        index = self.next_start[source, after]
+        if index >= num_times:
+            return None
+        return max(unix_time, self.start_time + index * self.cadence)
+
+    def simulate(self, order, start_azel):
+        """Runs Through Sources in Order, Skipping Any That Can't be Observed in Time
+
+        Parameters
+        ----------
+        order : list(int)
+            Source Indices in the Order to Visit
+        start_azel : (float, float)
+            Antenna Position at the Start of the Window
+
+        Returns
+        -------
+        (list((int, float, float)), float)
+            (Source, Arrival Time, Observation Start Time) of Each Observed Source,
+            and the Total Seconds Spent Slewing
+        """
+        current_time = self.start_time
+        azel = start_azel
+        schedule = []
+        total_slew = 0.0
+        for source in order:
+            slew = self.estimator.slew_time(azel, self.position(source, current_time))
+            # Slewing Toward a Moving Source Takes a Little Longer
+            slew = self.estimator.slew_time(
+                azel, self.position(source, current_time + slew)
+            )
+            start = self.earliest_start(source, current_time + slew)
+            if start is None:
+                continue
+            schedule.append((source, current_time + slew, start))
+            total_slew += slew
+            current_time = start + self.dwell
+            azel = self.position(source, current_time)
+        return schedule, total_slew
+
+    def plan(self, start_azel, max_passes=20):
+        """Orders the Sources to Observe as Many as Possible With the Least Slewing
+
+        Parameters
+        ----------
+        start_azel : (float, float)
+            Antenna Position at the Start of the Window
+        max_passes : int
+            Maximum Number of Passes of 2-opt Improvement
+
+        Returns
+        -------
+        (list((int, float, float)), float)
+            Schedule and Total Slew Seconds, as From simulate
+        """
+        # Time-Dependent Nearest Neighbour, by When Each Source Could Start
+        order = []
+        remaining = set(range(len(self.names)))
+        current_time = self.start_time
+        azel = start_azel
+        while remaining:
+            best = None
+            for source in remaining:
+                slew = self.estimator.slew_time(
+                    azel, self.position(source, current_time)
+                )
+                start = self.earliest_start(source, current_time + slew)
+                if start is not None and (best is None or (start, slew) < best[:2]):
+                    best = (start, slew, source)
+            if best is None:
+                break
+            start, _, source = best
+            order.append(source)
+            remaining.remove(source)
+            current_time = start + self.dwell
+            azel = self.position(source, current_time)
+        # Unreachable Sources Stay at the End, so 2-opt Can Still Try to Fit Them
+        order += sorted(remaining)
+
+        schedule, total_slew = self.simulate(order, start_azel)
+        best_score = (-len(schedule), total_slew)
+        for _ in range(max_passes):
+            improved = False
+            for i in range(len(order) - 1):
+                for j in range(i + 1, len(order)):
+                    candidate = order[:i] + order[i : j + 1][::-1] + order[j + 1 :]
+                    candidate_schedule, candidate_slew = self.simulate(
+                        candidate, start_azel
+                    )
+                    score = (-len(candidate_schedule), candidate_slew)
+                    if score < best_score:
+                        order, schedule, total_slew = (
+                            candidate,
+                            candidate_schedule,
+                            candidate_slew,
+                        )
+                        best_score = score
+                        improved = True
+            if not improved:
+                break
+        return schedule, total_slew
+
+    def command_lines(self, schedule, record_format=None, min_wait=60.0):
+        """Writes a Schedule as Command File Lines
+
+        Parameters
+        ----------
+        schedule : list((int, float, float))
+            Schedule From plan
+        record_format : str
+            Format of Each Recording's File Name, With {name} for the Source, or
+            None to Not Record
+        min_wait : float
+            Shortest Gap Before a Source Rises That is Written as a Timed Wait
+
+        Returns
+        -------
+        list(str)
+            Command File Lines, Ending With 'stow'
+        """
+        lines = []
+        previous_end = self.start_time
+        for source, arrival, start in schedule:
+            name = self.names[source]
+            if start - arrival >= min_wait:
+                # Leave Early Enough to be on the Source When it Can be Observed,
+                # but Not Before the Daemon Will Accept Pointing at it
+                departure = start - (arrival - previous_end)
+                while departure < start and not self.estimator.within_limits(
+                    self.position(source, departure)
+                ):
+                    departure = min(departure + self.cadence, start)
+                departure_date = datetime.fromtimestamp(departure, timezone.utc)
+                lines.append(f"* Waiting for {name} to Rise")
+                lines.append(f"{departure_date:%Y:%j:%H:%M:%S}")
+            lines.append(name)
+            if record_format is not None:
+                lines.append(f"record {record_format.format(name=name)}")
+            lines.append(f"wait {self.dwell:g}")
+            if record_format is not None:
+                lines.append("roff")
+            previous_end = start + self.dwell
+        lines.append("stow")
+        return lines
@@ -0,0 +1,209 @@
+"""status_protocol.py
+
+Module for Encoding, Building and Applying the Versioned Status Messages of the Daemon
+
+The daemon publishes three kinds of messages on the status port:
+
+- snapshot: {"type", "version", "time", "status"}, the full status dictionary
+- delta: {"type", "version", "time", "changes", "removed"}, only the changed fields
+- heartbeat: {"type", "version", "time"}, sent while nothing has changed
+
+A snapshot is published whenever a new subscriber connects, and can also be
+requested from the status query port by sending {"request": "snapshot"}.
+
+"""
+import json
+
+try:
+    import msgpack
+except ModuleNotFoundError:
+    msgpack = None
+
+STATUS_PORT = 5555
+STATUS_QUERY_PORT = 5564
+
+SNAPSHOT = "snapshot"
+DELTA = "delta"
+HEARTBEAT = "heartbeat"
+
+
+def encode_message(message):
+    """Encodes a Message with msgpack, or JSON if msgpack is not Installed
+
+    Parameters
+    ----------
+    message : dict
+        JSON Compatible Message
+
+    Returns
+    -------
+    bytes
+        Encoded Message
+    """
+    if msgpack is not None:
+        return msgpack.packb(message, use_bin_type=True)
+    return json.dumps(message).encode()
+
+
+def decode_message(payload):
+    """Decodes a Message Encoded by encode_message
+
+    JSON payloads always start with a '{', which a msgpack map never does, so both
+    encodings can be told apart without any extra framing.
+
+    Parameters
+    ----------
+    payload : bytes
+        Encoded Message
+
+    Returns
+    -------
+    dict
+        Decoded Message
+    """
+    if payload[:1] == b"{":
+        return json.loads(payload)
+    if msgpack is None:
+        raise ValueError("Message is msgpack Encoded but msgpack is not Installed")
+    return msgpack.unpackb(payload, raw=False)
+
+
+class StatusPublisherState:
+    """
+    Keeps the Last Published Status and Builds Snapshot, Delta and Heartbeat Messages
+    """
+
+    def __init__(self):
+        """Initializer for StatusPublisherState"""
+        self.version = 0
+        self.status = {}
+        self.encoded_fields = {}
+
+    def update(self, status, current_time):
+        """Records a New Status and Builds a Delta of the Fields that Changed
+
+        Fields are compared by their encoding, so lists mutated in place are still
+        detected as changed.
+
+        Parameters
+        ----------
+        status : dict
+            Complete Status Dictionary
+        current_time : float
+            Unix Time of the Status
+
+        Returns
+        -------
+        dict or None
+            Delta Message, or None if Nothing Changed
+        """
+        changes = {}
+        for key, value in status.items():
+            encoded = encode_message(value)
+            if self.encoded_fields.get(key) != encoded:
+                self.encoded_fields[key] = encoded
+                changes[key] = value
+        removed = [key for key in self.status if key not in status]
+        for key in removed:
+            del self.encoded_fields[key]
+        self.status = status
+        if not changes and not removed:
+            return None
+        self.version += 1
+        return {
+            "type": DELTA,
+            "version": self.version,
+            "time": current_time,
+            "changes": changes,
+            "removed": removed,
+        }
+
+    def snapshot(self, current_time):
+        """Builds a Snapshot Message of the Last Recorded Status
+
+        Parameters
+        ----------
+        current_time : float
+            Unix Time of the Message
+
+        Returns
+        -------
+        dict
+            Snapshot Message
+        """
+        return {
+            "type": SNAPSHOT,
+            "version": self.version,
+            "time": current_time,
+            "status": self.status,
+        }
+
+    def heartbeat(self, current_time):
+        """Builds a Heartbeat Message
+
+        Parameters
+        ----------
+        current_time : float
+            Unix Time of the Message
+
+        Returns
+        -------
+        dict
+            Heartbeat Message
+        """
+        return {"type": HEARTBEAT, "version": self.version, "time": current_time}
+
+
+class StatusReceiverState:
+    """
+    Applies Snapshot, Delta and Heartbeat Messages to a Local Copy of the Status
+    """
+
+    def __init__(self):
+        """Initializer for StatusReceiverState"""
+        self.version = None
+        self.status = None
+
+    def apply(self, message):
+        """Applies a Message to the Local Status
+
+        A new dictionary is built for every message, so a status handed out earlier
+        is never modified from another thread.  The message time is stored under the
+        "time" key of the status.
+
+        Parameters
+        ----------
+        message : dict
+            Decoded Status Message
+
+        Returns
+        -------
+        bool
+            False if the Message Could not be Applied and a Snapshot is Needed
+        """
+        if message["type"] == SNAPSHOT:
+            status = dict(message["status"])
+        elif self.version is None:
+            return False
+        elif message["version"] < self.version or (
+            message["type"] == DELTA and message["version"] == self.version
+        ):
+            # Already Included in a Snapshot That Overtook This Message
+            return True
+        elif message["type"] == DELTA:
+            if message["version"] != self.version + 1:
+                return False
+            status = dict(self.status)
+            status.update(message["changes"])
+            for key in message["removed"]:
+                status.pop(key, None)
+        elif message["type"] == HEARTBEAT:
+            if message["version"] != self.version:
+                return False
+            status = dict(self.status)
+        else:
+            return True
+        status["time"] = message["time"]
+        self.status = status
+        self.version = message["version"]
+        return True